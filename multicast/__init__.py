@@ -58,13 +58,27 @@
 	"""_MCAST_DEFAULT_PORT""",
 	"""_MCAST_DEFAULT_GROUP""",
 	"""_MCAST_DEFAULT_TTL""",
+	"""_MCAST_DEFAULT_TUNING""",
+	"""_MCAST_DEFAULT_SOURCES""",
+	"""_MCAST_DEFAULT_BLOCKED_SOURCES""",
 	"""mtool""",
 	"""recv""",
 	"""send""",
 	"""hear""",
+	"""recv.BufferPool""",  # skipcq: PYL-E0603 -- imports ok
 	"""recv.McastRECV""",  # skipcq: PYL-E0603 -- imports ok
+	"""recv.iter_datagrams""",  # skipcq: PYL-E0603 -- imports ok
 	"""send.McastSAY""",  # skipcq: PYL-E0603 -- imports ok
+	"""send.McastSender""",  # skipcq: PYL-E0603 -- imports ok
 	"""hear.McastHEAR""",  # skipcq: PYL-E0603 -- imports ok
+	"""aio""",
+	"""aio.create_multicast_endpoint""",  # skipcq: PYL-E0603 -- imports ok
+	"""aio.AsyncMcastServer""",  # skipcq: PYL-E0603 -- imports ok
+	"""aio.AsyncMcastSender""",  # skipcq: PYL-E0603 -- imports ok
+	"""ring""",
+	"""ring.McastRing""",  # skipcq: PYL-E0603 -- imports ok
+	"""ring.RingReader""",  # skipcq: PYL-E0603 -- imports ok
+	"""ring.RingFanout""",  # skipcq: PYL-E0603 -- imports ok
 ]
 
 __path__ = [__file__[0:-12]]
@@ -290,6 +304,9 @@
 	_MCAST_DEFAULT_PORT (int): Default port for multicast communication (59259).
 	_MCAST_DEFAULT_GROUP (str): Default multicast group address ('224.0.0.1').
 	_MCAST_DEFAULT_TTL (int): Default TTL for multicast packets (1).
+	_MCAST_DEFAULT_TUNING (dict): Default socket tuning knobs (none).
+	_MCAST_DEFAULT_SOURCES (list): Default senders to exclusively receive from (any).
+	_MCAST_DEFAULT_BLOCKED_SOURCES (list): Default senders to block (none).
 
 Dynamic Imports:
 	The sub-modules within "multicast" are interdependent, requiring access to each other's
@@ -334,6 +351,16 @@
 			multicast/hear.py-->socketserver;
 			multicast/hear.py-->warnings;
 			multicast/__init__.py-->multicast/hear.py;
+			multicast/aio.py-->sys;
+			multicast/aio.py-->multicast/__init__.py;
+			multicast/aio.py-->multicast/recv.py;
+			multicast/aio.py-->asyncio;
+			multicast/__init__.py-->multicast/aio.py;
+			multicast/ring.py-->sys;
+			multicast/ring.py-->multicast/__init__.py;
+			multicast/ring.py-->multicast/recv.py;
+			multicast/ring.py-->multiprocessing.shared_memory;
+			multicast/__init__.py-->multicast/ring.py;
 			multicast/__main__.py-->multicast/__init__.py;
 			multicast/__main__.py-->multicast/exceptions.py;
 			multicast/__main__.py-->multicast/recv.py;
@@ -569,6 +596,79 @@
 
 """
 
+global _MCAST_DEFAULT_TUNING  # skipcq: PYL-W0604
+
+_MCAST_DEFAULT_TUNING = {}
+"""Socket tuning applied to every socket from genSocket, as knob names and integer values.
+
+	Empty by default, so every knob is left at the kernel's default. See multicast.env.load_tuning
+	for the MULTICAST_PROFILE environment variable, and the per-knob overrides.
+
+	Minimal Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: Multicast should have a default tuning.
+		A: Test that the _MCAST_DEFAULT_TUNING attribute is initialized.
+		B: Test that the _MCAST_DEFAULT_TUNING attribute is a dict.
+
+		>>> multicast._MCAST_DEFAULT_TUNING is not None
+		True
+		>>> type(multicast._MCAST_DEFAULT_TUNING) is type({})
+		True
+		>>>
+
+"""
+
+global _MCAST_DEFAULT_SOURCES  # skipcq: PYL-W0604
+
+_MCAST_DEFAULT_SOURCES = []
+"""The only senders receivers accept, with source-specific joins (IP_ADD_SOURCE_MEMBERSHIP).
+
+	Empty by default, so datagrams from any sender are received. See multicast.env.load_sources
+	for the MULTICAST_SOURCES environment variable.
+
+	Minimal Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: Multicast should have default sources.
+
+		>>> type(multicast._MCAST_DEFAULT_SOURCES) is type([])
+		True
+		>>>
+
+"""
+
+global _MCAST_DEFAULT_BLOCKED_SOURCES  # skipcq: PYL-W0604
+
+_MCAST_DEFAULT_BLOCKED_SOURCES = []
+"""The senders receivers block in the kernel (IP_BLOCK_SOURCE), when not limited to sources.
+
+	Empty by default. See multicast.env.load_sources for the MULTICAST_BLOCKED_SOURCES environment
+	variable.
+
+	Minimal Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: Multicast should have default blocked sources.
+
+		>>> type(multicast._MCAST_DEFAULT_BLOCKED_SOURCES) is type([])
+		True
+		>>>
+
+"""
+
 global _BLANK  # skipcq: PYL-W0604
 
 _BLANK = str("""""")
@@ -676,6 +776,9 @@
 	_MCAST_DEFAULT_GROUP = _config["group"]
 	_MCAST_DEFAULT_TTL = _config["ttl"]
 	_MCAST_DEFAULT_BUFFER_SIZE = _config["buffer_size"]
+	_MCAST_DEFAULT_TUNING = _config["tuning"]
+	_MCAST_DEFAULT_SOURCES = _config["sources"]
+	_MCAST_DEFAULT_BLOCKED_SOURCES = _config["blocked_sources"]
 	global _MCAST_DEFAULT_BIND_IP  # skipcq: PYL-W0604
 	_MCAST_DEFAULT_BIND_IP = _config["bind_addr"]
 	global _MCAST_DEFAULT_GROUPS  # skipcq: PYL-W0604
@@ -1041,6 +1144,20 @@ def doStep(self, *args, **kwargs) -> tuple:  # pragma: no cover
 	global hear  # skipcq: PYL-W0604
 	hear = sys.modules["multicast.hear"]
 
+if "multicast.aio" not in sys.modules:
+	# pylint: disable=cyclic-import - skipcq: PYL-R0401, PYL-C0414
+	from . import aio  # pylint: disable=cyclic-import - skipcq: PYL-R0401, PYL-C0414
+else:  # pragma: no branch
+	global aio  # skipcq: PYL-W0604
+	aio = sys.modules["multicast.aio"]
+
+if "multicast.ring" not in sys.modules:
+	# pylint: disable=cyclic-import - skipcq: PYL-R0401, PYL-C0414
+	from . import ring  # pylint: disable=cyclic-import - skipcq: PYL-R0401, PYL-C0414
+else:  # pragma: no branch
+	global ring  # skipcq: PYL-W0604
+	ring = sys.modules["multicast.ring"]
+
 try:
 	if "multicast.__main__" in sys.modules:  # pragma: no cover
 		global __main__  # skipcq: PYL-W0604
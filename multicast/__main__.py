@@ -134,6 +134,7 @@
 
 try:
 	from . import sys
+	from . import argparse
 except ImportError as baton:
 	# Throw more relevant Error
 	raise ImportError("[CWE-440] Error Importing Python") from baton
@@ -159,6 +160,11 @@
 else:  # pragma: no branch
 	exceptions = sys.modules["multicast.exceptions"]
 
+if "multicast.env" not in sys.modules:
+	from . import env as env  # pylint: disable=useless-import-alias  -  skipcq: PYL-C0414
+else:  # pragma: no branch
+	env = sys.modules["multicast.env"]
+
 if "multicast.mtool" not in sys.modules:
 	from . import mtool as mtool  # skipcq: PYL-C0414
 else:  # pragma: no branch
@@ -334,6 +340,114 @@ def doStep(self, *args, **kwargs):
 		)
 
 
+def _source_address(value: str) -> str:
+	"""
+	Validate a sender address given on the command line.
+
+	This is a helper function and should NOT be called directly.
+
+	Arguments:
+		value (str) -- The sender address, as given to --sources or --block-sources.
+
+	Returns:
+		str: The sender address, if it is a unicast IPv4 address.
+
+	Raises:
+		argparse.ArgumentTypeError: If the address could never send multicast traffic.
+
+	Minimum Acceptance Testing:
+
+		Testcase 0: A unicast address is kept.
+
+			>>> import multicast.__main__
+			>>> multicast.__main__._source_address("192.0.2.1")
+			'192.0.2.1'
+			>>>
+
+		Testcase 1: A multicast address is rejected.
+
+			>>> multicast.__main__._source_address("224.0.0.1") #doctest: +ELLIPSIS
+			Traceback (most recent call last):
+			...
+			argparse.ArgumentTypeError: [CWE-20] Invalid source address: 224.0.0.1
+			>>>
+
+	"""
+	if not env.validate_source_address(value):
+		raise argparse.ArgumentTypeError(f"[CWE-20] Invalid source address: {value}")
+	return value
+
+
+def _rate(value: str) -> float:
+	"""
+	Validate a positive rate given on the command line.
+
+	This is a helper function and should NOT be called directly.
+
+	Arguments:
+		value (str) -- The rate, as given to --rate-limit.
+
+	Returns:
+		float: The rate.
+
+	Raises:
+		argparse.ArgumentTypeError: If the value is not a positive number.
+
+	Minimum Acceptance Testing:
+
+		Testcase 0: A positive rate is kept.
+
+			>>> import multicast.__main__
+			>>> multicast.__main__._rate("2.5")
+			2.5
+			>>>
+
+		Testcase 1: Zero, negative, and non-numeric rates are rejected.
+
+			>>> multicast.__main__._rate("-1") #doctest: +ELLIPSIS
+			Traceback (most recent call last):
+			...
+			argparse.ArgumentTypeError: [CWE-20] Invalid rate: -1
+			>>> multicast.__main__._rate("fast") #doctest: +ELLIPSIS
+			Traceback (most recent call last):
+			...
+			argparse.ArgumentTypeError: [CWE-20] Invalid rate: fast
+			>>>
+
+	"""
+	try:
+		rate = float(value)
+	except ValueError:
+		rate = None
+	if rate is None or not rate > 0:
+		raise argparse.ArgumentTypeError(f"[CWE-20] Invalid rate: {value}")
+	return rate
+
+
+def _rate_burst(value: str) -> float:
+	"""
+	Validate a rate burst given on the command line, which must be at least one datagram.
+
+	This is a helper function and should NOT be called directly.
+
+	Minimum Acceptance Testing:
+
+		>>> import multicast.__main__
+		>>> multicast.__main__._rate_burst("1")
+		1.0
+		>>> multicast.__main__._rate_burst("0.5") #doctest: +ELLIPSIS
+		Traceback (most recent call last):
+		...
+		argparse.ArgumentTypeError: [CWE-20] Invalid rate burst: 0.5
+		>>>
+
+	"""
+	burst = _rate(value)
+	if burst < 1:
+		raise argparse.ArgumentTypeError(f"[CWE-20] Invalid rate burst: {value}")
+	return burst
+
+
 class McastRecvHearDispatch(mtool):
 	"""
 	The `McastRecvHearDispatch` class handles receiving and dispatching multicast messages.
@@ -422,6 +536,12 @@ def setupArgs(cls, parser):
 			| --group   | multicast group (ip address) to bind-to for the udp socket |
 			| --groups  | multicast groups to join (should include the bind group)   |
 			| --port    | The UDP port number to listen/filter on for the udp socket |
+			| --workers | HEAR worker processes sharing the port (default is 1)      |
+			| --reply   | HEAR replies: none, per-message (default), or aggregated   |
+			| --control-port | HEAR binary control channel port on 127.0.0.1         |
+			| --sources | only receive from these senders (source-specific joins)    |
+			| --block-sources | block these senders in the kernel                     |
+			| --rate-limit | HEAR datagrams per second per sender (default unlimited) |
 
 		Testing:
 
@@ -529,6 +649,52 @@ def setupArgs(cls, parser):
 			__tmp_help += "to NOT join the multicast group you should instead use the sockets "
 			__tmp_help += "module directly, as this module does not support such a use-case."
 			parser.add_argument("--groups", default=[], nargs="*", help=__tmp_help)
+			__tmp_help = "handle received data as raw bytes, without text transcoding."
+			parser.add_argument("--binary", action="store_true", dest="binary", help=__tmp_help)
+			__tmp_help = "number of HEAR worker processes sharing the port (via SO_REUSEPORT); "
+			__tmp_help += "each multicast source is handled by exactly one of them. "
+			__tmp_help += "If unspecified, HEAR runs in one process. Ignored by RECV."
+			parser.add_argument("--workers", type=int, default=1, help=__tmp_help)
+			__tmp_help = "which echo replies HEAR sends: none, one per message (the default), "
+			__tmp_help += "or one aggregated acknowledgement per source every --reply-interval. "
+			__tmp_help += "Ignored by RECV."
+			parser.add_argument(
+				"--reply", dest="reply_policy", default="per-message",
+				choices=["none", "per-message", "aggregated"], help=__tmp_help,
+			)
+			__tmp_help = "seconds between the aggregated replies of HEAR (default is 1.0)."
+			parser.add_argument(
+				"--reply-interval", dest="reply_interval", type=float, default=1.0, help=__tmp_help,
+			)
+			__tmp_help = "UDP port on 127.0.0.1 for the binary control channel of HEAR (stop, stats, "
+			__tmp_help += "reload, pause, resume); when set, STOP payloads no longer stop HEAR. "
+			__tmp_help += "If unspecified, there is no control channel. Ignored by RECV, "
+			__tmp_help += "and with --workers."
+			parser.add_argument(
+				"--control-port", dest="control_port", type=int, default=None, help=__tmp_help,
+			)
+			__tmp_help = "only receive from these sender addresses, using source-specific joins, "
+			__tmp_help += "so the kernel discards the datagrams of every other sender. "
+			__tmp_help += "If unspecified, MULTICAST_SOURCES is used (any sender, if unset)."
+			parser.add_argument(
+				"--sources", default=None, nargs="*", type=_source_address, help=__tmp_help,
+			)
+			__tmp_help = "block these sender addresses in the kernel (ignored with --sources). "
+			__tmp_help += "If unspecified, MULTICAST_BLOCKED_SOURCES is used (none, if unset)."
+			parser.add_argument(
+				"--block-sources", dest="blocked_sources", default=None, nargs="*",
+				type=_source_address, help=__tmp_help,
+			)
+			__tmp_help = "datagrams per second HEAR handles from each sender; the excess is dropped "
+			__tmp_help += "before any handler runs. If unspecified, senders are not limited. "
+			__tmp_help += "Ignored by RECV."
+			parser.add_argument(
+				"--rate-limit", dest="rate_limit", type=_rate, default=None, help=__tmp_help,
+			)
+			__tmp_help = "datagrams each sender may burst above --rate-limit (default is the rate)."
+			parser.add_argument(
+				"--rate-burst", dest="rate_burst", type=_rate_burst, default=None, help=__tmp_help,
+			)
 
 	@staticmethod
 	def _help_daemon_dispatch(*args, **kwargs):
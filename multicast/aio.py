@@ -0,0 +1,537 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Provides asyncio-native multicast features.
+
+Runs multicast endpoints on the asyncio event loop (via `loop.create_datagram_endpoint`), instead
+of on a blocking thread per group, while reusing the socket setup of `multicast.skt.genSocket` and
+the group join logic of `multicast.recv.joinstep`.
+
+Caution: See details regarding dynamic imports [documented](../__init__.py) in this module.
+
+Functions:
+	create_multicast_endpoint: Create an asyncio datagram endpoint on a multicast socket.
+
+Classes:
+	AsyncMcastServer: asyncio protocol receiving multicast datagrams, as a handler or a stream.
+	AsyncMcastSender: asyncio multicast sender with a long-lived send socket.
+
+Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+	Testcase 0: Multicast should be importable.
+
+		>>> import multicast
+		>>>
+
+	Testcase 1: Aio should be automatically imported.
+		A: Test that the aio component is initialized.
+		B: Test that the aio.__MAGIC__ components are initialized.
+
+		>>> multicast.aio is not None
+		True
+		>>> multicast.aio.__doc__ is not None
+		True
+		>>> multicast.aio.__module__ is not None
+		True
+		>>> multicast.aio.AsyncMcastServer is not None
+		True
+		>>> multicast.aio.AsyncMcastSender is not None
+		True
+		>>>
+
+
+"""
+
+__package__ = "multicast"  # skipcq: PYL-W0622
+"""The package of this program.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+	Testcase 0: Multicast should be importable.
+
+		>>> import multicast
+		>>>
+
+	Testcase 1: Aio should be automatically imported.
+
+		>>> multicast.aio.__package__ is not None
+		True
+		>>>
+		>>> multicast.aio.__package__ == multicast.__package__
+		True
+		>>>
+
+"""
+
+__module__ = "multicast"
+"""The module of this program.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+	Testcase 0: Multicast should be importable.
+
+		>>> import multicast
+		>>>
+
+	Testcase 1: Aio should be automatically imported.
+
+		>>> multicast.aio.__module__ is not None
+		True
+		>>>
+
+"""
+
+__file__ = "multicast/aio.py"
+"""The file of this component."""
+
+__name__ = "multicast.aio"  # skipcq: PYL-W0622 - Ensures the correct name value.
+"""The name of this component.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+	Testcase 0: Multicast should be importable.
+
+		>>> import multicast
+		>>>
+
+	Testcase 1: Aio should be automatically imported.
+
+		>>> multicast.aio.__name__ is not None
+		True
+		>>>
+
+"""
+
+try:
+	import sys
+	if "multicast" not in sys.modules:
+		# skipcq
+		from . import multicast as multicast  # pylint: disable=cyclic-import - skipcq: PYL-C0414
+	else:  # pragma: no branch
+		multicast = sys.modules["multicast"]
+	_BLANK = multicast._BLANK  # skipcq: PYL-W0212 - module ok
+	# skipcq
+	from . import recv as recv  # pylint: disable=useless-import-alias  -  skipcq: PYL-C0414
+except Exception as _cause:
+	del _cause  # skipcq - cleanup any error leaks early
+	# skipcq
+	import multicast as multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401, PYL-C0414
+
+try:
+	import asyncio
+	import inspect
+	import logging
+	from multicast import socket as _socket  # skipcq: PYL-C0414
+	depends = [asyncio, inspect, _socket]
+	for unit in depends:
+		try:
+			if unit.__name__ is None:  # pragma: no branch
+				raise ImportError(
+					f"[CWE-440] module failed to import {str(unit)}."
+				) from None
+		except Exception as _cause:  # pragma: no branch
+			raise ImportError("[CWE-758] Module failed completely.") from _cause
+except Exception as baton:  # pragma: no branch
+	raise ImportError(baton) from baton
+
+
+module_logger = logging.getLogger(__name__)
+module_logger.debug(
+	"Loading %s",  # lazy formatting to avoid PYL-W1203
+	__name__,
+)
+
+
+_MCAST_DEFAULT_AIO_QUEUE_SIZE: int = 1024
+"""Maximum number of received datagrams waiting for an `AsyncMcastServer` consumer.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> multicast.aio._MCAST_DEFAULT_AIO_QUEUE_SIZE >= 1
+		True
+		>>>
+
+"""
+
+
+async def create_multicast_endpoint(
+	protocol_factory, groups=None, port=None, iface=None, bind_group=None, loop=None,
+) -> tuple:
+	"""
+	Create an asyncio datagram endpoint on a multicast socket.
+
+	The socket is created by `multicast.genSocket` (so any default socket tuning applies). When
+	`port` is given, it is bound and joined to the `groups` by `multicast.recv.joinstep`, exactly as
+	for the blocking receivers; otherwise it is left unbound, for sending only. Either way it is
+	switched to non-blocking mode and handed to `loop.create_datagram_endpoint`.
+
+	Args:
+		protocol_factory (callable): Returns the `asyncio.DatagramProtocol` for the endpoint.
+		groups (list, optional): List of multicast group addresses to join.
+		port (int, optional): Port number to bind the socket to. Defaults to None (send only).
+		iface (str, optional): Network interface to use.
+		bind_group (str, optional): Specific group address to bind to.
+		loop (asyncio.AbstractEventLoop, optional): Defaults to the running loop.
+
+	Returns:
+		tuple: The (transport, protocol) pair, as from `loop.create_datagram_endpoint`.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import asyncio
+		>>> import multicast
+		>>>
+
+	Testcase 1: create_multicast_endpoint should return a bound datagram transport.
+
+		>>> async def tst_endpoint():
+		... 	(transport, _) = await multicast.aio.create_multicast_endpoint(
+		... 		asyncio.DatagramProtocol, ["224.0.0.1"], 59993, None, "224.0.0.1",
+		... 	)
+		... 	try:
+		... 		return transport.get_extra_info("sockname")
+		... 	finally:
+		... 		transport.close()
+		>>> asyncio.run(tst_endpoint())
+		('224.0.0.1', 59993)
+		>>>
+
+
+	"""
+	if loop is None:
+		loop = asyncio.get_running_loop()
+	if port is None:
+		sock = multicast.genSocket()
+	else:
+		sock = recv.joinstep(groups, port, iface, bind_group, None)
+	try:
+		sock.setblocking(False)
+		return await loop.create_datagram_endpoint(protocol_factory, sock=sock)
+	except BaseException:
+		multicast.endSocket(sock)
+		raise
+
+
+class AsyncMcastServer(asyncio.DatagramProtocol):
+	"""
+	asyncio protocol receiving multicast datagrams on the event loop.
+
+	Each received datagram is either passed to the `handler` (a plain function, or a coroutine
+	function, which is scheduled as a task), or without a handler, queued for consumers of `recv`
+	or `async for`. The queue is bounded by `queue_size`; when it is full, new datagrams are
+	dropped and counted in `dropped`.
+
+	Safe to use as an async context manager, which starts the server on entry and closes it (leaving
+	the groups) on exit.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import asyncio
+		>>> import multicast
+		>>>
+
+	Testcase 1: AsyncMcastServer should receive datagrams as a stream.
+
+		>>> async def tst_stream():
+		... 	async with multicast.aio.AsyncMcastServer("224.0.0.1", 59994) as server:
+		... 		async with multicast.aio.AsyncMcastSender("224.0.0.1", 59994) as sender:
+		... 			sender.send(b"hello")
+		... 			sender.send("world")
+		... 		return [(await server.recv())[0], (await server.recv())[0]]
+		>>> asyncio.run(tst_stream())
+		[b'hello', b'world']
+		>>>
+
+	Testcase 2: AsyncMcastServer should pass datagrams to a coroutine handler.
+
+		>>> async def tst_handler():
+		... 	received = []
+		... 	async def handler(data, address):
+		... 		received.append(data)
+		... 	async with multicast.aio.AsyncMcastServer("224.0.0.1", 59994, handler) as server:
+		... 		async with multicast.aio.AsyncMcastSender("224.0.0.1", 59994) as sender:
+		... 			sender.send(b"handled")
+		... 		while not received:
+		... 			await asyncio.sleep(0.01)
+		... 	return received
+		>>> asyncio.run(tst_handler())
+		[b'handled']
+		>>>
+
+
+	"""
+
+	def __init__(
+		self, group=None, port=None, handler=None, groups=None, iface=None, queue_size=None,
+	):
+		"""
+		Initialize a new (not yet started) server.
+
+		Args:
+			group (str, optional): The multicast group to bind to, and join. Defaults to
+				`_MCAST_DEFAULT_GROUP`.
+			port (int, optional): The port to bind to. Defaults to `_MCAST_DEFAULT_PORT`.
+			handler (callable, optional): Called as `handler(data, address)` per datagram.
+				Defaults to None (queue datagrams for `recv`).
+			groups (list, optional): The multicast groups to join. Defaults to `[group]`.
+			iface (str, optional): Network interface to use.
+			queue_size (int, optional): Maximum number of queued datagrams. Defaults to
+				`_MCAST_DEFAULT_AIO_QUEUE_SIZE`.
+		"""
+		super(AsyncMcastServer, self).__init__()
+		self.group = multicast._MCAST_DEFAULT_GROUP if group is None else group  # skipcq: PYL-W0212
+		self.port = multicast._MCAST_DEFAULT_PORT if port is None else port  # skipcq: PYL-W0212
+		self.groups = [self.group] if groups is None else list(groups)
+		self.iface = iface
+		self.handler = handler
+		self.dropped = 0
+		self._queue_size = _MCAST_DEFAULT_AIO_QUEUE_SIZE if queue_size is None else int(queue_size)
+		self._queue = None
+		self._tasks = set()
+		self._closed = None
+		self.transport = None
+
+	async def start(self):
+		"""
+		Bind the socket, join the groups, and start receiving on the running loop.
+
+		Returns:
+			AsyncMcastServer: This server.
+		"""
+		loop = asyncio.get_running_loop()
+		self._queue = asyncio.Queue(maxsize=max(1, self._queue_size))
+		self._closed = loop.create_future()
+		await create_multicast_endpoint(
+			lambda: self, self.groups, self.port, self.iface, self.group, loop,
+		)
+		return self
+
+	def connection_made(self, transport) -> None:
+		"""Keep the transport, once the endpoint is ready."""
+		self.transport = transport
+
+	def datagram_received(self, data: bytes, addr: tuple) -> None:
+		"""
+		Hand a received datagram to the handler, or queue it.
+
+		Args:
+			data (bytes): The payload.
+			addr (tuple): The (host, port) of the sender.
+		"""
+		if self.handler is None:
+			try:
+				self._queue.put_nowait((data, addr))
+			except asyncio.QueueFull:
+				self.dropped += 1
+			return
+		result = self.handler(data, addr)
+		if inspect.isawaitable(result):
+			task = asyncio.ensure_future(result)
+			self._tasks.add(task)
+			task.add_done_callback(self._tasks.discard)
+
+	def error_received(self, exc: Exception) -> None:
+		"""Log (and otherwise ignore) errors reported by the transport."""
+		module_logger.debug(
+			"Error received: %s",  # lazy formatting to avoid PYL-W1203
+			exc,
+		)
+
+	def connection_lost(self, exc) -> None:
+		"""Wake up any waiting `serve_forever` or consumers, once the transport is closed."""
+		if self._closed is not None and not self._closed.done():
+			self._closed.set_result(None)
+		if self._queue is not None:
+			if self._queue.full():
+				self._queue.get_nowait()
+				self.dropped += 1
+			self._queue.put_nowait(None)
+
+	async def recv(self) -> tuple:
+		"""
+		Wait for the next queued datagram.
+
+		Returns:
+			tuple: The (data, address) of the datagram, or None once the server is closed.
+		"""
+		item = await self._queue.get()
+		if item is None:
+			self._queue.put_nowait(None)  # keep waking up other consumers
+		return item
+
+	def __aiter__(self):
+		"""Iterate over the received (data, address) datagrams, until the server is closed."""
+		return self
+
+	async def __anext__(self) -> tuple:
+		"""Wait for the next queued datagram."""
+		item = await self.recv()
+		if item is None:
+			raise StopAsyncIteration
+		return item
+
+	async def serve_forever(self) -> None:
+		"""Wait until the server is closed."""
+		await asyncio.shield(self._closed)
+
+	def close(self) -> None:
+		"""Close the socket (leaving the groups)."""
+		if self.transport is not None:
+			self.transport.close()
+
+	async def wait_closed(self) -> None:
+		"""Wait for the socket to be closed, and for any running handler tasks to finish."""
+		if self._closed is not None:
+			await asyncio.shield(self._closed)
+		if self._tasks:
+			await asyncio.gather(*self._tasks, return_exceptions=True)
+
+	async def __aenter__(self):
+		"""Start the server."""
+		return await self.start()
+
+	async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+		"""Close the server, and wait until it is closed."""
+		self.close()
+		await self.wait_closed()
+
+
+class AsyncMcastSender:
+	"""
+	asyncio multicast sender with a long-lived send socket.
+
+	The asyncio counterpart of `multicast.send.McastSender`: `send` queues each datagram on the
+	event loop's transport, without blocking. Safe to use as an async context manager, which opens
+	the socket on entry and closes it on exit.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import asyncio
+		>>> import multicast
+		>>>
+
+	Testcase 1: AsyncMcastSender should refuse to send when not open.
+
+		>>> multicast.aio.AsyncMcastSender("224.0.0.1", 59994).send(b"x")  #doctest: +ELLIPSIS
+		Traceback (most recent call last):
+		...
+		RuntimeError: [CWE-665] AsyncMcastSender is not open.
+		>>>
+
+
+	"""
+
+	def __init__(self, group=None, port=None):
+		"""
+		Initialize a new (not yet open) sender.
+
+		Args:
+			group (str, optional): The destination multicast group. Defaults to
+				`_MCAST_DEFAULT_GROUP`.
+			port (int, optional): The destination port. Defaults to `_MCAST_DEFAULT_PORT`.
+		"""
+		self.group = multicast._MCAST_DEFAULT_GROUP if group is None else group  # skipcq: PYL-W0212
+		self.port = multicast._MCAST_DEFAULT_PORT if port is None else port  # skipcq: PYL-W0212
+		self.transport = None
+
+	async def open(self):
+		"""
+		Open the send socket on the running loop.
+
+		Returns:
+			AsyncMcastSender: This sender.
+		"""
+		if self.transport is None:
+			(self.transport, _) = await create_multicast_endpoint(asyncio.DatagramProtocol)
+		return self
+
+	def send(self, data) -> None:
+		"""
+		Queue one datagram for sending to the group.
+
+		Args:
+			data (bytes or str): The payload; strings are encoded as UTF-8.
+
+		Raises:
+			RuntimeError: If the sender is not open.
+		"""
+		if self.transport is None:
+			raise RuntimeError("[CWE-665] AsyncMcastSender is not open.")
+		if isinstance(data, str):
+			data = data.encode("utf8")
+		self.transport.sendto(data, (self.group, self.port))
+
+	def send_many(self, payloads) -> int:
+		"""
+		Queue many datagrams for sending to the group.
+
+		Args:
+			payloads (iterable): The payloads (bytes or str).
+
+		Returns:
+			int: The number of queued datagrams.
+		"""
+		count = 0
+		for payload in payloads:
+			self.send(payload)
+			count += 1
+		return count
+
+	def close(self) -> None:
+		"""Close the send socket, after any queued datagrams are sent."""
+		if self.transport is not None:
+			self.transport.close()
+			self.transport = None
+
+	async def __aenter__(self):
+		"""Open the sender."""
+		return await self.open()
+
+	async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+		"""Close the sender."""
+		self.close()
+
+
+# skipcq
+__all__ = [
+	"""__package__""",
+	"""__module__""",
+	"""__name__""",
+	"""__doc__""",  # skipcq: PYL-E0603
+	"""create_multicast_endpoint""",
+	"""AsyncMcastServer""",
+	"""AsyncMcastSender""",
+]
@@ -217,6 +217,36 @@ def validate_multicast_address(addr: str) -> bool:
 		return False
 
 
+def validate_source_address(addr: str) -> bool:
+	"""
+	Validate if the address is a valid multicast source (sender) address.
+
+	Arguments:
+		addr (str) -- The IP address to validate.
+
+	Returns:
+		bool: True if the address is a unicast IPv4 address, False otherwise (multicast, the
+			unspecified, and the broadcast addresses never send multicast traffic).
+
+	Minimum Acceptance Testing:
+		>>> validate_source_address('192.0.2.1')
+		True
+		>>> validate_source_address('224.0.0.1')
+		False
+		>>> validate_source_address('0.0.0.0')
+		False
+		>>> validate_source_address('255.255.255.255')
+		False
+		>>> validate_source_address('invalid')
+		False
+	"""
+	try:
+		ip = ipaddress.IPv4Address(addr)
+		return not (ip.is_multicast or ip.is_unspecified or ip == ipaddress.IPv4Address(0xFFFFFFFF))
+	except (ValueError, AttributeError):  # pragma: no branch
+		return False
+
+
 def validate_ttl(ttl: int) -> bool:
 	"""
 	Validate if the TTL value is within the valid range as per RFC-1112.
@@ -254,6 +284,107 @@ def validate_ttl(ttl: int) -> bool:
 		) from _cause
 
 
+_MCAST_TUNING_KNOBS: dict = {
+	"rcvbuf": ("MULTICAST_RCVBUF", 1, 1073741823),
+	"sndbuf": ("MULTICAST_SNDBUF", 1, 1073741823),
+	"busy_poll": ("MULTICAST_BUSY_POLL", 0, 1000000),
+	"tos": ("MULTICAST_TOS", 0, 255),
+	"priority": ("MULTICAST_PRIORITY", 0, 6),
+	"loop": ("MULTICAST_LOOP", 0, 1),
+}
+"""The socket tuning knobs, as the environment variable and inclusive range of each.
+
+	Knobs:
+		rcvbuf -- SO_RCVBUF in bytes (the kernel caps this at net.core.rmem_max).
+		sndbuf -- SO_SNDBUF in bytes (the kernel caps this at net.core.wmem_max).
+		busy_poll -- SO_BUSY_POLL in microseconds (Linux only).
+		tos -- IP_TOS byte, i.e. the DSCP code-point shifted left by two bits.
+		priority -- SO_PRIORITY (0-6, higher values need CAP_NET_ADMIN; Linux only).
+		loop -- IP_MULTICAST_LOOP, whether sent datagrams are looped back to local receivers.
+
+	Minimal Testing:
+
+		>>> sorted(_MCAST_TUNING_KNOBS)
+		['busy_poll', 'loop', 'priority', 'rcvbuf', 'sndbuf', 'tos']
+		>>> _MCAST_TUNING_KNOBS["tos"]
+		('MULTICAST_TOS', 0, 255)
+		>>>
+
+"""
+
+
+_MCAST_TUNING_PROFILES: dict = {
+	"default": {},
+	"low-latency": {"busy_poll": 50, "tos": 184, "priority": 6},
+	"high-throughput": {"rcvbuf": 4194304, "sndbuf": 4194304},
+}
+"""The named socket tuning profiles, selectable with the MULTICAST_PROFILE environment variable.
+
+	The "default" profile leaves every knob at the kernel's default. The "low-latency" profile
+	busy-polls for 50 microseconds, and marks datagrams as Expedited Forwarding (DSCP 46) with a
+	high priority. The "high-throughput" profile enlarges the socket buffers, so bursts are queued
+	instead of dropped.
+
+	Minimal Testing:
+
+		>>> sorted(_MCAST_TUNING_PROFILES)
+		['default', 'high-throughput', 'low-latency']
+		>>> all(
+		...     validate_tuning(knob, value)
+		...     for profile in _MCAST_TUNING_PROFILES.values()
+		...     for knob, value in profile.items()
+		... )
+		True
+		>>>
+
+"""
+
+
+def validate_tuning(knob: str, value: int) -> bool:
+	"""
+	Validate if the value is within the valid range of the socket tuning knob.
+
+	Arguments:
+		knob (str) -- The name of the tuning knob (see _MCAST_TUNING_KNOBS).
+		value (int) -- The value to validate.
+
+	Returns:
+		bool: True if the knob is known and the value is within its range, False otherwise.
+
+	Raises:
+		ValueError: If the value cannot be converted to an integer.
+
+	Minimum Acceptance Testing:
+		>>> validate_tuning("rcvbuf", 4194304)
+		True
+		>>> validate_tuning("rcvbuf", 0)
+		False
+		>>> validate_tuning("tos", 255)
+		True
+		>>> validate_tuning("tos", 256)
+		False
+		>>> validate_tuning("loop", "0")  # String that can be converted
+		True
+		>>> validate_tuning("priority", 7)
+		False
+		>>> validate_tuning("no_such_knob", 1)
+		False
+		>>> try:
+		...     validate_tuning("busy_poll", 'invalid')
+		... except ValueError:
+		...     print('ValueError raised')
+		ValueError raised
+	"""
+	try:
+		value_num = int(value)
+	except (ValueError, TypeError) as _cause:  # pragma: no branch
+		raise ValueError(f"Invalid {knob} value: {value}. Must be an integer.") from _cause
+	if knob not in _MCAST_TUNING_KNOBS:
+		return False
+	(_, low, high) = _MCAST_TUNING_KNOBS[knob]
+	return low <= value_num <= high
+
+
 def load_buffer_size() -> int:
 	"""
 	Load and validate the multicast buffer size from environment variable.
@@ -704,6 +835,160 @@ def load_TTL() -> int:
 	return ttl
 
 
+def load_tuning() -> dict:
+	"""
+	Load and validate the socket tuning from environment variables.
+
+	This function starts from the named profile in the MULTICAST_PROFILE environment variable
+	(see _MCAST_TUNING_PROFILES), then applies any per-knob override from the environment
+	(see _MCAST_TUNING_KNOBS). Unknown profiles and invalid knob values trigger warnings and
+	fall back to the profile's value.
+
+	Returns:
+		dict: The validated tuning, mapping each set knob name to its integer value.
+			Knobs that are not set are absent, and left at the kernel's default.
+
+	Environment Variables:
+		MULTICAST_PROFILE -- One of "default", "low-latency" or "high-throughput".
+		MULTICAST_RCVBUF, MULTICAST_SNDBUF, MULTICAST_BUSY_POLL, MULTICAST_TOS,
+		MULTICAST_PRIORITY, MULTICAST_LOOP -- Per-knob overrides.
+
+	Minimum Acceptance Testing:
+
+	Testcase 0: Setup
+		>>> import os
+		>>> import warnings
+		>>> for key in ['MULTICAST_PROFILE', 'MULTICAST_RCVBUF', 'MULTICAST_TOS']:
+		...     _ = os.environ.pop(key, None)
+		>>>
+
+	Testcase 1: Test with unset environment variables
+		>>> load_tuning()
+		{}
+
+	Testcase 2: Test with a named profile, and a valid override
+		>>> os.environ['MULTICAST_PROFILE'] = 'high-throughput'
+		>>> os.environ['MULTICAST_RCVBUF'] = '1048576'
+		>>> tuning = load_tuning()
+		>>> tuning['rcvbuf'], tuning['sndbuf']
+		(1048576, 4194304)
+
+	Testcase 3: Test with invalid override values
+		>>> os.environ['MULTICAST_RCVBUF'] = 'invalid'
+		>>> os.environ['MULTICAST_TOS'] = '256'
+		>>> with warnings.catch_warnings(record=True) as w:
+		...     warnings.simplefilter("always")
+		...     tuning = load_tuning()
+		...     len(w) == 2  # One warning per invalid value
+		True
+		>>> tuning['rcvbuf']  # Falls back to the profile value
+		4194304
+		>>> 'tos' in tuning
+		False
+
+	Testcase 4: Test with an unknown profile
+		>>> os.environ['MULTICAST_PROFILE'] = 'invalid'
+		>>> for key in ['MULTICAST_RCVBUF', 'MULTICAST_TOS']:
+		...     _ = os.environ.pop(key, None)
+		>>> with warnings.catch_warnings(record=True) as w:
+		...     warnings.simplefilter("always")
+		...     tuning = load_tuning()
+		...     len(w) == 1  # One warning was issued
+		True
+		>>> tuning  # Falls back to the default profile
+		{}
+
+		# Cleanup
+		>>> os.environ.pop('MULTICAST_PROFILE', None)
+		'invalid'
+		>>>
+	"""
+	module_logger.debug("Looking for MULTICAST_PROFILE in environment.")
+	profile = os.getenv("MULTICAST_PROFILE", "default")
+	if profile not in _MCAST_TUNING_PROFILES:
+		warnings.warn(
+			f"Unknown MULTICAST_PROFILE {profile}, using default profile", stacklevel=2,
+		)
+		profile = "default"
+	tuning = dict(_MCAST_TUNING_PROFILES[profile])
+	for knob, (variable, _, _) in _MCAST_TUNING_KNOBS.items():
+		if variable not in os.environ:
+			continue
+		try:
+			valid = validate_tuning(knob, os.environ[variable])
+		except ValueError:
+			valid = False
+		if valid:
+			tuning[knob] = int(os.environ[variable])
+		else:
+			warnings.warn(
+				f"Invalid {variable} value {os.environ[variable]}, using {profile} profile value",
+				stacklevel=2,
+			)
+	module_logger.debug(
+		"Loaded %s tuning profile as %s.",  # lazy formatting to avoid PYL-W1203
+		profile, tuning,
+	)
+	return tuning
+
+
+def load_sources(variable: str = "MULTICAST_SOURCES") -> list:
+	"""
+	Load and validate a list of multicast source addresses from an environment variable.
+
+	The variable holds space-separated unicast IPv4 addresses. Invalid addresses trigger warnings
+	and are skipped.
+
+	Arguments:
+		variable (str) -- The environment variable. Defaults to MULTICAST_SOURCES.
+
+	Returns:
+		list: The valid source addresses, in order, without duplicates.
+
+	Environment Variables:
+		MULTICAST_SOURCES -- The only senders to receive from (source-specific joins).
+		MULTICAST_BLOCKED_SOURCES -- The senders to block (any-source joins with exclusions).
+
+	Minimum Acceptance Testing:
+
+	Testcase 0: Setup
+		>>> import os
+		>>> import warnings
+		>>> _ = os.environ.pop('MULTICAST_SOURCES', None)
+		>>>
+
+	Testcase 1: Test with an unset environment variable
+		>>> load_sources()
+		[]
+
+	Testcase 2: Test with valid and invalid sources
+		>>> os.environ['MULTICAST_SOURCES'] = '192.0.2.1 224.0.0.1 192.0.2.2 192.0.2.1'
+		>>> with warnings.catch_warnings(record=True) as w:
+		...     warnings.simplefilter("always")
+		...     sources = load_sources()
+		...     len(w) == 1  # One warning for the multicast address
+		True
+		>>> sources
+		['192.0.2.1', '192.0.2.2']
+
+		# Cleanup
+		>>> os.environ.pop('MULTICAST_SOURCES', None)
+		'192.0.2.1 224.0.0.1 192.0.2.2 192.0.2.1'
+		>>>
+	"""
+	module_logger.debug(
+		"Looking for %s in environment.",  # lazy formatting to avoid PYL-W1203
+		variable,
+	)
+	sources = []
+	for addr in os.getenv(variable, "").split():
+		if not validate_source_address(addr):
+			warnings.warn(f"Invalid source {addr} in {variable}, skipping", stacklevel=2)
+		elif addr not in sources:
+			sources.append(addr)
+	return sources
+
+
 def load_config() -> dict:
 	"""
 	Load multicast configuration from environment variables.
@@ -720,6 +1005,9 @@ def load_config() -> dict:
 			- ttl (int): Time-to-live value (1-126) used as the Socket timeout in seconds
 			- bind_addr (str): Address to bind to
 			- buffer_size (int): Receive buffer size
+			- tuning (dict): Socket tuning knobs and values (see load_tuning)
+			- sources (list): The only senders to receive from (see load_sources)
+			- blocked_sources (list): The senders to block (see load_sources)
 
 	Minimum Acceptance Testing:
 
@@ -900,6 +1188,18 @@ def load_config() -> dict:
 		'invalid'
 		>>>
 
+	Testcase 12: Test with a named tuning profile.
+
+		>>> os.environ['MULTICAST_PROFILE'] = 'low-latency'
+		>>> config = load_config()
+		>>> config['tuning']['tos']
+		184
+
+		# Cleanup
+		>>> os.environ.pop('MULTICAST_PROFILE', None)
+		'low-latency'
+		>>>
+
 	"""
 	# Load values from environment with defaults
 	module_logger.info("Loading multicast overrides from environment.")
@@ -907,6 +1207,9 @@ def load_config() -> dict:
 	group = load_group()
 	ttl = load_TTL()
 	buffer_size = load_buffer_size()
+	tuning = load_tuning()
+	sources = load_sources()
+	blocked_sources = load_sources("MULTICAST_BLOCKED_SOURCES")
 	module_logger.debug("Looking for MULTICAST_GROUPS in environment.")
 	groups_str = os.getenv("MULTICAST_GROUPS", "")
 	module_logger.debug("Done.")
@@ -940,7 +1243,10 @@ def load_config() -> dict:
 		"groups": sorted(groups),  # Convert to sorted list for consistent ordering
 		"ttl": ttl,
 		"bind_addr": bind_addr,
-		"buffer_size": buffer_size
+		"buffer_size": buffer_size,
+		"tuning": tuning,
+		"sources": sources,
+		"blocked_sources": blocked_sources,
 	}
 
 
@@ -953,6 +1259,10 @@ def load_config() -> dict:
 	"""validate_buffer_size""",
 	"""validate_port""",
 	"""validate_multicast_address""",
+	"""validate_source_address""",
 	"""validate_ttl""",
+	"""validate_tuning""",
+	"""load_tuning""",
+	"""load_sources""",
 	"""load_config""",
 ]
@@ -23,7 +23,11 @@
 UDP server that can receive and process multicast messages continuously.
 
 Classes:
+	McastRequest: A (data, socket) request with the kernel arrival time of its datagram.
+	SourceRateLimiter: Per-source token-bucket rate limiting, with an LRU-bounded source table.
 	McastServer: UDP server implementation for multicast communication.
+	McastThreadPoolServer: McastServer variant handling requests on a fixed-size worker pool.
+	McastSupervisor: Runs and restarts sharded McastServer worker processes on one port.
 	HearUDPHandler: Request handler for processing multicast messages.
 	McastHEAR: Main tool class for HEAR operations.
 
@@ -197,15 +201,26 @@
 	import multicast as multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401, PYL-C0414
 
 try:
+	import collections
+	import functools
 	import logging
+	import multiprocessing
+	import queue
+	import selectors
 	import threading
+	import time
 	import socketserver
 	import warnings
+	import zlib
+	from concurrent import futures
 	from multicast import argparse as _argparse
 	from multicast import unicodedata as _unicodedata
 	from multicast import socket as _socket
 	from multicast import struct as _struct
-	depends = [_unicodedata, _socket, _struct, _argparse]
+	depends = [
+		_unicodedata, _socket, _struct, _argparse, queue, futures, multiprocessing, selectors, zlib,
+		collections,
+	]
 	for unit in depends:
 		try:
 			if unit.__name__ is None:  # pragma: no branch
@@ -225,6 +240,408 @@
 )
 
 
+class McastRequest(tuple):
+	"""
+	A (data, socket) request, as handed to request handlers, with the metadata of its datagram.
+
+	Unpacks exactly like the plain `socketserver` request tuple, and additionally carries the
+	`arrival_ns` attribute: the arrival time in nanoseconds since the epoch (comparable with
+	`time.time_ns()`), taken by the kernel when the server has timestamps enabled, and the `group`
+	attribute: the multicast group the datagram was sent to, when the server joined several groups.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: McastRequest should unpack like a request tuple.
+
+		>>> tst_request = multicast.hear.McastRequest(b"data", None, 42, "224.0.0.2")
+		>>> (data, sock) = tst_request
+		>>> (data, sock, tst_request.arrival_ns, tst_request.group)
+		(b'data', None, 42, '224.0.0.2')
+		>>>
+
+	"""
+
+	def __new__(cls, data, sock, arrival_ns=None, group=None):
+		"""Create a new request from the received data, the socket, and its metadata."""
+		request = super(McastRequest, cls).__new__(cls, (data, sock))
+		request.arrival_ns = arrival_ns
+		request.group = group
+		return request
+
+
+def shard_of(client_address: tuple, shards: int) -> int:
+	"""
+	Map the source of a datagram to one of several shards.
+
+	The (host, port) source is hashed with CRC-32, which is stable across processes (unlike the
+	salted built-in `hash`), so every worker process agrees on the shard of each source, and all
+	the datagrams of one source are processed by the same worker, in order.
+
+	Args:
+		client_address (tuple): The (host, port) source of the datagram.
+		shards (int): The number of shards.
+
+	Returns:
+		int: The shard of the source, from 0 to shards - 1.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: shard_of should be stable, and within range.
+
+		>>> multicast.hear.shard_of(("192.0.2.1", 59595), 4) in range(4)
+		True
+		>>> multicast.hear.shard_of(("192.0.2.1", 59595), 4) == multicast.hear.shard_of(
+		... 	("192.0.2.1", 59595), 4,
+		... )
+		True
+		>>> multicast.hear.shard_of(("192.0.2.1", 59595), 1)
+		0
+		>>>
+
+	"""
+	source = f"{client_address[0]}:{client_address[1]}".encode("ascii", "replace")
+	return zlib.crc32(source) % max(1, int(shards))
+
+
+@functools.lru_cache(maxsize=256)
+def _is_multicast_destination(address: str) -> bool:
+	"""
+	Check whether a datagram's destination address is a multicast group, with a cache.
+
+	This is a helper function and should NOT be called directly.
+	"""
+	return multicast.env.validate_multicast_address(address)
+
+
+if hasattr(selectors, "PollSelector"):  # pragma: no branch -- same choice as socketserver
+	_ServerSelector = selectors.PollSelector
+else:  # pragma: no cover -- platform dependent
+	_ServerSelector = selectors.SelectSelector
+
+
+_MCAST_WILDCARD_ADDRESS: str = "0.0.0.0"
+"""The address McastServer binds to when it joins several groups on one socket."""
+
+
+_MCAST_REPLY_POLICIES: tuple = ("none", "per-message", "aggregated")
+"""The reply policies of McastServer, for acknowledging the requests its handlers process.
+
+	none -- No replies are sent.
+	per-message -- Handlers reply to every request (the default).
+	aggregated -- One summary reply per source is sent every `reply_interval` seconds.
+"""
+
+
+_MCAST_STOP_PAYLOAD: bytes = b"STOP"
+"""The legacy in-band stop command: a payload of exactly these bytes (see `is_stop_payload`)."""
+
+
+def is_stop_payload(data) -> bool:
+	"""
+	Check whether a payload is the legacy in-band "STOP" command.
+
+	Only a payload of exactly "STOP" (ignoring surrounding whitespace) is the command, so payloads
+	that merely mention STOP never stop a server.
+
+	Args:
+		data (bytes|str): The payload, as raw bytes or as decoded text.
+
+	Returns:
+		bool: True if the payload is the "STOP" command, otherwise False.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: Only an exact STOP payload is the command.
+
+		>>> [
+		... 	multicast.hear.is_stop_payload(payload)
+		... 	for payload in (b"STOP", "STOP\\n", b"no STOP please", "The Test is STOP", None)
+		... ]
+		[True, True, False, False, False]
+		>>>
+
+	"""
+	if isinstance(data, str):
+		data = data.encode("utf8", "replace")
+	elif not isinstance(data, (bytes, bytearray, memoryview)):
+		return False
+	return bytes(data).strip() == _MCAST_STOP_PAYLOAD
+
+
+_MCAST_CONTROL_MAGIC: bytes = b"MCTL"
+"""Prefixes every control channel datagram, so stray datagrams are never mistaken for commands."""
+
+
+_MCAST_CONTROL_OPCODES: dict = {"stop": 1, "stats": 2, "reload": 3, "pause": 4, "resume": 5}
+"""The commands of the control channel of McastServer, by name, with their one byte opcodes.
+
+	stop -- Stop serving (like the legacy in-band STOP payload).
+	stats -- Report the accepted, filtered, dropped and rate limited request counts, and whether
+		paused.
+	reload -- Re-create and re-join the data socket, and re-apply the tuning from the environment.
+	pause -- Stop reading the data socket (the kernel queues, and then drops, new datagrams).
+	resume -- Resume reading the data socket.
+"""
+
+
+_MCAST_CONTROL_REQUEST = _struct.Struct("!4sB")
+"""The control request format: the magic, and the opcode."""
+
+
+_MCAST_CONTROL_REPLY = _struct.Struct("!4sBB")
+"""The control reply format: the magic, the opcode, and the status (0 on success)."""
+
+
+_MCAST_CONTROL_STATS = _struct.Struct("!QQQQB")
+"""The body of a stats reply: the accepted, filtered, dropped and rate limited counts, and the
+paused flag."""
+
+
+def control(control_address: tuple, command: str, timeout: float = 1.0) -> dict:
+	"""
+	Send a command to the control channel of a McastServer, and wait for its reply.
+
+	Args:
+		control_address (tuple): The (host, port) of the server's control channel.
+		command (str): The command, one of the keys of `_MCAST_CONTROL_OPCODES`.
+		timeout (float): Seconds to wait for the reply. Defaults to 1.0.
+
+	Returns:
+		dict: The reply, with the "command" and its "status" (0 on success), and for "stats" also
+			the "accepted", "filtered", "drops", "rate_limited" and "paused" fields.
+
+	Raises:
+		ValueError: If the command is unknown, or the reply is malformed.
+		TimeoutError: If no reply arrives in time.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: Unknown commands are rejected before anything is sent.
+
+		>>> multicast.hear.control(("127.0.0.1", 0), "explode")  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: [CWE-20] Unknown control command: explode.
+		>>>
+
+	"""
+	opcode = _MCAST_CONTROL_OPCODES.get(command)
+	if opcode is None:
+		raise ValueError(f"[CWE-20] Unknown control command: {command}.")
+	with _socket.socket(_socket.AF_INET, _socket.SOCK_DGRAM) as sock:
+		sock.settimeout(timeout)
+		sock.connect(control_address)
+		sock.send(_MCAST_CONTROL_REQUEST.pack(_MCAST_CONTROL_MAGIC, opcode))
+		try:
+			reply = sock.recv(_MCAST_CONTROL_REPLY.size + _MCAST_CONTROL_STATS.size)
+		except _socket.timeout as _cause:
+			raise TimeoutError(f"[CWE-400] No reply to control command: {command}.") from _cause
+	if len(reply) < _MCAST_CONTROL_REPLY.size:
+		raise ValueError("[CWE-20] Malformed control reply.")
+	(magic, reply_opcode, status) = _MCAST_CONTROL_REPLY.unpack_from(reply)
+	if magic != _MCAST_CONTROL_MAGIC or reply_opcode != opcode:
+		raise ValueError("[CWE-20] Malformed control reply.")
+	result = {"command": command, "status": status}
+	if command == "stats" and len(reply) >= _MCAST_CONTROL_REPLY.size + _MCAST_CONTROL_STATS.size:
+		(accepted, filtered, drops, rate_limited, paused) = _MCAST_CONTROL_STATS.unpack_from(
+			reply, _MCAST_CONTROL_REPLY.size,
+		)
+		result.update(
+			accepted=accepted, filtered=filtered, drops=drops, rate_limited=rate_limited,
+			paused=bool(paused),
+		)
+	return result
+
+
+class _SourceBucket:
+	"""The token bucket of one source in a SourceRateLimiter's table."""
+
+	__slots__ = ("tokens", "stamp", "dropped")
+
+	def __init__(self) -> None:
+		"""Create an empty bucket, filled by SourceRateLimiter on use."""
+		self.tokens = 0.0
+		self.stamp = 0.0
+		self.dropped = 0
+
+
+class SourceRateLimiter:
+	"""
+	Per-source token-bucket rate limiting, with a source table bounded by an LRU.
+
+	Each source (a client address) has a bucket of up to `burst` tokens, refilled at `rate` tokens
+	per second. Each datagram takes one token, and is dropped (and counted against its source) when
+	the bucket is empty. So a source may send bursts of up to `burst` datagrams, and `rate`
+	datagrams per second in the long run, and one chatty sender cannot starve the others.
+
+	The table holds at most `max_sources` buckets, as an `OrderedDict` in least recently used
+	order. A new source takes over the bucket of the least recently used one (counted by
+	`evicted`), so `allow` is O(1), and allocates nothing once the table is full.
+
+	Without a `rate` the limiter is disabled: `allow` accepts every datagram at once, without
+	taking the lock or reading the clock.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: A source may send a burst, and is then limited to the rate.
+
+		>>> tst_limiter = multicast.hear.SourceRateLimiter(rate=1, burst=3)
+		>>> [tst_limiter.allow(("192.0.2.1", 59595), now=0.0) for _ in range(4)]
+		[True, True, True, False]
+		>>> tst_limiter.allow(("192.0.2.1", 59595), now=1.0)
+		True
+		>>> (tst_limiter.dropped, tst_limiter.drops(("192.0.2.1", 59595)))
+		(1, 1)
+		>>>
+
+	Testcase 1: Sources are limited independently, and the least recently used is evicted.
+
+		>>> tst_limiter = multicast.hear.SourceRateLimiter(rate=1, burst=1, max_sources=2)
+		>>> [tst_limiter.allow(("192.0.2.1", port), now=0.0) for port in (1, 2, 1, 3)]
+		[True, True, False, True]
+		>>> (tst_limiter.sources(), tst_limiter.evicted)
+		([('192.0.2.1', 1), ('192.0.2.1', 3)], 1)
+		>>>
+
+	Testcase 2: A limiter without a rate accepts every datagram, and tracks no source.
+
+		>>> tst_limiter = multicast.hear.SourceRateLimiter(rate=None)
+		>>> all(tst_limiter.allow(("192.0.2.1", 59595), now=0.0) for _ in range(100))
+		True
+		>>> (tst_limiter.enabled, tst_limiter.dropped, tst_limiter.sources())
+		(False, 0, [])
+		>>>
+
+	Testcase 3: Invalid rates are rejected.
+
+		>>> multicast.hear.SourceRateLimiter(rate=0)  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: [CWE-20] Invalid rate limit: 0.
+		>>>
+
+	"""
+
+	__module__ = "multicast.hear"
+
+	__slots__ = (
+		"rate", "burst", "max_sources", "enabled", "dropped", "evicted", "_table", "_lock",
+	)
+
+	def __init__(self, rate: float, burst: float = None, max_sources: int = 1024) -> None:
+		"""
+		Initialize an empty source table.
+
+		Args:
+			rate (float): The datagrams per second each source may send, in the long run. None
+				disables the limiter.
+			burst (float, optional): The datagrams each source may send at once. Defaults to the
+				rate, but at least 1.
+			max_sources (int, optional): The most sources tracked at once. Defaults to 1024.
+
+		Raises:
+			ValueError: If the rate or the burst is not positive.
+		"""
+		self.enabled = rate is not None
+		if self.enabled and not float(rate) > 0:
+			raise ValueError(f"[CWE-20] Invalid rate limit: {rate}.")
+		self.rate = float(rate) if self.enabled else None
+		self.burst = max(1.0, self.rate or 1.0) if burst is None else float(burst)
+		if not self.burst >= 1:
+			raise ValueError(f"[CWE-20] Invalid rate burst: {burst}.")
+		self.max_sources = max(1, int(max_sources))
+		self.dropped = 0
+		self.evicted = 0
+		self._table = collections.OrderedDict()
+		self._lock = threading.Lock()
+
+	def allow(self, source: tuple, now: float = None) -> bool:
+		"""
+		Take a token from the source's bucket.
+
+		Args:
+			source (tuple): The client address of the datagram.
+			now (float, optional): The current `time.monotonic()`. Defaults to reading it.
+
+		Returns:
+			bool: True if the datagram is within the source's rate (or the limiter is disabled),
+				False if it should be dropped.
+		"""
+		if not self.enabled:
+			return True
+		if now is None:
+			now = time.monotonic()
+		with self._lock:
+			bucket = self._table.get(source)
+			if bucket is None:
+				if len(self._table) >= self.max_sources:
+					(_, bucket) = self._table.popitem(last=False)  # reuse the LRU source's bucket
+					self.evicted += 1
+				else:
+					bucket = _SourceBucket()
+				bucket.tokens = self.burst
+				bucket.stamp = now
+				bucket.dropped = 0
+				self._table[source] = bucket
+			else:
+				self._table.move_to_end(source)
+				bucket.tokens = min(self.burst, bucket.tokens + ((now - bucket.stamp) * self.rate))
+				bucket.stamp = now
+			if bucket.tokens >= 1:
+				bucket.tokens -= 1
+				return True
+			bucket.dropped += 1
+			self.dropped += 1
+			return False
+
+	def drops(self, source: tuple) -> int:
+		"""
+		Get the number of datagrams dropped from a source, while it is in the table.
+
+		Args:
+			source (tuple): The client address.
+
+		Returns:
+			int: The datagrams dropped, 0 for sources not in the table.
+		"""
+		with self._lock:
+			bucket = self._table.get(source)
+			return 0 if bucket is None else bucket.dropped
+
+	def sources(self) -> list:
+		"""
+		List the tracked sources, from the least to the most recently used.
+
+		Returns:
+			list: The client addresses in the table.
+		"""
+		with self._lock:
+			return list(self._table)
+
+
 class McastServer(socketserver.UDPServer):
 	"""
 	Generic Subclasses socketserver.UDPServer for handling '--daemon' function.
@@ -278,7 +695,26 @@ class McastServer(socketserver.UDPServer):
 	"""
 
 	def __init__(
-		self, server_address: tuple, RequestHandlerClass: type, bind_and_activate: bool = True
+		self,
+		server_address: tuple,
+		RequestHandlerClass: type,
+		bind_and_activate: bool = True,
+		persistent: bool = True,
+		drain_limit: int = 1,
+		binary: bool = False,
+		timestamps: bool = False,
+		reuse_port: bool = False,
+		shard: tuple = None,
+		reply_policy: str = "per-message",
+		reply_interval: float = 1.0,
+		control_address: tuple = None,
+		payload_commands: bool = None,
+		groups: list = None,
+		sources: list = None,
+		blocked_sources: list = None,
+		rate_limit: float = None,
+		rate_burst: float = None,
+		rate_sources: int = 1024,
 	) -> None:
 		"""
 		Initialize a new instance of the McastServer.
@@ -286,9 +722,96 @@ def __init__(
 		Creates a new UDP server for multicast communication and sets up an appropriate logger
 		based on the server address provided. May be extended, do not override.
 
+		By default the server is persistent, and keeps one bound and joined socket for its
+		entire lifetime. Passing `persistent=False` restores the legacy ephemeral
+		behavior of re-creating, re-binding and re-joining the socket after every request.
+
+		When `drain_limit` is greater than one, the server runs in drain mode: each time the socket
+		becomes readable, up to `drain_limit` already-queued datagrams are read without blocking and
+		handed to `process_batch` as one list, instead of waking up once per datagram.
+
+		The server counts the datagrams the kernel drops before they can be read (e.g., when the
+		receive buffer overflows during a burst) in `drops`, a `multicast.skt.DropCounter` offering
+		both the cumulative `drops.total`, and the per-interval `drops.interval()` counts.
+
+		When `timestamps` is True, the kernel timestamps each datagram on arrival, and requests are
+		handed to handlers as `McastRequest` tuples carrying that `arrival_ns` time, so latency
+		measurements exclude the scheduling delay before the server read the datagram.
+
+		When `reuse_port` is True, the socket is bound with `SO_REUSEPORT`, so several servers (in
+		different processes) may share the same group and port. Each of them receives a copy of
+		every multicast datagram, so `shard` may be given as an (index, count) tuple, to only
+		process the datagrams whose source hashes (see `shard_of`) to `index` of `count` shards.
+		Filtered datagrams are counted in `filtered`, and processed ones in `accepted`.
+
+		Handlers reply through `send_reply`, which reuses one long-lived reply socket (opened on the
+		first reply, and closed by `server_close`), instead of opening a socket per reply. The
+		`reply_policy` (see `_MCAST_REPLY_POLICIES`) decides which replies are sent: with "none"
+		handlers never reply, and with "aggregated" handlers do not reply themselves, and instead the
+		server sends each source one summary of the requests it processed (see `flush_replies`) every
+		`reply_interval` seconds.
+
+		The serving loop (see `serve_forever`) also waits on a wakeup socket, so `shutdown` stops it
+		within milliseconds, instead of after the next poll interval, and without helper threads.
+
+		When a `control_address` (host, port) is given, the server also binds a UDP control channel
+		there, for the administrative commands of `_MCAST_CONTROL_OPCODES` (sent with `control`),
+		in a compact binary format. Control datagrams never reach the handlers. Bind the control
+		channel to a loopback address, as its commands are not authenticated.
+
+		Handlers only check payloads for the legacy in-band "STOP" command (a payload of exactly
+		"STOP", see `is_stop_payload`) when `payload_commands` is True. It defaults to True only
+		without a control channel, so servers with one never look for commands in payloads.
+
+		When `groups` are given, the server serves all of them with one socket: it binds to the
+		wildcard address (on the port of `server_address`), joins every group, and enables
+		`IP_PKTINFO`, so requests are handed to handlers as `McastRequest` tuples carrying the
+		`group` each datagram was sent to (see `HearUDPHandler.datagram`). Groups may then be added
+		and dropped while serving, without rebinding, through `memberships`.
+
+		The `sources` and `blocked_sources` lists make the kernel filter senders before their
+		datagrams ever reach the server (see `multicast.recv.joinstep`).
+
+		When a `rate_limit` is given, each source may send at most `rate_limit` datagrams per
+		second (in bursts of up to `rate_burst`); `verify_request` drops the excess before any
+		handler is created, and counts it in `rate_limited`. The sources are tracked by
+		`rate_limiter`, a `SourceRateLimiter` of at most `rate_sources` sources, which also counts
+		the drops of each source. Without a `rate_limit`, `rate_limiter` is None, and requests skip
+		the limiter entirely.
+
+		Args:
+			server_address (tuple): The (group, port) to bind to.
+			RequestHandlerClass (type): The request handler class to use.
+			bind_and_activate (bool): Whether to bind and activate on init. Defaults to True.
+			persistent (bool): Whether to keep the socket across requests. Defaults to True.
+			drain_limit (int): Maximum datagrams read per wakeup. Defaults to 1 (no draining).
+			binary (bool): Whether handlers should treat payloads as raw bytes, without text
+				transcoding. Defaults to False.
+			timestamps (bool): Whether to enable kernel receive timestamps. Defaults to False.
+			reuse_port (bool): Whether to share the port with other servers. Defaults to False.
+			shard (tuple): The (index, count) of the multicast sources to process, see
+				`verify_request`. Defaults to None (all).
+			reply_policy (str): Which replies to send. Defaults to "per-message".
+			reply_interval (float): Seconds between aggregated replies. Defaults to 1.0.
+			control_address (tuple): The (host, port) of the control channel. Defaults to None.
+			payload_commands (bool): Whether "STOP" payloads stop the server. Defaults to None
+				(True without a control channel, otherwise False).
+			groups (list): The multicast groups to serve on one wildcard socket. Defaults to None
+				(only join the group of `server_address`).
+			sources (list): Only receive from these senders. Defaults to None (MULTICAST_SOURCES).
+			blocked_sources (list): Block these senders. Defaults to None
+				(MULTICAST_BLOCKED_SOURCES).
+			rate_limit (float): Datagrams per second per source. Defaults to None (unlimited).
+			rate_burst (float): Datagrams per source at once. Defaults to None (the rate limit).
+			rate_sources (int): Most sources rate limited at once. Defaults to 1024.
+
 		Returns:
 			None
 
+		Raises:
+			ValueError: If the shard is not an (index, count) tuple with 0 <= index < count, the
+				reply policy is unknown, or the rate limit is not positive.
+
 		Minimal Acceptance Testing:
 
 		First set up test fixtures by importing multicast.
@@ -324,13 +847,157 @@ def __init__(
 			>>> server.server_close()  # Clean up
 			>>>
 
+		Testcase 2: Server initialization with persistent mode.
+			A: Test that servers are persistent by default.
+			B: Test that the ephemeral mode can still be selected.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None)
+			>>> server.persistent
+			True
+			>>> server.server_close()  # Clean up
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None, persistent=False)
+			>>> server.persistent
+			False
+			>>> server.server_close()  # Clean up
+			>>>
+
+		Testcase 3: Server initialization with drain mode.
+			A: Test that drain mode is disabled by default.
+			B: Test that the drain limit is never less than one.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None)
+			>>> server.drain_limit
+			1
+			>>> server.server_close()  # Clean up
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None, drain_limit=0)
+			>>> server.drain_limit
+			1
+			>>> server.server_close()  # Clean up
+			>>>
+
+		Testcase 4: Server initialization with drop accounting.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None)
+			>>> (server.drops.total, server.drops.interval())
+			(0, 0)
+			>>> server.server_close()  # Clean up
+			>>>
+
+		Testcase 5: Server initialization with a shard.
+			A: Test that servers process every source by default.
+			B: Test that invalid shards are rejected.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None)
+			>>> (server.reuse_port, server.shard, server.accepted, server.filtered)
+			(False, None, 0, 0)
+			>>> server.server_close()  # Clean up
+			>>> multicast.hear.McastServer(
+			... 	('224.0.0.1', 0), None, shard=(2, 2),
+			... )  #doctest: +IGNORE_EXCEPTION_DETAIL
+			Traceback (most recent call last):
+			ValueError: [CWE-20] Invalid shard: (2, 2).
+			>>>
+
+		Testcase 6: Server initialization with a control channel.
+			A: Test that payload commands are enabled without a control channel, unless disabled.
+			B: Test that the control channel is bound to the given address.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None)
+			>>> (server.control_socket, server.payload_commands)
+			(None, True)
+			>>> server.server_close()  # Clean up
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None, payload_commands=False)
+			>>> server.payload_commands
+			False
+			>>> server.server_close()  # Clean up
+			>>> server = multicast.hear.McastServer(
+			... 	('224.0.0.1', 0), None, control_address=('127.0.0.1', 0),
+			... )
+			>>> (server.control_socket.getsockname()[0], server.payload_commands)
+			('127.0.0.1', False)
+			>>> server.server_close()  # Clean up
+			>>>
+
+		Testcase 7: Server initialization with several groups.
+
+			>>> server = multicast.hear.McastServer(
+			... 	('224.0.0.1', 0), None, groups=['224.0.0.1', '224.0.0.2'],
+			... )
+			>>> (server.groups, server.socket.getsockname()[0])
+			(['224.0.0.1', '224.0.0.2'], '0.0.0.0')
+			>>> server.server_close()  # Clean up
+			>>>
+
 		"""
+		if reply_policy not in _MCAST_REPLY_POLICIES:
+			raise ValueError(f"[CWE-20] Unknown reply policy: {reply_policy}.")
+		self.reply_policy = reply_policy
+		self.reply_interval = max(0.0, float(reply_interval))
+		self._pending_replies = {}
+		self._next_flush = time.monotonic() + self.reply_interval
+		if shard is not None:
+			(index, count) = shard
+			if not 0 <= int(index) < int(count):
+				raise ValueError(f"[CWE-20] Invalid shard: {shard}.")
+			shard = (int(index), int(count))
+		self.shard = shard
+		self.reuse_port = bool(reuse_port)
+		self.accepted = 0
+		self.filtered = 0
+		self.rate_limited = 0
+		self._reply_sender = None
+		self._reply_lock = threading.Lock()
+		self._wakeup_recv = None
+		self._wakeup_send = None
+		self._shutdown_request = False
+		self._serving_ident = None
+		self._is_shut_down = threading.Event()
+		self.paused = False
+		self.control_socket = None
+		if payload_commands is None:
+			payload_commands = control_address is None
+		self.payload_commands = bool(payload_commands)
+		self.drops = multicast.skt.DropCounter()
+		self.timestamps = bool(timestamps)
+		self.persistent = bool(persistent)
+		self.drain_limit = max(1, int(drain_limit))
+		self._drain_buffer = None
+		self.binary = bool(binary)
+		self.groups = list(dict.fromkeys(groups)) if groups else None
+		self._memberships = None
+		self.sources = sources
+		self.blocked_sources = blocked_sources
+		self.rate_limiter = None
+		if rate_limit is not None:
+			self.rate_limiter = SourceRateLimiter(rate_limit, rate_burst, rate_sources)
 		logger_name = server_address[0] if server_address and len(server_address) > 0 else None
 		if logger_name:  # pragma: no branch
 			self.__logger = logging.getLogger(f"{self.__log_handle__}.{logger_name}")
 		else:
 			self.__logger = logging.getLogger(f"{self.__log_handle__}")
+		if self.groups:
+			server_address = (_MCAST_WILDCARD_ADDRESS, server_address[1])
 		super().__init__(server_address, RequestHandlerClass, bind_and_activate)
+		# only open the wakeup and control sockets once the server socket is bound, so a failed
+		# bind leaks neither; and close everything again if they fail to open
+		try:
+			self._open_local_sockets(control_address)
+		except OSError:
+			self.server_close()
+			raise
+
+	def _open_local_sockets(self, control_address) -> None:
+		"""Open the non-blocking wakeup socket pair, and the control socket if it has an address.
+
+		This is a helper method and should NOT be called directly.
+		"""
+		(self._wakeup_recv, self._wakeup_send) = _socket.socketpair()
+		self._wakeup_recv.setblocking(False)
+		self._wakeup_send.setblocking(False)
+		if control_address is not None:
+			self.control_socket = _socket.socket(_socket.AF_INET, _socket.SOCK_DGRAM)
+			self.control_socket.bind(control_address)
+			self.control_socket.setblocking(False)
 
 	def _sync_logger(self) -> None:
 		"""Synchronize the logger instance with the bound socket address.
@@ -500,100 +1167,1073 @@ def server_activate(self):
 			self.open_for_request()
 		super(McastServer, self).server_activate()
 
-	def open_for_request(self):
+	def serve_forever(self, poll_interval: float = 0.5) -> None:
 		"""
-		Prepare the server to accept requests.
+		Handle requests until `shutdown` is called.
 
-		Overrides the base class method to set up a new listening UDP socket before the
-		server starts processing requests.
+		Overrides the base class method to also wait on a wakeup socket, which `shutdown` writes
+		to, so the loop stops right away, instead of at the end of the current poll interval.
+		The loop also waits on the control channel, if any (see `handle_control`), and stops
+		watching the data socket while `paused`.
 
-		UDP Sockets are considered ephemeral.
-		Sequentially, the old socket is recycled, or replaced, yielding a fungable socket, with the
-		same port and bound ip, which is then used to join the same multicast group(s), at which
-		point the new socket has transparently replaced the old socket.
+		The `poll_interval` now only sets how often `service_actions` runs while idle: a positive
+		number of seconds, 0 to busy-poll, or None to run purely event-driven (only waking up for
+		requests and shutdown; with aggregated replies, at least every `reply_interval`).
+
+		Args:
+			poll_interval (float, optional): Seconds between idle wakeups. Defaults to 0.5.
+
+		Returns:
+			None
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>> import threading
+			>>> import time
+			>>>
+
+		Testcase 0: shutdown should stop an event-driven server within milliseconds.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None)
+			>>> tst_thread = threading.Thread(target=server.serve_forever, args=(None,))
+			>>> tst_thread.start()
+			>>> time.sleep(0.05)
+			>>> tst_start = time.monotonic()
+			>>> server.shutdown()
+			>>> (time.monotonic() - tst_start) < 0.25
+			True
+			>>> tst_thread.join(1)
+			>>> tst_thread.is_alive()
+			False
+			>>> server.server_close()  # Clean up
+			>>>
+
+		"""
+		timeout = poll_interval
+		if timeout is None and self.reply_policy == "aggregated":
+			timeout = self.reply_interval
+		self._is_shut_down.clear()
+		self._serving_ident = threading.get_ident()
+		try:
+			with _ServerSelector() as selector:
+				selector.register(self._wakeup_recv, selectors.EVENT_READ)
+				if self.control_socket is not None:
+					selector.register(self.control_socket, selectors.EVENT_READ)
+				watched = None
+				while not self._shutdown_request:
+					watched = self._watch_data_socket(selector, watched)
+					ready = selector.select(timeout)
+					if self._shutdown_request:
+						break
+					self._handle_ready(ready)
+					self.service_actions()
+		finally:
+			self._shutdown_request = False
+			self._serving_ident = None
+			self._is_shut_down.set()
+
+	def _watch_data_socket(self, selector, watched):
+		"""
+		Keep the serving loop's selector watching the current data socket, unless paused.
+
+		This is a helper method and should NOT be called directly.
+
+		Args:
+			selector (selectors.BaseSelector): The serving loop's selector.
+			watched (socket.socket): The data socket the selector watches, or None.
+
+		Returns:
+			socket.socket: The data socket the selector now watches, or None while paused.
+		"""
+		wanted = None if self.paused else self.socket
+		if watched is not wanted:  # paused, resumed, or the socket was replaced
+			if watched is not None:
+				selector.unregister(watched)
+			if wanted is not None:
+				selector.register(wanted, selectors.EVENT_READ)
+		return wanted
+
+	def _handle_ready(self, ready: list) -> None:
+		"""
+		Handle the sockets the serving loop's selector found ready.
+
+		This is a helper method and should NOT be called directly.
+
+		Args:
+			ready (list): The (key, events) pairs returned by the selector.
+		"""
+		for (key, _) in ready:
+			if key.fileobj is self._wakeup_recv:
+				self._drain_wakeups()
+			elif key.fileobj is self.control_socket:
+				self.handle_control()
+			elif key.fileobj is self.socket and not self.paused:
+				self._handle_request_noblock()
+
+	def _drain_wakeups(self) -> None:
+		"""Discard the bytes written to the wakeup socket."""
+		try:
+			while self._wakeup_recv.recv(4096):
+				pass
+		except OSError:  # BlockingIOError once drained
+			pass
+
+	def wakeup(self) -> None:
+		"""
+		Wake the serving loop up, e.g. to run `service_actions` early.
+
+		Safe to call from any thread, or from a signal handler.
+
+		Returns:
+			None
+		"""
+		try:
+			self._wakeup_send.send(b"\0")
+		except OSError:  # full (a wakeup is pending anyway), or closed
+			pass
+
+	def shutdown(self, wait: bool = True) -> None:
+		"""
+		Stop the `serve_forever` loop.
+
+		Overrides the base class method to wake the loop up immediately (see `wakeup`). Like the
+		base class method, blocks until the loop has stopped, unless `wait` is False, or it is
+		called from the serving thread itself (e.g., by a handler), where waiting would deadlock.
+
+		Args:
+			wait (bool): Whether to wait for the loop to stop. Defaults to True.
+
+		Returns:
+			None
+		"""
+		self._shutdown_request = True
+		self.wakeup()
+		if wait and self._serving_ident != threading.get_ident():
+			self._is_shut_down.wait()
+
+	def handle_control(self) -> None:
+		"""
+		Read and execute the pending commands of the control channel.
+
+		Each command is one datagram in the `_MCAST_CONTROL_REQUEST` format, and is answered with one
+		`_MCAST_CONTROL_REPLY` (followed by a `_MCAST_CONTROL_STATS` body for "stats"), with the
+		status 1 for unknown opcodes. Datagrams without the control magic are ignored. Each opcode
+		is executed by the `_control_<command>` method named in `_CONTROL_HANDLERS`.
+
+		Returns:
+			None
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>> import threading
+			>>>
+
+		Testcase 0: The control channel reports stats, pauses, resumes, and stops the server.
+
+			>>> server = multicast.hear.McastServer(
+			... 	('224.0.0.1', 0), None, control_address=('127.0.0.1', 0),
+			... )
+			>>> tst_address = server.control_socket.getsockname()
+			>>> tst_thread = threading.Thread(target=server.serve_forever, args=(None,))
+			>>> tst_thread.start()
+			>>> multicast.hear.control(tst_address, "stats")["accepted"]
+			0
+			>>> multicast.hear.control(tst_address, "pause")["status"], server.paused
+			(0, True)
+			>>> multicast.hear.control(tst_address, "resume")["status"], server.paused
+			(0, False)
+			>>> multicast.hear.control(tst_address, "stop")["status"]
+			0
+			>>> tst_thread.join(1)
+			>>> tst_thread.is_alive()
+			False
+			>>> server.server_close()  # Clean up
+			>>>
+
+		"""
+		while True:
+			try:
+				(data, address) = self.control_socket.recvfrom(_MCAST_CONTROL_REQUEST.size)
+			except OSError:  # BlockingIOError once drained
+				return
+			if len(data) != _MCAST_CONTROL_REQUEST.size:
+				continue
+			(magic, opcode) = _MCAST_CONTROL_REQUEST.unpack(data)
+			if magic != _MCAST_CONTROL_MAGIC:
+				continue
+			handler = self._CONTROL_HANDLERS.get(opcode)
+			(status, body) = (1, b"") if handler is None else (0, getattr(self, handler)())
+			self.logger.info(
+				"control opcode %d from %s, status %d",  # lazy formatting to avoid PYL-W1203
+				opcode, str(address), status,
+			)
+			try:
+				self.control_socket.sendto(
+					_MCAST_CONTROL_REPLY.pack(_MCAST_CONTROL_MAGIC, opcode, status) + body, address,
+				)
+			except OSError:  # the client is gone
+				pass
+
+	_CONTROL_HANDLERS: dict = {
+		opcode: f"_control_{command}" for (command, opcode) in _MCAST_CONTROL_OPCODES.items()
+	}
+	"""The name of the method executing each control opcode, see `handle_control`."""
+
+	def _control_stop(self) -> bytes:
+		"""Execute the "stop" control command, returning the empty reply body."""
+		self.shutdown(wait=False)
+		return b""
+
+	def _control_stats(self) -> bytes:
+		"""Execute the "stats" control command, returning the `_MCAST_CONTROL_STATS` body."""
+		return _MCAST_CONTROL_STATS.pack(
+			self.accepted, self.filtered, self.drops.total, self.rate_limited, self.paused,
+		)
+
+	def _control_reload(self) -> bytes:
+		"""Execute the "reload" control command, returning the empty reply body."""
+		self.reload()
+		return b""
+
+	def _control_pause(self) -> bytes:
+		"""Execute the "pause" control command, returning the empty reply body."""
+		self.paused = True
+		return b""
+
+	def _control_resume(self) -> bytes:
+		"""Execute the "resume" control command, returning the empty reply body."""
+		self.paused = False
+		return b""
+
+	def reload(self) -> None:
+		"""
+		Re-create and re-join the data socket, and re-apply the socket tuning from the environment.
+
+		Returns:
+			None
+		"""
+		self.logger.info("reload")
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore", category=ResourceWarning)
+			self.open_for_request()
+		multicast.skt.tuneSocket(self.socket, multicast.env.load_tuning())
+
+	def open_for_request(self):
+		"""
+		Prepare the server to accept requests.
+
+		Overrides the base class method to set up a new listening UDP socket before the
+		server starts processing requests.
+
+		UDP Sockets are considered ephemeral.
+		Sequentially, the old socket is recycled, or replaced, yielding a fungable socket, with the
+		same port and bound ip, which is then used to join the same multicast group(s), at which
+		point the new socket has transparently replaced the old socket. Servers with several
+		`groups` join all of them, and enable `IP_PKTINFO` on the new socket.
+
+		Returns:
+			None
+		"""
+		self.logger.info("open_request")
+		# enter critical section
+		old_socket = self.socket
+		(tmp_addr, tmp_prt) = old_socket.getsockname()
+		multicast.endSocket(old_socket)
+		new_socket = multicast.genSocket()
+		if self.reuse_port:
+			multicast.skt.enableReusePort(new_socket)
+		joined = self.groups or [tmp_addr]
+		self.socket = recv.joinstep(
+			joined, tmp_prt, None, tmp_addr, new_socket, self.sources, self.blocked_sources,
+		)
+		if self._memberships is not None:  # keep the memberships changed while serving
+			self._memberships.attach(self.socket, joined)
+		self.drops.enable(self.socket)
+		if self.groups:
+			multicast.skt.enablePacketInfo(self.socket)
+		if self.timestamps:
+			multicast.skt.enableTimestamps(self.socket)
+		old_socket = None  # release for GC
+		# exit critical section
+
+	@property
+	def memberships(self) -> recv.MembershipManager:
+		"""
+		The live group memberships of the server's socket (see `multicast.recv.MembershipManager`).
+
+		Created on first access, counting one reference to each group the server joined. The
+		memberships survive the socket being replaced (see `open_for_request`).
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>>
+
+		Testcase 0: Groups may be added to a multi-group server while it is bound.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None, groups=['224.0.0.1'])
+			>>> server.memberships.join('224.0.0.2')
+			True
+			>>> server.memberships.groups
+			['224.0.0.1', '224.0.0.2']
+			>>> server.open_for_request()
+			>>> server.memberships.groups
+			['224.0.0.1', '224.0.0.2']
+			>>> server.server_close()  # Clean up
+			>>>
+
+		"""
+		if self._memberships is None:
+			self._memberships = recv.MembershipManager(
+				self, self.groups or [self.socket.getsockname()[0]],
+			)
+		return self._memberships
+
+	def server_bind(self):
+		"""
+		Bind the server to the specified address.
+
+		Overrides the base class method to handle multicast group binding.
+
+		Returns:
+			None
+		"""
+		self.logger.info("server_bind")
+		if self.reuse_port:
+			multicast.skt.enableReusePort(self.socket)
+		super(McastServer, self).server_bind()
+		self._sync_logger()
+		# enter critical section
+		self.logger.info(
+			"bound on: %s",  # lazy formatting to avoid PYL-W1203
+			str(self.socket.getsockname()),
+		)
+		# exit critical section
+
+	def close_request(self, request):
+		"""
+		Clean up after handling a request.
+
+		Overrides the base class method to close the request as normal. When the server is NOT
+		persistent, also calls open_for_request to close and regenerate the UDP socket (leaving
+		and re-joining the multicast group in the process). Persistent servers keep their bound
+		and joined socket, so no datagrams are lost between requests.
+
+		Args:
+			request: The request object to close.
+
+		Returns:
+			None
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>>
+
+		Testcase 0: Persistent servers keep the same socket after a request.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None)
+			>>> tst_sock = server.socket
+			>>> server.close_request((b"data", tst_sock))
+			>>> server.socket is tst_sock
+			True
+			>>> server.server_close()  # Clean up
+			>>>
+
+		Testcase 1: Ephemeral servers replace the socket after a request.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None, persistent=False)
+			>>> tst_sock = server.socket
+			>>> server.close_request((b"data", tst_sock))
+			>>> server.socket is tst_sock
+			False
+			>>> server.server_close()  # Clean up
+			>>>
+
+		"""
+		if not self.persistent:
+			self.logger.info("close_request")
+			with warnings.catch_warnings():
+				warnings.simplefilter("ignore", category=ResourceWarning)
+				self.open_for_request()
+		super(McastServer, self).close_request(request)
+
+	def verify_request(self, request, client_address) -> bool:
+		"""
+		Decide whether to process a request.
+
+		Overrides the base class method to only accept the multicast requests of sources in this
+		server's `shard` (when set), counting both the `accepted` and the `filtered` requests, and
+		then to
+		drop the requests of sources over their rate limit (see `rate_limiter`), counted in
+		`rate_limited`, before any handler is created for them. Only datagrams sent to a multicast
+		group are sharded, as the kernel copies those to every server sharing the port, but already
+		balances unicast datagrams across them.
+
+		Args:
+			request: The request to verify.
+			client_address: The (host, port) of the request's source.
+
+		Returns:
+			bool: True if the request should be processed, otherwise False.
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>>
+
+		Testcase 0: Each source should be verified by exactly one shard.
+
+			>>> servers = [
+			... 	multicast.hear.McastServer(('224.0.0.1', 0), None, shard=(index, 3))
+			... 	for index in range(3)
+			... ]
+			>>> [
+			... 	sum(srv.verify_request((b"data", None), ("192.0.2.1", port)) for srv in servers)
+			... 	for port in range(50000, 50010)
+			... ]
+			[1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+			>>> sum(srv.accepted for srv in servers), sum(srv.filtered for srv in servers)
+			(10, 20)
+			>>> for srv in servers:
+			... 	srv.server_close()  # Clean up
+			>>>
+
+		Testcase 1: Sources over their rate limit should be dropped.
+
+			>>> server = multicast.hear.McastServer(
+			... 	('224.0.0.1', 0), None, rate_limit=1, rate_burst=2,
+			... )
+			>>> [server.verify_request((b"data", None), ("192.0.2.1", 59595)) for _ in range(3)]
+			[True, True, False]
+			>>> tst_source = ("192.0.2.1", 59595)
+			>>> (server.accepted, server.rate_limited, server.rate_limiter.drops(tst_source))
+			(2, 1, 1)
+			>>> server.server_close()  # Clean up
+			>>>
+
+		Testcase 2: Unicast requests should be verified by every shard.
+
+			>>> servers = [
+			... 	multicast.hear.McastServer(('224.0.0.1', 0), None, shard=(index, 3))
+			... 	for index in range(3)
+			... ]
+			>>> tst_requests = [
+			... 	multicast.hear.McastRequest(b"data", None, None, group)
+			... 	for group in ("127.0.0.1", "224.0.0.2")
+			... ]
+			>>> [
+			... 	sum(srv.verify_request(request, ("192.0.2.1", 59595)) for srv in servers)
+			... 	for request in tst_requests
+			... ]
+			[3, 1]
+			>>> for srv in servers:
+			... 	srv.server_close()  # Clean up
+			>>>
+
+		"""
+		if self.shard is not None and self._in_other_shard(request, client_address):
+			self.filtered += 1
+			return False
+		if self.rate_limiter is not None and not self.rate_limiter.allow(client_address):
+			self.rate_limited += 1
+			return False
+		self.accepted += 1
+		return super(McastServer, self).verify_request(request, client_address)
+
+	def _in_other_shard(self, request, client_address) -> bool:
+		"""
+		Check whether a request is a multicast datagram from a source of another shard.
+
+		This is a helper method and should NOT be called directly.
+		"""
+		destination = getattr(request, "group", None) or self.server_address[0]
+		if not _is_multicast_destination(destination):
+			return False  # the kernel already balanced unicast datagrams across the shards
+		return shard_of(client_address, self.shard[1]) != self.shard[0]
+
+	def get_request(self) -> tuple:
+		"""
+		Receive one request from the socket.
+
+		Overrides the base class method to update the kernel's drop counter (see `drops`) from the
+		ancillary data of each datagram, and when `timestamps` are enabled (or the server joined
+		several `groups`), to return the request as a `McastRequest` with the kernel arrival time
+		(or the destination group).
+
+		Returns:
+			tuple: The ((data, socket), client_address) of the request.
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>> import time
+			>>>
+
+		Testcase 0: get_request should return the kernel arrival time with timestamps enabled.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None, timestamps=True)
+			>>> tst_port = server.socket.getsockname()[1]
+			>>> with multicast.send.McastSender('224.0.0.1', tst_port) as tst_sender:
+			... 	_ = tst_sender.send(b"stamped")
+			>>> (tst_request, _) = server.get_request()
+			>>> tst_request[0]
+			b'stamped'
+			>>> 0 < tst_request.arrival_ns <= time.time_ns()
+			True
+			>>> server.server_close()  # Clean up
+			>>>
+
+		"""
+		if not self.timestamps and not self.groups:
+			(data, client_addr) = self.drops.recvfrom(self.socket, self.max_packet_size)
+			return (data, self.socket), client_addr
+		stamps = [] if self.timestamps else None
+		destinations = [] if self.groups else None
+		(data, client_addr) = multicast.skt.recvfrom_meta(
+			self.socket, self.max_packet_size, self.drops, stamps, destinations,
+		)
+		return McastRequest(
+			data, self.socket, stamps[0] if stamps else None,
+			destinations[0] if destinations else None,
+		), client_addr
+
+	def get_batch(self) -> list:
+		"""
+		Receive a batch of requests, once the socket is readable.
+
+		Receives the first request as usual (see `get_request`), and then reads any further
+		already-queued datagrams without blocking, until the kernel reports it would block
+		(`EAGAIN`) or `drain_limit` requests were read in total.
+
+		On Linux, the further datagrams are read with a single `recvmmsg` system call, into a
+		buffer array preallocated once per server. Elsewhere this transparently falls back to one
+		non-blocking `recvfrom` per datagram. The `recvmmsg` reads do not update `drops`, but as the
+		kernel's counter is cumulative, the next `get_request` catches up. Servers with `timestamps`
+		enabled, or several `groups`, always use the per-datagram reads, which carry the arrival
+		times and destination groups.
+
+		Returns:
+			list: A non-empty list of (request, client_address) tuples.
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>>
+
+		Testcase 0: get_batch should read every queued datagram up to the drain limit.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None, drain_limit=2)
+			>>> tst_port = server.socket.getsockname()[1]
+			>>> with multicast.send.McastSender('224.0.0.1', tst_port) as tst_sender:
+			... 	for tst_msg in (b"one", b"two", b"three"):
+			... 		_ = tst_sender.send(tst_msg)
+			>>> [request[0] for (request, _) in server.get_batch()]
+			[b'one', b'two']
+			>>> [request[0] for (request, _) in server.get_batch()]
+			[b'three']
+			>>> server.server_close()  # Clean up
+			>>>
+
+		"""
+		batch = [self.get_request()]
+		can_drain = self.drain_limit > 1 and not self.timestamps and not self.groups
+		if can_drain and multicast.skt.has_mmsg():
+			if self._drain_buffer is None:
+				self._drain_buffer = multicast.skt.MMsgBuffer(
+					self.drain_limit - 1, self.max_packet_size, with_address=True,
+				)
+			received = self._drain_buffer.recv(self.socket)
+			batch.extend(
+				((data, self.socket), client_addr) for (data, client_addr) in zip(
+					self._drain_buffer.payloads(received), self._drain_buffer.addresses(received),
+				)
+			)
+			return batch
+		timeout = self.socket.gettimeout()
+		self.socket.settimeout(0.0)
+		try:
+			while len(batch) < self.drain_limit:
+				try:
+					batch.append(self.get_request())
+				except BlockingIOError:
+					break
+		finally:
+			self.socket.settimeout(timeout)
+		return batch
+
+	def process_batch(self, batch: list) -> None:
+		"""
+		Process a batch of requests, as read by `get_batch`.
+
+		By default each request is verified, processed, and shut down in order, exactly as
+		`socketserver` does for a single request (including `handle_error` on failures). Subclasses
+		may override this to handle the whole list at once.
+
+		Args:
+			batch (list): A list of (request, client_address) tuples.
+
+		Returns:
+			None
+		"""
+		for (request, client_address) in batch:
+			if self.verify_request(request, client_address):
+				try:
+					self.process_request(request, client_address)
+				except Exception:
+					self.handle_error(request, client_address)
+					self.shutdown_request(request)
+				except BaseException:
+					self.shutdown_request(request)
+					raise
+			else:
+				self.shutdown_request(request)
+
+	def _handle_request_noblock(self) -> None:
+		"""
+		Handle one wakeup of the serving loop.
+
+		Overrides the base class method to read and process a whole batch of requests when in
+		drain mode (`drain_limit` greater than one). Otherwise forwards the call to super.
+
+		Returns:
+			None
+		"""
+		if self.drain_limit <= 1:
+			super(McastServer, self)._handle_request_noblock()
+			return
+		try:
+			batch = self.get_batch()
+		except OSError:
+			return
+		self.process_batch(batch)
+
+	def handle_error(self, request, client_address):
+		"""
+		Handle errors that occur during request processing.
+
+		Overrides the base class method to handle "STOP" requests (see `is_stop_payload`), when
+		`payload_commands` are enabled, resulting in a graceful server shutdown (requested with
+		`shutdown(wait=False)`, so no thread is needed to avoid waiting on the serving loop).
+		Otherwise forwards the call to super, which reports the error, and keeps serving.
+
+		Args:
+			request: The request being handled when the error occurred.
+			client_address: The client address associated with the request.
+
+		Returns:
+			None
+		"""
+		self.logger.info("handle_error")
+		if self.payload_commands and request is not None and is_stop_payload(request[0]):
+			self.shutdown(wait=False)
+		else:
+			super(McastServer, self).handle_error(request, client_address)
+
+	def should_reply(self, client_address: tuple, nbytes: int) -> bool:
+		"""
+		Apply the reply policy to a request a handler processed.
+
+		With the "aggregated" policy, the request is counted towards its source's next summary
+		reply (see `flush_replies`).
+
+		Args:
+			client_address (tuple): The (host, port) source of the request.
+			nbytes (int): The size of the request's payload.
+
+		Returns:
+			bool: True if the handler should send its own reply to the request, otherwise False.
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>>
+
+		Testcase 0: Only the per-message policy lets handlers reply.
+
+			>>> [
+			... 	multicast.hear.McastServer(
+			... 		('224.0.0.1', 0), None, bind_and_activate=False, reply_policy=policy,
+			... 	).should_reply(('192.0.2.1', 59595), 4)
+			... 	for policy in multicast.hear._MCAST_REPLY_POLICIES
+			... ]
+			[False, True, False]
+			>>>
+
+		Testcase 1: Unknown policies are rejected.
+
+			>>> multicast.hear.McastServer(
+			... 	('224.0.0.1', 0), None, reply_policy="all",
+			... )  #doctest: +IGNORE_EXCEPTION_DETAIL
+			Traceback (most recent call last):
+			ValueError: [CWE-20] Unknown reply policy: all.
+			>>>
+
+		"""
+		if self.reply_policy == "per-message":
+			return True
+		if self.reply_policy == "aggregated":
+			source = tuple(client_address)
+			with self._reply_lock:
+				pending = self._pending_replies.get(source)
+				if pending is None:
+					self._pending_replies[source] = [1, nbytes]
+				else:
+					pending[0] += 1
+					pending[1] += nbytes
+		return False
+
+	def flush_replies(self) -> int:
+		"""
+		Send each source one summary reply for the requests counted since the last flush.
+
+		Each summary reads `HEAR [ ACK <count> datagrams <nbytes> bytes SAID <source> ] from <me>`,
+		and is sent with `send_reply`.
+
+		Returns:
+			int: The number of summary replies sent.
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>>
+
+		Testcase 0: Requests from one source are summarized in one reply.
+
+			>>> server = multicast.hear.McastServer(
+			... 	('224.0.0.1', 0), None, reply_policy="aggregated",
+			... )
+			>>> tst_port = server.socket.getsockname()[1]
+			>>> for tst_size in (3, 4, 5):
+			... 	_ = server.should_reply(('224.0.0.1', tst_port), tst_size)
+			>>> server.flush_replies()
+			1
+			>>> server.socket.recv(1024)  #doctest: -DONT_ACCEPT_BLANKLINE, +ELLIPSIS
+			b"HEAR [ ACK 3 datagrams 12 bytes SAID ('224.0.0.1', ...) ] from 224.0.0.1"
+			>>> server.flush_replies()
+			0
+			>>> server.server_close()  # Clean up
+			>>>
+
+		"""
+		with self._reply_lock:
+			(pending, self._pending_replies) = (self._pending_replies, {})
+		if not pending:
+			return 0
+		me = str(self.server_address[0])
+		sent = 0
+		for (source, (count, nbytes)) in pending.items():
+			try:
+				self.send_reply(
+					f"HEAR [ ACK {count} datagrams {nbytes} bytes SAID {source} ] from {me}", source,
+				)
+				sent += 1
+			except OSError as _cause:
+				self.logger.debug(
+					"Failed to acknowledge %s: %s",  # lazy formatting to avoid PYL-W1203
+					str(source), _cause,
+				)
+		return sent
+
+	def service_actions(self) -> None:
+		"""
+		Perform periodic work, once each time around the serving loop.
+
+		Overrides the base class method to send the aggregated replies (see `flush_replies`) every
+		`reply_interval` seconds, when the reply policy is "aggregated".
+
+		Returns:
+			None
+		"""
+		if self.reply_policy == "aggregated" and time.monotonic() >= self._next_flush:
+			self._next_flush = time.monotonic() + self.reply_interval
+			self.flush_replies()
+		super(McastServer, self).service_actions()
+
+	@property
+	def reply_sender(self) -> send.McastSender:
+		"""
+		The long-lived sender that `send_reply` uses, opened on first access.
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>>
+
+		Testcase 0: The reply sender should be opened once, and closed with the server.
+
+			>>> server = multicast.hear.McastServer(('224.0.0.1', 0), None)
+			>>> tst_sender = server.reply_sender
+			>>> tst_sender.is_open and server.reply_sender is tst_sender
+			True
+			>>> server.server_close()  # Clean up
+			>>> tst_sender.is_open
+			False
+			>>>
+
+		"""
+		if self._reply_sender is None:
+			with self._reply_lock:
+				if self._reply_sender is None:
+					self._reply_sender = send.McastSender().open()
+		return self._reply_sender
+
+	def send_reply(self, data, client_address: tuple) -> int:
+		"""
+		Send a reply datagram to a client, over the server's long-lived reply socket.
+
+		Costs a single `sendto`, without creating a socket per reply. Safe to call from several
+		handler threads at once (e.g., from a `McastThreadPoolServer`).
+
+		Args:
+			data (str or bytes-like): The reply. Text is encoded as UTF-8.
+			client_address (tuple): The (host, port) to reply to.
+
+		Returns:
+			int: The number of bytes sent.
+		"""
+		if isinstance(data, str):
+			data = data.encode("utf8")
+		return self.reply_sender.send_to(data, client_address)
+
+	def server_close(self) -> None:
+		"""
+		Clean up the server.
+
+		Overrides the base class method to also send any pending aggregated replies, and then close
+		the reply socket (see `send_reply`).
+
+		Returns:
+			None
+		"""
+		if self.reply_policy == "aggregated" and self._pending_replies:
+			self.flush_replies()
+		with self._reply_lock:
+			if self._reply_sender is not None:
+				self._reply_sender.close()
+				self._reply_sender = None
+		for sock in (self._wakeup_send, self._wakeup_recv, self.control_socket):
+			if sock is not None:
+				sock.close()
+		super(McastServer, self).server_close()
+
+
+_MCAST_OVERFLOW_POLICIES: tuple = ("drop-newest", "drop-oldest", "block")
+"""The overflow policies of McastThreadPoolServer, for when its request queue is full."""
+
+
+class McastThreadPoolServer(McastServer):
+	"""
+	McastServer variant that handles requests on a fixed-size pool of worker threads.
+
+	The serving thread only reads datagrams, and puts them on a bounded queue, from which a
+	`concurrent.futures` pool of `workers` threads takes and handles them. So a slow handler no
+	longer stalls reception, and unlike `socketserver.ThreadingMixIn`, no thread is spawned per
+	request.
+
+	When the queue is full, the `overflow` policy decides what happens to a new request:
+		drop-newest -- The new request is dropped (the default).
+		drop-oldest -- The oldest queued request is dropped, to make room for the new one.
+		block -- The serving thread waits for room, leaving datagrams queued in the kernel.
+
+	The server is always persistent, as handlers may still use the socket on worker threads.
+
+	Attributes:
+		workers (int): The number of worker threads.
+		overflow (str): The overflow policy.
+		enqueued (int): The cumulative number of queued requests.
+		dropped (int): The cumulative number of requests dropped by the overflow policy.
+		peak_queue_depth (int): The highest number of requests ever waiting in the queue.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: McastThreadPoolServer should be a persistent McastServer with queue metrics.
+
+		>>> server = multicast.hear.McastThreadPoolServer(('224.0.0.1', 0), None, workers=2)
+		>>> isinstance(server, multicast.hear.McastServer)
+		True
+		>>> (server.workers, server.overflow, server.persistent)
+		(2, 'drop-newest', True)
+		>>> (server.queue_depth, server.peak_queue_depth, server.enqueued, server.dropped)
+		(0, 0, 0, 0)
+		>>> server.server_close()  # Clean up
+		>>>
+
+	Testcase 1: McastThreadPoolServer should reject unknown overflow policies.
+
+		>>> multicast.hear.McastThreadPoolServer(
+		... 	('224.0.0.1', 0), None, overflow="drop-all",
+		... )  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: [CWE-20] Unknown overflow policy: drop-all.
+		>>>
 
-		Returns:
-			None
-		"""
-		self.logger.info("open_request")
-		# enter critical section
-		old_socket = self.socket
-		(tmp_addr, tmp_prt) = old_socket.getsockname()
-		multicast.endSocket(old_socket)
-		self.socket = recv.joinstep([tmp_addr], tmp_prt, None, tmp_addr, multicast.genSocket())
-		old_socket = None  # release for GC
-		# exit critical section
+	"""
 
-	def server_bind(self):
+	__log_handle__ = """multicast.hear.McastThreadPoolServer"""  # skipcq: PYL-W0622
+	"""Names this server's Logger."""
+
+	def __init__(
+		self,
+		server_address: tuple,
+		RequestHandlerClass: type,
+		bind_and_activate: bool = True,
+		workers: int = 4,
+		queue_size: int = 1024,
+		overflow: str = "drop-newest",
+		drain_limit: int = 1,
+		binary: bool = False,
+		timestamps: bool = False,
+		reply_policy: str = "per-message",
+		reply_interval: float = 1.0,
+		**kwargs,
+	) -> None:
 		"""
-		Bind the server to the specified address.
+		Initialize a new instance of the McastThreadPoolServer, and start its workers.
 
-		Overrides the base class method to handle multicast group binding.
+		Args:
+			server_address (tuple): The (group, port) to bind to.
+			RequestHandlerClass (type): The request handler class to use.
+			bind_and_activate (bool): Whether to bind and activate on init. Defaults to True.
+			workers (int): The number of worker threads. Defaults to 4.
+			queue_size (int): The maximum number of requests waiting for a worker. Defaults to 1024.
+			overflow (str): The policy for when the queue is full. Defaults to "drop-newest".
+			drain_limit (int): Maximum datagrams read per wakeup. Defaults to 1 (no draining).
+			binary (bool): Whether handlers should treat payloads as raw bytes. Defaults to False.
+			timestamps (bool): Whether to enable kernel receive timestamps. Defaults to False.
+			reply_policy (str): Which replies to send. Defaults to "per-message".
+			reply_interval (float): Seconds between aggregated replies. Defaults to 1.0.
+			**kwargs: Further McastServer options (e.g., control_address, groups, sources,
+				blocked_sources or rate_limit), passed on as-is.
 
-		Returns:
-			None
+		Raises:
+			ValueError: If the overflow or the reply policy is unknown.
 		"""
-		self.logger.info("server_bind")
-		super(McastServer, self).server_bind()
-		self._sync_logger()
-		# enter critical section
-		self.logger.info(
-			"bound on: %s",  # lazy formatting to avoid PYL-W1203
-			str(self.socket.getsockname()),
+		if overflow not in _MCAST_OVERFLOW_POLICIES:
+			raise ValueError(f"[CWE-20] Unknown overflow policy: {overflow}.")
+		self.workers = max(1, int(workers))
+		self.overflow = overflow
+		self.enqueued = 0
+		self.dropped = 0
+		self.peak_queue_depth = 0
+		self._queue = queue.Queue(maxsize=max(1, int(queue_size)))
+		self._executor = None
+		super(McastThreadPoolServer, self).__init__(
+			server_address, RequestHandlerClass, bind_and_activate,
+			persistent=True, drain_limit=drain_limit, binary=binary, timestamps=timestamps,
+			reply_policy=reply_policy, reply_interval=reply_interval, **kwargs,
 		)
-		# exit critical section
+		self._executor = futures.ThreadPoolExecutor(
+			max_workers=self.workers, thread_name_prefix="McastWorker",
+		)
+		for _ in range(self.workers):
+			self._executor.submit(self._worker)
 
-	def close_request(self, request):
+	@property
+	def queue_depth(self) -> int:
+		"""The number of requests currently waiting for a worker."""
+		return self._queue.qsize()
+
+	def process_request(self, request, client_address) -> None:
 		"""
-		Clean up after handling a request.
+		Queue the request for the worker pool, applying the overflow policy when full.
 
-		Overrides the base class method to call open_for_request to close and regenerate the
-		UDP socket, in addition to closing the request as normal.
+		Overrides the base class method, which would handle the request on the serving thread.
 
 		Args:
-			request: The request object to close.
+			request: The request to queue.
+			client_address: The client address of the request.
 
 		Returns:
 			None
 		"""
-		self.logger.info("close_request")
-		with warnings.catch_warnings():
-			warnings.simplefilter("ignore", category=ResourceWarning)
-			self.open_for_request()
-		super(McastServer, self).close_request(request)
-
-	def handle_error(self, request, client_address):
-		"""
-		Handle errors that occur during request processing.
+		item = (request, client_address)
+		if self.overflow == "block":
+			self._queue.put(item)
+		else:
+			while True:
+				try:
+					self._queue.put_nowait(item)
+					break
+				except queue.Full:
+					if self.overflow == "drop-newest":
+						self._drop(request)
+						return
+				try:
+					(request_dropped, _) = self._queue.get_nowait()
+					self._queue.task_done()
+					self._drop(request_dropped)
+				except queue.Empty:  # pragma: no cover -- a worker took it meanwhile
+					pass
+		self.enqueued += 1
+		self.peak_queue_depth = max(self.peak_queue_depth, self._queue.qsize())
+
+	def _drop(self, request) -> None:
+		"""Count and release a request dropped by the overflow policy."""
+		self.dropped += 1
+		self.logger.debug(
+			"Request queue is full, dropped %d requests so far.",  # lazy formatting to avoid PYL-W1203
+			self.dropped,
+		)
+		self.shutdown_request(request)
 
-		Overrides the base class method to handle requests with STOP in them,
-		resulting in a graceful server shutdown. Otherwise forwards the call to super.
+	def _worker(self) -> None:
+		"""Handle queued requests until a None sentinel is taken from the queue."""
+		while True:
+			item = self._queue.get()
+			try:
+				if item is None:
+					return
+				(request, client_address) = item
+				try:
+					self.finish_request(request, client_address)
+				except Exception:
+					self.handle_error(request, client_address)
+				finally:
+					self.shutdown_request(request)
+			finally:
+				self._queue.task_done()
 
-		Args:
-			request: The request being handled when the error occurred.
-			client_address: The client address associated with the request.
+	def server_close(self) -> None:
+		"""
+		Stop the workers once every queued request was handled, then close the server.
 
 		Returns:
 			None
 		"""
-		self.logger.info("handle_error")
-		if request is not None and request[0] is not None and "STOP" in str(request[0]):
-			def kill_func(a_server):
-				"""
-				Terminate the server.
-
-				Args:
-					a_server: The server instance to terminate.
-
-				Returns:
-					None
-				"""
-				if a_server is not None:
-					a_server.shutdown()
-			end_thread = threading.Thread(name="Kill_Thread", target=kill_func, args=[self])
-			end_thread.start()
-		else:
-			super(McastServer, self).handle_error(request, client_address)
+		if self._executor is not None:
+			for _ in range(self.workers):
+				self._queue.put(None)
+			self._executor.shutdown(wait=True)
+			self._executor = None
+		super(McastThreadPoolServer, self).server_close()
 
 
 class HearUDPHandler(socketserver.BaseRequestHandler):
@@ -645,6 +2285,97 @@ class HearUDPHandler(socketserver.BaseRequestHandler):
 
 	"""
 
+	@property
+	def arrival_ns(self):
+		"""
+		The kernel arrival time of the request's datagram, in nanoseconds since the epoch.
+
+		None unless the server has timestamps enabled (see `McastRequest`).
+
+		Minimal Acceptance Testing:
+
+			>>> import multicast
+			>>> handler = multicast.hear.HearUDPHandler(
+			...     request=(None, None), client_address=('192.0.2.1', 51111), server=None
+			... )
+			>>> handler.arrival_ns is None
+			True
+			>>> handler.request = multicast.hear.McastRequest(None, None, 42)
+			>>> handler.arrival_ns
+			42
+			>>>
+
+		"""
+		return getattr(self.request, "arrival_ns", None)
+
+	@property
+	def datagram(self) -> tuple:
+		"""
+		The (group, payload, source) view of the request's datagram.
+
+		The group is the multicast group the datagram was sent to, when the server joined several
+		groups (see `McastRequest`), and otherwise the server's bound address (None without one).
+
+		Minimal Acceptance Testing:
+
+			>>> import multicast
+			>>> handler = multicast.hear.HearUDPHandler(
+			...     request=(None, None), client_address=('192.0.2.1', 51111), server=None
+			... )
+			>>> handler.request = multicast.hear.McastRequest(b"data", None, None, "224.0.0.2")
+			>>> handler.datagram
+			('224.0.0.2', b'data', ('192.0.2.1', 51111))
+			>>>
+
+		"""
+		group = getattr(self.request, "group", None)
+		if group is None and self.server is not None:
+			group = getattr(self.server, "server_address", (None,))[0]
+		return (group, self.request[0], self.client_address)
+
+	def _should_reply(self, nbytes: int) -> bool:
+		"""
+		Apply the server's reply policy to this request (see `McastServer.should_reply`).
+
+		Args:
+			nbytes (int): The size of the request's payload.
+
+		Returns:
+			bool: True if this handler should reply, which is always the case without a server.
+		"""
+		should_reply = getattr(self.server, "should_reply", None)
+		return True if should_reply is None else should_reply(self.client_address, nbytes)
+
+	def _payload_commands(self) -> bool:
+		"""
+		Whether the server still takes the legacy in-band "STOP" command from payloads.
+
+		Returns:
+			bool: The server's `payload_commands`, which is always True without a server.
+		"""
+		return getattr(self.server, "payload_commands", True)
+
+	def _reply(self, payload) -> None:
+		"""
+		Send a reply to the client of the request.
+
+		Replies through the server's long-lived reply socket (see `McastServer.send_reply`). Without
+		such a server (e.g., a handler used on its own), an ephemeral sender is used instead.
+
+		Args:
+			payload (str or bytes-like): The reply.
+
+		Returns:
+			None
+		"""
+		send_reply = getattr(self.server, "send_reply", None)
+		if send_reply is not None:
+			send_reply(payload, self.client_address)
+		else:
+			send.McastSAY._sayStep(  # skipcq: PYL-W0212 - module ok
+				self.client_address[0], self.client_address[1], payload,
+			)
+
 	def handle(self) -> None:
 		"""
 		Handles incoming UDP requests in the HEAR functionality.
@@ -653,8 +2384,8 @@ def handle(self) -> None:
 
 		By default:
 			Processes the incoming data from the client, logs the messages,
-			and sends a response back. If the data contains the
-			keyword "STOP", it raises a `ShutdownCommandReceived` to
+			and sends a response back. If the data is exactly the
+			command "STOP", it raises a `ShutdownCommandReceived` to
 			initiate server shutdown.
 			Silently ignores any UnicodeDecodeError when decoding data.
 			Returns early if data or socket is None.
@@ -666,7 +2397,7 @@ def handle(self) -> None:
 			None
 
 		Raises:
-			multicast.exceptions.ShutdownCommandReceived: When "STOP" is detected in incoming data.
+			multicast.exceptions.ShutdownCommandReceived: When the incoming data is "STOP".
 
 		Minimal Acceptance Testing:
 
@@ -714,13 +2445,16 @@ def handle(self) -> None:
 			Testcase 4: `handle` raises on valid STOP requests.
 
 			>>> tst_fixture_sock = multicast.genSocket()
-			>>> handler.request = ("The Test is STOP", tst_fixture_sock)
+			>>> handler.request = ("STOP", tst_fixture_sock)
 			>>> handler.client_address = ("224.0.1.3", 54321)
 			>>> try:
 			...     handler.handle()
 			... except multicast.exceptions.ShutdownCommandReceived:
 			...     print("ShutdownCommandReceived raised")
 			ShutdownCommandReceived raised
+			>>> handler.request = ("The Test is STOP", tst_fixture_sock)
+			>>> handler.handle() is None
+			True
 			>>>
 			>>> multicast.endSocket(tst_fixture_sock)
 			>>>
@@ -728,6 +2462,11 @@ def handle(self) -> None:
 		(data, sock) = self.request
 		if data is None or not sock:  # pragma: no branch
 			return  # nothing to do -- fail fast.
+		if getattr(self.server, "binary", False):
+			self._handle_binary(bytes(data), sock)
+			return
+		# the reply policy budgets datagram bytes, not decoded characters
+		nbytes = len(data) if isinstance(data, bytes) else len(str(data).encode('utf8'))
 		# skipcq: PYL-R1705 -- otherwise can try to decode
 		try:
 			data = data.decode('utf8') if isinstance(data, bytes) else str(data)
@@ -745,8 +2484,6 @@ def handle(self) -> None:
 				str(self.client_address[0]), data.strip(),
 			)
 		me = str(sock.getsockname()[0])
-		_sender: multicast.send.McastSAY = None
-		_sender = send.McastSAY()
 		if __debug__:  # pragma: no cover -- defensive code branch
 			_what = data.strip().replace("""\r""", str()).replace("""%""", """%%""")
 			_logger.info(
@@ -757,14 +2494,442 @@ def handle(self) -> None:
 				"%s SAYS [ HEAR [ {%s SAID %s ] from %s ]",  # lazy formatting to avoid PYL-W1203
 				str(me), str(_what), str(self.client_address), str(me),
 			)
-		_sender._sayStep(  # skipcq: PYL-W0212 - module ok
-			self.client_address[0], self.client_address[1],
-			f"HEAR [ {data.upper()} SAID {self.client_address} ] from {me}"  # noqa
-		)
-		if "STOP" in str(data):
+		if self._should_reply(nbytes):
+			self._reply(f"HEAR [ {data.upper()} SAID {self.client_address} ] from {me}")
+		if self._payload_commands() and is_stop_payload(data):
+			raise multicast.exceptions.ShutdownCommandReceived("SHUTDOWN") from None
+
+	def _handle_binary(self, data: bytes, sock) -> None:
+		"""
+		Process incoming raw binary data, for servers in binary mode.
+
+		Like `handle`, but without any text transcoding: the payload is neither decoded nor
+		upper-cased, and is echoed back byte-for-byte inside the usual "HEAR" envelope.
+
+		Args:
+			data (bytes): The raw received payload.
+			sock (socket.socket): The socket the payload was received on.
+
+		Returns:
+			None
+
+		Raises:
+			ShutdownCommandReceived: If the payload is b"STOP".
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>> import types
+			>>> from unittest import mock
+			>>>
+
+		Testcase 1: Binary payloads are echoed back without transcoding.
+
+			>>> handler = multicast.hear.HearUDPHandler(
+			... 	request=(None, None), client_address=None, server=None
+			... )
+			>>> handler.server = types.SimpleNamespace(binary=True)
+			>>> tst_sock = multicast.genSocket()
+			>>> handler.request = (b"\\xff\\x00data", tst_sock)
+			>>> handler.client_address = ("224.0.0.1", 54321)
+			>>> with mock.patch.object(multicast.send.McastSAY, "_sayStep") as tst_say:
+			... 	handler.handle()
+			>>> tst_reply = tst_say.call_args[0][2]
+			>>> tst_reply.startswith(b"HEAR [ \\xff\\x00data SAID ")
+			True
+			>>>
+
+		Testcase 2: Binary STOP payloads raise ShutdownCommandReceived.
+
+			>>> handler.request = (b"STOP", tst_sock)
+			>>> with mock.patch.object(multicast.send.McastSAY, "_sayStep"):
+			... 	try:
+			... 		handler.handle()
+			... 	except multicast.exceptions.ShutdownCommandReceived:
+			... 		print("ShutdownCommandReceived raised")
+			ShutdownCommandReceived raised
+			>>> multicast.endSocket(tst_sock)
+			>>>
+
+		"""
+		me = str(sock.getsockname()[0])
+		if __debug__ and module_logger.isEnabledFor(logging.DEBUG):  # pragma: no cover
+			module_logger.debug(
+				"%s HEAR: [%s SAID %d bytes]",  # lazy formatting to avoid PYL-W1203
+				me, str(self.client_address), len(data),
+			)
+		if self._should_reply(len(data)):
+			self._reply(b"".join((
+				b"HEAR [ ", data, b" SAID ", str(self.client_address).encode("utf8"),
+				b" ] from ", me.encode("utf8"),
+			)))
+		if self._payload_commands() and is_stop_payload(data):
 			raise multicast.exceptions.ShutdownCommandReceived("SHUTDOWN") from None
 
 
+_MCAST_SHARD_STATS: tuple = ("ready", "accepted", "filtered", "drops", "rate_limited")
+"""The per-worker counters McastSupervisor workers publish, in their order in shared memory."""
+
+
+class _McastShardServer(McastServer):
+	"""
+	McastServer serving one shard in a McastSupervisor worker process.
+
+	Publishes its counters (see `_MCAST_SHARD_STATS`) to the supervisor's shared memory, each time
+	around the serving loop.
+	"""
+
+	__log_handle__ = """multicast.hear.McastSupervisor"""  # skipcq: PYL-W0622
+	"""Names this server's Logger."""
+
+	def __init__(self, server_address: tuple, stats, slot: int, **kwargs) -> None:
+		"""
+		Initialize a new shard server, publishing to `stats` starting at the `slot` index.
+
+		Args:
+			server_address (tuple): The (group, port) to bind to.
+			stats (multiprocessing.Array): The supervisor's shared counters.
+			slot (int): The index of this worker's first counter.
+			**kwargs: The McastServer keyword arguments.
+		"""
+		self.stats = stats
+		self.slot = slot
+		super(_McastShardServer, self).__init__(server_address, HearUDPHandler, **kwargs)
+		self.stats[self.slot] = 1
+
+	def service_actions(self) -> None:
+		"""Publish the counters of this worker, then forward the call to super."""
+		self.stats[self.slot + 1] = self.accepted
+		self.stats[self.slot + 2] = self.filtered
+		self.stats[self.slot + 3] = self.drops.total
+		self.stats[self.slot + 4] = self.rate_limited
+		super(_McastShardServer, self).service_actions()
+
+
+def _serve_shard(server_address: tuple, index: int, count: int, stats, options: dict) -> None:
+	"""
+	Serve one shard of a McastSupervisor, until a STOP request (or an interruption) ends it.
+
+	Runs in the worker process, so the process exits cleanly (with status 0) only when stopped.
+
+	Args:
+		server_address (tuple): The (group, port) to bind to.
+		index (int): The shard of this worker.
+		count (int): The number of shards.
+		stats (multiprocessing.Array): The supervisor's shared counters.
+		options (dict): The McastServer keyword arguments and the serving `poll_interval`.
+	"""
+	options = dict(options)
+	poll_interval = options.pop("poll_interval", 0.5)
+	try:
+		with _McastShardServer(
+			server_address, stats, index * len(_MCAST_SHARD_STATS),
+			reuse_port=True, shard=(index, count), **options,
+		) as server:
+			server.serve_forever(poll_interval)
+	except KeyboardInterrupt:  # pragma: no cover -- the supervisor handles interruptions
+		pass
+
+
+class McastSupervisor:
+	"""
+	Runs a HEAR server per CPU core, as `workers` processes sharing one group and port.
+
+	A single Python process serving one socket tops out at one core. Each worker process instead
+	binds its own `McastServer` socket with `SO_REUSEPORT` (see `multicast.skt.enableReusePort`),
+	so the kernel balances unicast datagrams across the workers. Multicast datagrams are copied to
+	every worker, so each worker only processes the multicast sources of its own shard (see
+	`shard_of`), and each datagram is processed by exactly one worker.
+
+	The supervisor restarts workers that die, and aggregates their counters (see `stats`). When a
+	worker exits cleanly, because it handled a STOP request, the supervisor stops serving. A worker
+	that keeps dying before it is ready (e.g., it cannot bind) is given up on after
+	`max_failures` tries in a row, and the supervisor then stops every worker and raises.
+
+	Attributes:
+		server_address (tuple): The (group, port) of the workers.
+		workers (int): The number of worker processes.
+		restarts (int): The cumulative number of restarted workers.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: McastSupervisor should start with no workers running.
+
+		>>> supervisor = multicast.hear.McastSupervisor(('224.0.0.1', 59595), workers=2)
+		>>> (supervisor.workers, supervisor.alive, supervisor.restarts)
+		(2, 0, 0)
+		>>> supervisor.stats()["accepted"]
+		0
+		>>>
+
+	Testcase 1: McastSupervisor should require a fixed port.
+
+		>>> multicast.hear.McastSupervisor(
+		... 	('224.0.0.1', 0), workers=2,
+		... )  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: [CWE-20] Sharded workers need a fixed port.
+		>>>
+
+	Testcase 2: McastSupervisor should reject invalid server options before starting workers.
+
+		>>> multicast.hear.McastSupervisor(
+		... 	('224.0.0.1', 59595), workers=2, rate_limit=-1,
+		... )  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: [CWE-20] Invalid rate limit: -1.
+		>>>
+
+	"""
+
+	__module__ = "multicast.hear"
+
+	__name__ = "multicast.hear.McastSupervisor"
+
+	def __init__(
+		self,
+		server_address: tuple,
+		workers: int = 2,
+		drain_limit: int = 1,
+		binary: bool = False,
+		timestamps: bool = False,
+		poll_interval: float = 0.5,
+		reply_policy: str = "per-message",
+		reply_interval: float = 1.0,
+		groups: list = None,
+		sources: list = None,
+		blocked_sources: list = None,
+		rate_limit: float = None,
+		rate_burst: float = None,
+		payload_commands: bool = None,
+		max_failures: int = 3,
+	) -> None:
+		"""
+		Initialize a new supervisor. Call `start` (or use it as a context manager) to run workers.
+
+		Args:
+			server_address (tuple): The (group, port) to serve.
+			workers (int): The number of worker processes. Defaults to 2.
+			drain_limit (int): Maximum datagrams read per wakeup. Defaults to 1 (no draining).
+			binary (bool): Whether handlers should treat payloads as raw bytes. Defaults to False.
+			timestamps (bool): Whether to enable kernel receive timestamps. Defaults to False.
+			poll_interval (float): Seconds between checks of the workers. Defaults to 0.5.
+			reply_policy (str): Which replies the workers send. Defaults to "per-message".
+			reply_interval (float): Seconds between aggregated replies. Defaults to 1.0.
+			groups (list): The multicast groups each worker serves on one wildcard socket.
+				Defaults to None (only the group of `server_address`).
+			sources (list): Only receive from these senders. Defaults to None (MULTICAST_SOURCES).
+			blocked_sources (list): Block these senders. Defaults to None
+				(MULTICAST_BLOCKED_SOURCES).
+			rate_limit (float): Datagrams per second per source. Defaults to None (unlimited).
+			rate_burst (float): Datagrams per source at once. Defaults to None (the rate limit).
+			payload_commands (bool): Whether "STOP" payloads stop the workers, which is how they
+				exit cleanly. Defaults to None (True, as in McastServer without a control channel).
+			max_failures (int): Consecutive times a worker may die before it is ready, before the
+				supervisor gives up. Defaults to 3.
+
+		Raises:
+			ValueError: If the port is zero, as each worker would then bind a different port, or
+				the reply policy or rate limit is invalid (see McastServer).
+		"""
+		if not int(server_address[1]):
+			raise ValueError("[CWE-20] Sharded workers need a fixed port.")
+		if reply_policy not in _MCAST_REPLY_POLICIES:
+			raise ValueError(f"[CWE-20] Unknown reply policy: {reply_policy}.")
+		if rate_limit is not None:
+			SourceRateLimiter(rate_limit, rate_burst, 1)  # raises before any worker would
+		self.server_address = (server_address[0], int(server_address[1]))
+		self.workers = max(1, int(workers))
+		self.poll_interval = float(poll_interval)
+		self.restarts = 0
+		self.max_failures = max(1, int(max_failures))
+		self._failures = [0] * self.workers
+		self._options = {
+			"drain_limit": drain_limit, "binary": binary, "timestamps": timestamps,
+			"poll_interval": self.poll_interval, "reply_policy": reply_policy,
+			"reply_interval": reply_interval, "groups": groups, "sources": sources,
+			"blocked_sources": blocked_sources, "rate_limit": rate_limit, "rate_burst": rate_burst,
+			"payload_commands": payload_commands,
+		}
+		self._context = multiprocessing.get_context()
+		self._stats = self._context.Array(
+			"q", self.workers * len(_MCAST_SHARD_STATS), lock=False,
+		)
+		self._retired = [0] * len(_MCAST_SHARD_STATS)
+		self._processes = [None] * self.workers
+		self._stopping = False
+		self.__logger = logging.getLogger(f"{self.__name__}.{self.server_address[0]}")
+
+	@property
+	def alive(self) -> int:
+		"""The number of running worker processes."""
+		return sum(1 for process in self._processes if process is not None and process.is_alive())
+
+	def _spawn(self, index: int) -> None:
+		"""
+		Start (or restart) the worker process of a shard.
+
+		The counters of a replaced worker are retired first, so the totals never go backwards.
+
+		Args:
+			index (int): The shard of the worker.
+		"""
+		first = index * len(_MCAST_SHARD_STATS)
+		for (offset, _) in enumerate(_MCAST_SHARD_STATS):
+			if offset:
+				self._retired[offset] += self._stats[first + offset]
+			self._stats[first + offset] = 0
+		process = self._context.Process(
+			target=_serve_shard, name=f"McastShard-{index}",
+			args=(self.server_address, index, self.workers, self._stats, self._options),
+		)
+		process.daemon = True
+		process.start()
+		self._processes[index] = process
+
+	def _ready(self, index: int) -> bool:
+		"""
+		Check whether the worker of a shard has bound its socket.
+
+		This is a helper method and should NOT be called directly.
+		"""
+		return bool(self._stats[index * len(_MCAST_SHARD_STATS)])
+
+	def start(self, timeout: float = 5.0) -> bool:
+		"""
+		Start every worker process, and wait for them to bind.
+
+		Args:
+			timeout (float): Seconds to wait for the workers to bind. Defaults to 5.0.
+
+		Returns:
+			bool: True, once every worker is ready.
+
+		Raises:
+			RuntimeError: If a worker died, or the timeout expired, before every worker was ready.
+				The workers are stopped first.
+		"""
+		self._stopping = False
+		for index in range(self.workers):
+			self._spawn(index)
+		if not self.wait_ready(timeout):
+			self.shutdown()
+			raise RuntimeError(
+				f"[CWE-440] HEAR workers failed to start on {self.server_address}.",
+			)
+		return True
+
+	def wait_ready(self, timeout: float = 5.0) -> bool:
+		"""
+		Wait for every worker process to bind.
+
+		Args:
+			timeout (float): Seconds to wait. Defaults to 5.0.
+
+		Returns:
+			bool: True if every worker is ready, False if a worker died or the timeout expired
+				first.
+		"""
+		deadline = time.monotonic() + timeout
+		while not all(self._ready(index) for index in range(self.workers)):
+			if time.monotonic() >= deadline:
+				return False
+			for (index, process) in enumerate(self._processes):
+				if process is not None and not process.is_alive() and not self._ready(index):
+					return False
+			time.sleep(0.01)
+		return True
+
+	def poll(self) -> bool:
+		"""
+		Check on the workers once, restarting any that died.
+
+		Returns:
+			bool: False once a worker has exited cleanly (it was stopped), otherwise True.
+
+		Raises:
+			RuntimeError: If a worker died before it was ready `max_failures` times in a row. The
+				workers are stopped first.
+		"""
+		for (index, process) in enumerate(self._processes):
+			if process is None or process.is_alive():
+				continue
+			if process.exitcode == 0 or self._stopping:
+				self._stopping = True
+				return False
+			self._failures[index] = 0 if self._ready(index) else self._failures[index] + 1
+			if self._failures[index] >= self.max_failures:
+				self.shutdown()
+				raise RuntimeError(
+					f"[CWE-440] HEAR worker {index} failed to start {self._failures[index]} times.",
+				)
+			self.__logger.warning(
+				"Worker %d exited with %s. Restarting it.",  # lazy formatting to avoid PYL-W1203
+				index, process.exitcode,
+			)
+			self.restarts += 1
+			self._spawn(index)
+		return True
+
+	def stats(self) -> dict:
+		"""
+		Aggregate the counters of every worker, including those of replaced workers.
+
+		Returns:
+			dict: The "accepted", "filtered", "drops", and "rate_limited" totals, with the "alive",
+				and "restarts" worker counts.
+		"""
+		totals = list(self._retired)
+		for index in range(self.workers):
+			first = index * len(_MCAST_SHARD_STATS)
+			for offset in range(1, len(_MCAST_SHARD_STATS)):
+				totals[offset] += self._stats[first + offset]
+		result = dict(zip(_MCAST_SHARD_STATS[1:], totals[1:]))
+		result["alive"] = self.alive
+		result["restarts"] = self.restarts
+		return result
+
+	def serve_forever(self) -> None:
+		"""Supervise the workers until one of them is stopped (see `poll`)."""
+		while self.poll():
+			time.sleep(self.poll_interval)
+		self.__logger.info(
+			"Workers stopped: %s",  # lazy formatting to avoid PYL-W1203
+			self.stats(),
+		)
+
+	def shutdown(self, timeout: float = 1.0) -> None:
+		"""
+		Stop every worker process.
+
+		Args:
+			timeout (float): Seconds to wait for each worker to exit. Defaults to 1.0.
+		"""
+		self._stopping = True
+		for process in self._processes:
+			if process is not None and process.is_alive():
+				process.terminate()
+		for process in self._processes:
+			if process is not None:
+				process.join(timeout)
+
+	def __enter__(self):
+		"""Start the workers."""
+		self.start()
+		return self
+
+	def __exit__(self, *args) -> None:
+		"""Stop the workers."""
+		self.shutdown()
+
+
 class McastHEAR(multicast.mtool):
 	"""
 	Provides the HEAR tooling by subclassing multicast.mtool.
@@ -850,6 +3015,29 @@ def doStep(self, *args, **kwargs):
 		Args:
 			*args: Variable length argument list containing command-line arguments.
 			**kwargs: Arbitrary keyword arguments.
+			- group (str): Multicast group address (default: multicast._MCAST_DEFAULT_GROUP)
+			- port (int): Port number (default: multicast._MCAST_DEFAULT_PORT)
+			- persistent (bool): Keep one joined socket for the server lifetime (default: True)
+			- drain_limit (int): Maximum datagrams read per wakeup (default: 1, no draining)
+			- binary (bool): Echo raw bytes without any text transcoding (default: False)
+			- timestamps (bool): Enable kernel receive timestamps (default: False)
+			- workers (int): Serve with this many sharded processes, see McastSupervisor
+				(default: 1, serve in this process)
+			- reply_policy (str): Which replies to send: none, per-message, or aggregated
+				(default: per-message)
+			- reply_interval (float): Seconds between aggregated replies (default: 1.0)
+			- poll_interval (float): Seconds between idle wakeups of the server, 0 to busy-poll,
+				or None for purely event-driven serving (default: 0.5)
+			- control_port (int): Serve a binary control channel on this port of 127.0.0.1,
+				instead of taking STOP payloads (default: None, no control channel)
+			- payload_commands (bool): Stop on "STOP" payloads (default: True without a control
+				channel, otherwise False)
+			- groups (list): Multicast groups to serve on one wildcard socket, together with
+				`group` (default: None, only serve `group`)
+			- sources (list): Only receive from these senders (default: MULTICAST_SOURCES)
+			- blocked_sources (list): Block these senders (default: MULTICAST_BLOCKED_SOURCES)
+			- rate_limit (float): Datagrams per second per source (default: None, unlimited)
+			- rate_burst (float): Datagrams per source at once (default: None, the rate limit)
 
 		Returns:
 			tuple: A tuple containing a status indicator and an optional result message.
@@ -858,6 +3046,33 @@ def doStep(self, *args, **kwargs):
 		_logger.debug(McastHEAR.__proc__)
 		HOST = kwargs.get("group", multicast._MCAST_DEFAULT_GROUP)  # skipcq: PYL-W0212 - module ok
 		PORT = kwargs.get("port", multicast._MCAST_DEFAULT_PORT)  # skipcq: PYL-W0212 - module ok
+		_persistent = kwargs.get("persistent", True)
+		_drain_limit = kwargs.get("drain_limit", 1)
+		_is_binary = kwargs.get("binary", False)
+		_timestamps = kwargs.get("timestamps", False)
+		_workers = int(kwargs.get("workers", 1) or 1)
+		_reply_policy = kwargs.get("reply_policy", "per-message")
+		_reply_interval = kwargs.get("reply_interval", 1.0)
+		_poll_interval = kwargs.get("poll_interval", 0.5)
+		_control_port = kwargs.get("control_port", None)
+		_control_address = None if _control_port is None else ("127.0.0.1", int(_control_port))
+		# None lets McastServer take STOP payloads exactly when there is no control channel
+		_payload_commands = kwargs.get("payload_commands", None)
+		# only serve several groups (on a wildcard socket) when explicitly asked to
+		_groups = [HOST] + [group for group in (kwargs.get("groups", None) or []) if group != HOST]
+		_groups = _groups if len(_groups) > 1 else None  # otherwise only join the bound group
+		_sources = kwargs.get("sources", None)
+		_blocked_sources = kwargs.get("blocked_sources", None)
+		_rate_limit = kwargs.get("rate_limit", None)
+		_rate_burst = kwargs.get("rate_burst", None)
+		if _workers > 1:
+			return self._superviseStep(
+				(HOST, PORT), _workers,
+				drain_limit=_drain_limit, binary=_is_binary, timestamps=_timestamps,
+				reply_policy=_reply_policy, reply_interval=_reply_interval, groups=_groups,
+				sources=_sources, blocked_sources=_blocked_sources, rate_limit=_rate_limit,
+				rate_burst=_rate_burst, payload_commands=_payload_commands,
+			)
 		server_initialized = False
 		server = None
 		try:
@@ -865,9 +3080,16 @@ def doStep(self, *args, **kwargs):
 				"Initializing server on port %d as %s.",  # lazy formatting to avoid PYL-W1203
 				PORT, HOST,
 			)
-			with McastServer((HOST, PORT), HearUDPHandler) as server:
+			with McastServer(
+				(HOST, PORT), HearUDPHandler,
+				persistent=_persistent, drain_limit=_drain_limit, binary=_is_binary,
+				timestamps=_timestamps, reply_policy=_reply_policy, reply_interval=_reply_interval,
+				control_address=_control_address, payload_commands=_payload_commands, groups=_groups,
+				sources=_sources, blocked_sources=_blocked_sources, rate_limit=_rate_limit,
+				rate_burst=_rate_burst,
+			) as server:
 				server_initialized = True
-				server.serve_forever()
+				server.serve_forever(_poll_interval)
 		except KeyboardInterrupt as _cause:
 			try:
 				if server and server.socket:  # pragma: no cover
@@ -883,10 +3105,7 @@ def doStep(self, *args, **kwargs):
 				PORT, HOST,
 			)
 			if server:  # pragma: no cover
-				# deadlocks if not called by other thread
-				end_it = threading.Thread(name="Kill_Thread", target=server.shutdown, args=[])
-				end_it.start()
-				end_it.join(1)
+				server.shutdown()  # returns at once, as serve_forever has already stopped
 		if __debug__:
 			if server_initialized:
 				module_logger.debug(
@@ -899,3 +3118,26 @@ def doStep(self, *args, **kwargs):
 					server_initialized,
 				)
 		return (server_initialized, None)
+
+	def _superviseStep(self, server_address: tuple, workers: int, **kwargs) -> tuple:
+		"""
+		Execute the HEAR operation with sharded worker processes, see McastSupervisor.
+
+		Args:
+			server_address (tuple): The (group, port) to serve.
+			workers (int): The number of worker processes.
+			**kwargs: The McastSupervisor keyword arguments.
+
+		Returns:
+			tuple: A tuple containing a status indicator and the aggregated worker stats.
+		"""
+		supervisor = McastSupervisor(server_address, workers, **kwargs)
+		try:
+			with supervisor:
+				supervisor.serve_forever()
+		except KeyboardInterrupt as _cause:
+			raise KeyboardInterrupt(
+				"HEAR has stopped due to interruption signal, "
+				f"was previously listening on {server_address}.",
+			) from _cause
+		return (True, supervisor.stats())
@@ -27,8 +27,14 @@
 	joinstep: Configure socket for joining multicast groups.
 	tryrecv: Attempt to receive data on a socket.
 	recvstep: Receive messages continuously until interrupted.
+	iter_datagrams: Join once and yield received datagrams until stopped.
+	drainstep: Read every datagram already queued on a socket without blocking.
+	iter_batches: Join once and yield lists of datagrams, one list per wakeup.
 
 Classes:
+	MembershipManager: Reference-counted live group memberships of a receive socket.
+	MessageAccumulator: Linear-cost, optionally bounded, collector of received chunks.
+	BufferPool: Reusable pool of preallocated receive buffers.
 	McastRECV: Main tool class for RECV operations.
 
 Caution: See details regarding dynamic imports [documented](../__init__.py) in this module.
@@ -189,7 +195,13 @@
 	from multicast import unicodedata as _unicodedata
 	from multicast import socket as _socket
 	from multicast import struct as _struct
-	depends = [_unicodedata, _socket, _struct, _argparse]
+	import codecs
+	import collections
+	import tempfile
+	import threading
+	depends = [
+		_unicodedata, _socket, _struct, _argparse, codecs, collections, tempfile, threading,
+	]
 	for unit in depends:
 		if unit.__name__ is None:  # pragma: no branch
 			_root_cause = ModuleNotFoundError(
@@ -212,6 +224,21 @@
 )
 
 
+_MCAST_DEFAULT_DRAIN_LIMIT: int = 64
+"""Default maximum number of datagrams read per wakeup by drainstep and iter_batches.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> multicast.recv._MCAST_DEFAULT_DRAIN_LIMIT > 1
+		True
+		>>>
+
+"""
+
+
 _w_prefix: str = "Unusual call to multicast.joinstep with no groups."
 
 
@@ -300,7 +327,73 @@ def _validate_join_args(groups=None, port=None, iface=None, bind_group=None, iso
 	return (groups, port, iface, bind_group, isock)
 
 
-def joinstep(groups, port, iface=None, bind_group=None, isock=None) -> _socket.socket:
+def _membership_request(group: str, iface=None) -> bytes:
+	"""Pack the ip_mreq of a group membership, on the given interface (or any, when None).
+
+	This is a helper function and should NOT be called directly.
+	"""
+	return _struct.pack(
+		'4sl' if iface is None else '4s4s',
+		_socket.inet_aton(group),
+		_socket.INADDR_ANY if iface is None else _socket.inet_aton(iface)
+	)
+
+
+def _source_membership_request(group: str, source: str, iface=None) -> bytes:
+	"""Pack the ip_mreq_source of a source-specific membership, in the platform's field order.
+
+	This is a helper function and should NOT be called directly.
+	"""
+	interface = _socket.inet_aton("0.0.0.0" if iface is None else iface)
+	if multicast.skt._IS_LINUX:  # skipcq: PYL-W0212 - module ok
+		return _socket.inet_aton(group) + interface + _socket.inet_aton(source)
+	return _socket.inet_aton(group) + _socket.inet_aton(source) + interface  # BSD and Windows
+
+
+def _join_sources(sock: _socket.socket, group: str, iface, sources, blocked) -> None:
+	"""Join a group on the socket, limited to, or excluding, the given sources.
+
+	This is a helper function and should NOT be called directly.
+	"""
+	if sources:
+		for source in sources:
+			sock.setsockopt(
+				_socket.IPPROTO_IP, multicast.skt.IP_ADD_SOURCE_MEMBERSHIP,
+				_source_membership_request(group, source, iface),
+			)
+		return
+	sock.setsockopt(
+		_socket.IPPROTO_IP, _socket.IP_ADD_MEMBERSHIP, _membership_request(group, iface),
+	)
+	for source in blocked or []:
+		sock.setsockopt(
+			_socket.IPPROTO_IP, multicast.skt.IP_BLOCK_SOURCE,
+			_source_membership_request(group, source, iface),
+		)
+
+
+def _leave_sources(sock: _socket.socket, group: str, iface, sources) -> None:
+	"""Leave a group on the socket, as joined by `_join_sources` with the same sources.
+
+	This is a helper function and should NOT be called directly.
+	"""
+	if sources:
+		for source in sources:
+			sock.setsockopt(
+				_socket.IPPROTO_IP, multicast.skt.IP_DROP_SOURCE_MEMBERSHIP,
+				_source_membership_request(group, source, iface),
+			)
+		return
+	# dropping the membership also discards the group's blocked sources
+	sock.setsockopt(
+		_socket.IPPROTO_IP, _socket.IP_DROP_MEMBERSHIP, _membership_request(group, iface),
+	)
+
+
+def joinstep(
+	groups, port, iface=None, bind_group=None, isock=None, sources=None, blocked=None,
+	isolate=True,
+) -> _socket.socket:
 	"""
 	Join multicast groups to prepare for receiving messages.
 
@@ -316,6 +409,15 @@ def joinstep(groups, port, iface=None, bind_group=None, isock=None) -> _socket.s
 		iface (str, optional): Network interface to use.
 		bind_group (str, optional): Specific group address to bind to.
 		isock (socket.socket, optional): Existing socket to configure.
+		sources (list, optional): Only receive from these senders, with source-specific joins
+			(IP_ADD_SOURCE_MEMBERSHIP), so the kernel (and IGMPv3-snooping switches) discard the
+			traffic of every other sender. Defaults to the configured MULTICAST_SOURCES; an empty
+			list receives from any sender.
+		blocked (list, optional): Block these senders (IP_BLOCK_SOURCE), when not limited to
+			`sources`. Defaults to the configured MULTICAST_BLOCKED_SOURCES.
+		isolate (bool, optional): Only deliver the joined groups to the socket, not the groups other
+			sockets on the host joined (see `multicast.skt.isolateSocket`). Sockets that join no
+			group are never isolated. Defaults to True.
 
 	Returns:
 		socket.socket: Configured socket ready to receive multicast messages.
@@ -329,6 +431,18 @@ def joinstep(groups, port, iface=None, bind_group=None, isock=None) -> _socket.s
 		True
 		>>>
 
+	Testcase 0: Source-specific joins, and blocked sources.
+
+		>>> tst_sock = multicast.recv.joinstep(
+		... 	["224.0.0.1"], 0, None, "224.0.0.1", None, sources=["127.0.0.1"],
+		... )
+		>>> multicast.endSocket(tst_sock)
+		>>> tst_sock = multicast.recv.joinstep(
+		... 	["224.0.0.1"], 0, None, "224.0.0.1", None, blocked=["192.0.2.1"],
+		... )
+		>>> multicast.endSocket(tst_sock)
+		>>>
+
 	Testcase 1: Stability testing.
 		A: Verify the multicast.recv module is properly initialized.
 		B: Verify the joinstep function exists and has the expected type.
@@ -386,25 +500,547 @@ def joinstep(groups, port, iface=None, bind_group=None, isock=None) -> _socket.s
 	try:
 		# skipcq: PYL-W0212
 		sock.bind((multicast._MCAST_DEFAULT_BIND_IP if bind_group is None else bind_group, port))
+		if sources is None:
+			sources = multicast._MCAST_DEFAULT_SOURCES  # skipcq: PYL-W0212 - module ok
+		if blocked is None:
+			blocked = multicast._MCAST_DEFAULT_BLOCKED_SOURCES  # skipcq: PYL-W0212 - module ok
 		for group in groups:
-			mreq = _struct.pack(
-				'4sl' if iface is None else '4s4s',
-				_socket.inet_aton(group),
-				_socket.INADDR_ANY if iface is None else _socket.inet_aton(iface)
-			)
-			sock.setsockopt(_socket.IPPROTO_IP, _socket.IP_ADD_MEMBERSHIP, mreq)
+			_join_sources(sock, group, iface, sources, blocked)
+		if isolate and groups:
+			multicast.skt.isolateSocket(sock)
 	except Exception as _cause:  # pragma: no branch
 		raise OSError("[CWE-440] Socket operation failed.") from _cause  # pragma: no cover
 	return sock
 
 
-def tryrecv(msgbuffer: list, chunk: bytes, sock: _socket.socket) -> str:
+class MembershipManager:
+	"""
+	Add and drop the multicast group memberships of a live receive socket, without rebinding it.
+
+	Each (group, iface) membership is reference counted: `join` only asks the kernel to join
+	(`IP_ADD_MEMBERSHIP`) on the first reference, and `leave` only asks it to leave
+	(`IP_DROP_MEMBERSHIP`) once the last reference is released. Subscribing and unsubscribing
+	topics at runtime thus never tears down the socket, nor drops the traffic of the groups that
+	stay joined. `set_groups` reconciles the memberships with a whole list of groups at once.
+
+	The manager may be attached to a socket, or to an owner with a `socket` attribute (such as a
+	`multicast.hear.McastServer`, see its `memberships`), in which case it always manages the
+	owner's current socket. Every method is thread-safe.
+
+	Every membership is joined with the same source filters as `joinstep`: only from `sources`
+	(with source-specific joins), or from any sender except the `blocked` ones. These default to
+	the owner's `sources` and `blocked_sources` attributes, and then to MULTICAST_SOURCES and
+	MULTICAST_BLOCKED_SOURCES.
+
+	Note that a socket bound to one group's address only receives that group's datagrams, so
+	sockets that should receive several groups must be bound to the wildcard address.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> tst_sock = multicast.recv.joinstep(["224.0.0.1"], 0, None, "0.0.0.0")
+		>>>
+
+	Testcase 0: Memberships are reference counted.
+
+		>>> tst_members = multicast.recv.MembershipManager(tst_sock, ["224.0.0.1"])
+		>>> (tst_members.join("224.0.0.2"), tst_members.join("224.0.0.2"))
+		(True, False)
+		>>> (tst_members.refcount("224.0.0.2"), tst_members.groups)
+		(2, ['224.0.0.1', '224.0.0.2'])
+		>>> (tst_members.leave("224.0.0.2"), tst_members.leave("224.0.0.2"))
+		(False, True)
+		>>> tst_members.leave("224.0.0.2")
+		False
+		>>>
+
+	Testcase 1: set_groups reconciles the memberships with a list of groups.
+
+		>>> tst_members.set_groups(["224.0.0.2", "224.0.0.3"])
+		(['224.0.0.2', '224.0.0.3'], ['224.0.0.1'])
+		>>> tst_members.groups
+		['224.0.0.2', '224.0.0.3']
+		>>>
+
+	Testcase 2: Invalid groups are rejected.
+
+		>>> tst_members.join("192.0.2.1")  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: [CWE-20] Invalid multicast group: 192.0.2.1.
+		>>> multicast.endSocket(tst_sock)
+		>>>
+
+	"""
+
+	__module__ = "multicast.recv"
+
+	def __init__(self, target, joined=None, iface=None, sources=None, blocked=None) -> None:
+		"""
+		Attach a manager to a socket, or to an owner with a `socket` attribute.
+
+		Args:
+			target (socket.socket or object): The receive socket, or its owner.
+			joined (list, optional): The groups the socket already joined (e.g., with `joinstep`),
+				each counted as one reference. Defaults to None (no memberships).
+			iface (str, optional): The interface address of the `joined` groups. Defaults to None
+				(any interface).
+			sources (list, optional): Only receive from these senders. Defaults to None (the
+				owner's `sources`, or MULTICAST_SOURCES).
+			blocked (list, optional): Block these senders. Defaults to None (the owner's
+				`blocked_sources`, or MULTICAST_BLOCKED_SOURCES).
+		"""
+		self._target = target
+		self._sources = sources
+		self._blocked = blocked
+		self._lock = threading.Lock()
+		self._counts = collections.OrderedDict(
+			((group, iface), 1) for group in dict.fromkeys(joined or [])
+		)
+
+	@property
+	def socket(self) -> _socket.socket:
+		"""The managed socket (the owner's current socket, when attached to an owner)."""
+		return getattr(self._target, "socket", self._target)
+
+	@property
+	def groups(self) -> list:
+		"""The joined groups, in the order they were first joined."""
+		with self._lock:
+			return list(dict.fromkeys(group for (group, _) in self._counts))
+
+	def refcount(self, group: str, iface=None) -> int:
+		"""
+		Get the number of references to a membership.
+
+		Args:
+			group (str): The multicast group.
+			iface (str, optional): The interface address. Defaults to None (any interface).
+
+		Returns:
+			int: The number of references, 0 when not joined.
+		"""
+		with self._lock:
+			return self._counts.get((group, iface), 0)
+
+	def _filters(self) -> tuple:
+		"""Resolve the (sources, blocked) filters of the memberships, like `joinstep` does."""
+		sources = self._sources
+		if sources is None:
+			sources = getattr(self._target, "sources", None)
+		if sources is None:
+			sources = multicast._MCAST_DEFAULT_SOURCES  # skipcq: PYL-W0212 - module ok
+		blocked = self._blocked
+		if blocked is None:
+			blocked = getattr(self._target, "blocked_sources", None)
+		if blocked is None:
+			blocked = multicast._MCAST_DEFAULT_BLOCKED_SOURCES  # skipcq: PYL-W0212 - module ok
+		return (sources, blocked)
+
+	def _join(self, group: str, iface) -> None:
+		"""Join a membership with the source filters, raising like `joinstep` on failure."""
+		(sources, blocked) = self._filters()
+		try:
+			_join_sources(self.socket, group, iface, sources, blocked)
+		except OSError as _cause:
+			raise OSError("[CWE-440] Socket operation failed.") from _cause
+
+	def _leave(self, group: str, iface) -> None:
+		"""Leave a membership joined by `_join`, raising like `joinstep` on failure."""
+		try:
+			_leave_sources(self.socket, group, iface, self._filters()[0])
+		except OSError as _cause:
+			raise OSError("[CWE-440] Socket operation failed.") from _cause
+
+	def join(self, group: str, iface=None) -> bool:
+		"""
+		Add a reference to a membership, joining the group on the first one.
+
+		Args:
+			group (str): The multicast group.
+			iface (str, optional): The interface address. Defaults to None (any interface).
+
+		Returns:
+			bool: True if the kernel joined the group, False if it was joined already.
+
+		Raises:
+			ValueError: If the group is not a multicast address.
+			OSError: If the kernel refused the membership.
+		"""
+		if not multicast.env.validate_multicast_address(group):
+			raise ValueError(f"[CWE-20] Invalid multicast group: {group}.")
+		with self._lock:
+			key = (group, iface)
+			if key in self._counts:
+				self._counts[key] += 1
+				return False
+			self._join(group, iface)
+			self._counts[key] = 1
+		module_logger.debug(
+			"Joined %s on %s.",  # lazy formatting to avoid PYL-W1203
+			group, str(iface),
+		)
+		return True
+
+	def leave(self, group: str, iface=None) -> bool:
+		"""
+		Release a reference to a membership, leaving the group with the last one.
+
+		Args:
+			group (str): The multicast group.
+			iface (str, optional): The interface address. Defaults to None (any interface).
+
+		Returns:
+			bool: True if the kernel left the group, False if references remain (or it was not
+				joined at all).
+		"""
+		with self._lock:
+			key = (group, iface)
+			count = self._counts.get(key, 0)
+			if count > 1:
+				self._counts[key] = count - 1
+				return False
+			if not count:
+				return False
+			del self._counts[key]
+			self._leave(group, iface)
+		module_logger.debug(
+			"Left %s on %s.",  # lazy formatting to avoid PYL-W1203
+			group, str(iface),
+		)
+		return True
+
+	def set_groups(self, groups: list, iface=None) -> tuple:
+		"""
+		Reconcile the memberships on an interface with a list of groups.
+
+		Groups missing from the list are left (whatever their reference count), listed groups not
+		joined yet are joined with one reference, and the others keep their references.
+
+		Args:
+			groups (list): The multicast groups to be joined.
+			iface (str, optional): The interface address. Defaults to None (any interface).
+
+		Returns:
+			tuple: The (joined, left) lists of groups the kernel joined and left.
+		"""
+		wanted = list(dict.fromkeys(groups))
+		for group in wanted:
+			if not multicast.env.validate_multicast_address(group):
+				raise ValueError(f"[CWE-20] Invalid multicast group: {group}.")
+		with self._lock:
+			held = [group for (group, held_iface) in self._counts if held_iface == iface]
+			left = [group for group in held if group not in wanted]
+			joined = [group for group in wanted if group not in held]
+			for group in left:
+				del self._counts[(group, iface)]
+				self._leave(group, iface)
+			for group in joined:
+				self._join(group, iface)
+				self._counts[(group, iface)] = 1
+		module_logger.debug(
+			"Joined %s and left %s on %s.",  # lazy formatting to avoid PYL-W1203
+			str(joined), str(left), str(iface),
+		)
+		return (joined, left)
+
+	def attach(self, sock: _socket.socket, joined=None, iface=None) -> None:
+		"""
+		Move the memberships to a new socket, e.g., after its owner replaced its socket.
+
+		Joins every tracked membership on the new socket, and leaves the `joined` groups (the ones
+		the new socket joined on its own) that are no longer tracked.
+
+		Args:
+			sock (socket.socket): The new socket, when the manager is not attached to an owner.
+				Ignored otherwise, as the owner's current socket is used.
+			joined (list, optional): The groups the new socket already joined. Defaults to None.
+			iface (str, optional): The interface address of the `joined` groups. Defaults to None.
+		"""
+		with self._lock:
+			if not hasattr(self._target, "socket"):
+				self._target = sock
+			already = {(group, iface) for group in (joined or [])}
+			for key in self._counts:
+				if key not in already:
+					self._join(*key)
+			for key in already:
+				if key not in self._counts:
+					self._leave(*key)
+
+
+class MessageAccumulator:
+	"""
+	Collects received chunks with linear total cost, and optionally bounded memory.
+
+	Appending a chunk never copies the previously collected data: chunks are kept in a list and
+	joined once by `getvalue`. (Accumulating into a `str` with `+=` instead copies everything
+	received so far on every append, which is quadratic over long captures.)
+
+	Memory use may be bounded with `max_size`:
+
+	* By default, any data beyond `max_size` bytes is discarded, and counted by `truncated`.
+	* With `spill=True`, data is instead kept in memory only until it grows beyond `max_size`
+		bytes, and then moves to a temporary file on disk. Nothing is discarded. Read spilled
+		data back with `iter_chunks` (or `iter_text`), a block at a time, as `getvalue` reads it
+		all into memory at once.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> multicast.recv.MessageAccumulator is not None
+		True
+		>>>
+
+	Testcase 1: MessageAccumulator should join all chunks once.
+
+		>>> tst_acc = multicast.recv.MessageAccumulator()
+		>>> for tst_chunk in (b"one ", b"two ", b"three"):
+		... 	tst_acc.append(tst_chunk)
+		>>> (len(tst_acc), tst_acc.getvalue())
+		(13, b'one two three')
+		>>> tst_acc.text()
+		'one two three'
+		>>>
+
+	Testcase 2: MessageAccumulator should discard data beyond max_size.
+
+		>>> tst_acc = multicast.recv.MessageAccumulator(max_size=6)
+		>>> for tst_chunk in (b"one ", b"two ", b"three"):
+		... 	tst_acc.append(tst_chunk)
+		>>> (tst_acc.getvalue(), tst_acc.truncated)
+		(b'one tw', 7)
+		>>>
+
+	Testcase 3: MessageAccumulator should spill to a file instead of discarding.
+
+		>>> with multicast.recv.MessageAccumulator(max_size=6, spill=True) as tst_acc:
+		... 	for tst_chunk in (b"one ", b"two ", b"three"):
+		... 		tst_acc.append(tst_chunk)
+		... 	(tst_acc.getvalue(), tst_acc.truncated, tst_acc.spilled)
+		... 	list(tst_acc.iter_chunks(size=8))
+		(b'one two three', 0, True)
+		[b'one two ', b'three']
+		>>>
+
+	Testcase 4: Text decoding should happen once, even across split characters.
+
+		>>> tst_acc = multicast.recv.MessageAccumulator()
+		>>> tst_raw = "caf\u00e9".encode("utf8")
+		>>> tst_acc.append(tst_raw[:4])
+		>>> tst_acc.append(tst_raw[4:])
+		>>> tst_acc.text() == "caf\u00e9"
+		True
+		>>>
+
+	Testcase 5: Spilling needs a max_size to spill beyond.
+
+		>>> multicast.recv.MessageAccumulator(spill=True)  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: [CWE-20] A max_size is required to spill.
+		>>>
+
+
+	"""
+
+	__module__ = "multicast.recv"
+
+	__slots__ = ("_chunks", "_file", "_spill", "_size", "max_size", "truncated")
+
+	def __init__(self, max_size=None, spill=False):
+		"""
+		Initialize an empty accumulator.
+
+		Args:
+			max_size (int, optional): Maximum bytes kept in memory. Defaults to None (unbounded).
+			spill (bool, optional): Spill data beyond `max_size` to a temporary file instead of
+				discarding it. Requires `max_size`. Defaults to False.
+
+		Raises:
+			ValueError: If `spill` is set without a `max_size`.
+		"""
+		if spill and max_size is None:
+			raise ValueError("[CWE-20] A max_size is required to spill.")
+		self.max_size = int(max_size) if max_size is not None else None
+		self._chunks = []
+		self._file = None
+		self._spill = bool(spill)
+		self._size = 0
+		self.truncated = 0
+
+	def __len__(self) -> int:
+		"""The number of bytes collected (not counting any truncated bytes)."""
+		return self._size
+
+	@property
+	def spilled(self) -> bool:
+		"""Whether the collected data has moved to disk."""
+		return self._file is not None
+
+	def append(self, chunk) -> None:
+		"""
+		Collect one received chunk.
+
+		Args:
+			chunk (bytes-like): The received data.
+		"""
+		if self._file is not None:
+			self._file.seek(0, 2)  # in case a reader stopped part way through the file
+			self._size += self._file.write(chunk)
+			return
+		if self._spill and (self._size + len(chunk)) > self.max_size:
+			self._file = tempfile.TemporaryFile()
+			self._file.writelines(self._chunks)
+			self._chunks = []
+			self._size += self._file.write(chunk)
+			return
+		if self.max_size is not None and (self._size + len(chunk)) > self.max_size:
+			room = max(0, self.max_size - self._size)
+			if not self.truncated:
+				module_logger.warning(
+					# lazy formatting to avoid PYL-W1203
+					"Message buffer is full at %d bytes, discarding the rest.",
+					self.max_size,
+				)
+			self.truncated += len(chunk) - room
+			chunk = chunk[:room]
+			if not chunk:
+				return
+		self._chunks.append(bytes(chunk))
+		self._size += len(chunk)
+
+	def getvalue(self) -> bytes:
+		"""
+		Join everything collected so far into one bytes object.
+
+		Meant for data small enough to hold in memory; a spilled accumulator is read back whole,
+		so use `iter_chunks` for those instead.
+
+		Returns:
+			bytes: The collected data.
+		"""
+		if self._file is not None:
+			self._file.seek(0)
+			data = self._file.read()
+			self._file.seek(0, 2)
+			return data
+		if len(self._chunks) > 1:
+			self._chunks = [b"".join(self._chunks)]
+		return self._chunks[0] if self._chunks else b""
+
+	def iter_chunks(self, size: int = 65536):
+		"""
+		Yield everything collected so far, in order, without joining it.
+
+		Data spilled to disk is read back `size` bytes at a time, so memory use stays bounded
+		however much was collected.
+
+		Args:
+			size (int, optional): The block size for reading spilled data. Defaults to 65536.
+
+		Yields:
+			bytes: The collected data, a chunk at a time.
+		"""
+		if self._file is None:
+			yield from list(self._chunks)
+			return
+		self._file.seek(0)
+		chunk = self._file.read(size)
+		while chunk:
+			yield chunk
+			chunk = self._file.read(size)
+
+	def iter_text(self, size: int = 65536):
+		"""
+		Yield everything collected so far as UTF-8 text, a chunk at a time (see `iter_chunks`).
+
+		Characters split across chunks are decoded whole.
+
+		Args:
+			size (int, optional): The block size for reading spilled data. Defaults to 65536.
+
+		Yields:
+			str: The collected data as text, a chunk at a time.
+		"""
+		decoder = codecs.getincrementaldecoder("utf8")()
+		for chunk in self.iter_chunks(size):
+			text = decoder.decode(chunk)
+			if text:
+				yield text
+		text = decoder.decode(b"", final=True)
+		if text:  # pragma: no cover -- only reached with truncated characters
+			yield text
+
+	def text(self) -> str:
+		"""
+		Decode everything collected so far as UTF-8 text, in one step.
+
+		Returns:
+			str: The collected data as text.
+		"""
+		return str(self.getvalue(), encoding='utf8')
+
+	def close(self) -> None:
+		"""Release the collected data, and any spill file."""
+		if self._file is not None:
+			self._file.close()
+		self._chunks = []
+
+	def __enter__(self):
+		"""Enter the runtime context, returning the accumulator."""
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		"""Exit the runtime context, releasing any spill file."""
+		self.close()
+
+
+def _append_chunk(msgbuffer, chunk: bytes):
+	"""Append a received chunk to the message buffer.
+
+	This is a helper function and should NOT be called directly.
+
+	A `MessageAccumulator` gets the chunk appended in amortized constant time. Binary message
+	buffers (`bytearray` or `bytes`) get the raw chunk appended without any transcoding, while
+	(legacy) text message buffers get the chunk decoded as UTF-8 first.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 1: _append_chunk should only decode for text buffers.
+
+		>>> multicast.recv._append_chunk("text ", b"chunk")
+		'text chunk'
+		>>> multicast.recv._append_chunk(bytearray(b"raw "), b"\\xff\\x00")
+		bytearray(b'raw \\xff\\x00')
+		>>>
+
+	"""
+	if isinstance(msgbuffer, MessageAccumulator):
+		msgbuffer.append(chunk)
+	elif isinstance(msgbuffer, (bytes, bytearray)):
+		msgbuffer += chunk
+	else:
+		msgbuffer += str(chunk, encoding='utf8')
+	return msgbuffer
+
+
+def tryrecv(msgbuffer: list, chunk: bytes, sock: _socket.socket, stamps=None) -> str:
 	"""
 	Attempt to receive data on the given socket and decode it into the message buffer.
 
 	Will try to listen on the given socket directly into the given chunk for decoding.
 	If the read into the chunk results in content, the chunk will be decoded and appended
 	to the caller-instantiated `msgbuffer`, which is a collection of utf8 strings (or None).
+	When `msgbuffer` is binary (a `bytearray`), the raw chunk is appended without decoding, and
+	when it is a `MessageAccumulator` it is appended without any copying of earlier chunks.
 	After decoding, `chunk` is zeroed for memory efficiency and security. Either way the
 	message buffer will be returned.
 
@@ -415,10 +1051,16 @@ def tryrecv(msgbuffer: list, chunk: bytes, sock: _socket.socket) -> str:
 	"MULTICAST_BUFFER_SIZE" if available at load-time. However changing the value is not recommended
 	unless absolutely needed, and can be done on the sender side too.
 
+	When a caller-instantiated `stamps` list is given, the arrival time of the datagram is appended
+	to it, in nanoseconds since the epoch. This is the kernel's arrival time when the socket has
+	timestamps enabled (see `multicast.skt.enableTimestamps`), so it excludes any scheduling delay
+	before the read.
+
 	Args:
 		msgbuffer (list or None): Caller-instantiated collection to store received messages.
 		chunk (variable or None): Caller-instantiated variable for raw received data.
 		sock (socket.socket): The socket to receive data from.
+		stamps (list, optional): Caller-instantiated list to append the arrival time to.
 
 	Returns:
 		list: The message buffer possibly updated with any newly received data.
@@ -479,10 +1121,30 @@ def tryrecv(msgbuffer: list, chunk: bytes, sock: _socket.socket) -> str:
 			>>> sk_fxtr.close()
 			>>>
 
+		Testcase 3: Kernel arrival time testing.
+
+			>>> import time
+			>>> sk_fxtr = multicast.genSocket()
+			>>> sk_fxtr.bind(("127.0.0.1", 0))
+			>>> _ = multicast.skt.enableTimestamps(sk_fxtr)
+			>>> _ = sk_fxtr.sendto(b"stamped", sk_fxtr.getsockname())
+			>>> tst_stamps = []
+			>>> multicast.recv.tryrecv(bytearray(), None, sk_fxtr, tst_stamps)
+			bytearray(b'stamped')
+			>>> 0 < tst_stamps[0] <= time.time_ns()
+			True
+			>>> multicast.endSocket(sk_fxtr)
+			>>>
+
 	"""
-	chunk = sock.recv(multicast._MCAST_DEFAULT_BUFFER_SIZE)  # skipcq: PYL-W0212 - module ok
+	if stamps is None:
+		chunk = sock.recv(multicast._MCAST_DEFAULT_BUFFER_SIZE)  # skipcq: PYL-W0212 - module ok
+	else:
+		chunk = multicast.skt.recvfrom_meta(
+			sock, multicast._MCAST_DEFAULT_BUFFER_SIZE, None, stamps,  # skipcq: PYL-W0212
+		)[0]
 	if not (chunk is None):  # skipcq: PYL-C0325 -- avoids flake E714 anti-pattern
-		msgbuffer += str(chunk, encoding='utf8')  # pragma: no cover
+		msgbuffer = _append_chunk(msgbuffer, chunk)  # pragma: no cover
 		chunk = None  # pragma: no cover
 	return msgbuffer
 
@@ -512,12 +1174,476 @@ def recvstep(msgbuffer: list, chunk: bytes, sock: _socket.socket) -> str:
 		if sock:  # pragma: no branch
 			sock = multicast.endSocket(sock)
 	if not (chunk is None):  # skipcq: PYL-C0325 -- avoids flake E714 anti-pattern
-		msgbuffer += str(chunk, encoding='utf8')  # pragma: no cover
+		msgbuffer = _append_chunk(msgbuffer, chunk)  # pragma: no cover
 		chunk = None  # pragma: no cover
 	# about 969 bytes in base64 encoded as chars
 	return msgbuffer
 
 
+class BufferPool:
+	"""
+	A reusable pool of preallocated `bytearray` slabs for receiving datagrams without copying.
+
+	Each slab is `size` bytes long. `recv_into` reads one datagram from a socket directly into a
+	free slab (via `socket.recv_into`) and hands out a `memoryview` of just the received bytes.
+	Consumers return the view with `release` once done with it, making the slab available again.
+	Free slabs are reused last-in first-out, so recently used (cache-warm) slabs are reused first.
+	This way steady-state reception allocates no new payload buffers per datagram.
+
+	If every slab is in use, `acquire` grows the pool by one slab (counted by `grown`) rather than
+	failing, so consumers that forget to release views only cost memory, not correctness.
+	Releasing a view also releases the `memoryview` itself, so any later use of it by the consumer
+	raises `ValueError` instead of silently reading data from a newer datagram.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> multicast.recv.BufferPool is not None
+		True
+		>>>
+
+	Testcase 1: BufferPool should preallocate slabs of the default buffer size.
+
+		>>> tst_pool = multicast.recv.BufferPool(2)
+		>>> tst_pool.size == multicast._MCAST_DEFAULT_BUFFER_SIZE
+		True
+		>>> tst_pool.available
+		2
+		>>>
+
+	Testcase 2: BufferPool should reuse released slabs.
+		A: Test that acquire hands out a writable memoryview of a whole slab.
+		B: Test that release returns the slab to the pool and invalidates the view.
+		C: Test that the next acquire reuses the same slab without growing.
+
+		>>> tst_view = tst_pool.acquire()
+		>>> type(tst_view)
+		<class 'memoryview'>
+		>>> (len(tst_view), tst_view.readonly, tst_pool.available)
+		(1316, False, 1)
+		>>> tst_slab = tst_view.obj
+		>>> tst_pool.release(tst_view)
+		>>> tst_pool.available
+		2
+		>>> tst_view.tobytes()  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: operation forbidden on released memoryview object
+		>>> (tst_pool.acquire().obj is tst_slab, tst_pool.grown)
+		(True, 0)
+		>>>
+
+	Testcase 3: BufferPool should grow instead of failing when exhausted.
+
+		>>> tst_pool = multicast.recv.BufferPool(1, 8)
+		>>> tst_first = tst_pool.acquire()
+		>>> tst_second = tst_pool.acquire()
+		>>> (len(tst_second), tst_pool.grown, tst_pool.available)
+		(8, 1, 0)
+		>>>
+
+	Testcase 4: BufferPool should reject buffers it does not own.
+
+		>>> tst_pool.release(memoryview(bytearray(8)))  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: [CWE-1284] Buffer does not belong to this pool.
+		>>>
+
+
+	"""
+
+	__module__ = "multicast.recv"
+
+	__slots__ = ("_size", "_free", "_owned", "grown")
+
+	def __init__(self, count=64, size=None):
+		"""
+		Preallocate the pool.
+
+		Args:
+			count (int, optional): Number of slabs to preallocate. Defaults to 64.
+			size (int, optional): Size of each slab in bytes. Defaults to
+				`_MCAST_DEFAULT_BUFFER_SIZE`.
+		"""
+		_default_size = multicast._MCAST_DEFAULT_BUFFER_SIZE  # skipcq: PYL-W0212 - module ok
+		self._size = int(size) if size else _default_size
+		self._free = collections.deque(bytearray(self._size) for _ in range(int(count)))
+		# strong references keep every slab alive, so an id is never reused while it is pooled
+		self._owned = {id(slab): slab for slab in self._free}
+		self.grown = 0
+
+	@property
+	def size(self) -> int:
+		"""The size of each slab in bytes."""
+		return self._size
+
+	@property
+	def available(self) -> int:
+		"""The number of slabs currently free in the pool."""
+		return len(self._free)
+
+	def acquire(self) -> memoryview:
+		"""
+		Take a free slab from the pool.
+
+		Returns:
+			memoryview: A writable view of a whole slab.
+		"""
+		try:
+			slab = self._free.pop()
+		except IndexError:
+			slab = bytearray(self._size)
+			self._owned[id(slab)] = slab
+			self.grown += 1
+			module_logger.debug(
+				# lazy formatting to avoid PYL-W1203
+				"Buffer pool exhausted, grew by one slab to %d.",
+				len(self._owned),
+			)
+		return memoryview(slab)
+
+	def release(self, view: memoryview) -> None:
+		"""
+		Return the slab behind the given view to the pool.
+
+		Args:
+			view (memoryview): A view previously handed out by `acquire` or `recv_into`.
+
+		Raises:
+			ValueError: If the view does not belong to this pool.
+		"""
+		slab = view.obj
+		if self._owned.get(id(slab)) is not slab:
+			raise ValueError("[CWE-1284] Buffer does not belong to this pool.")
+		view.release()
+		self._free.append(slab)
+
+	def recv_into(self, sock: _socket.socket, drops=None, stamps=None) -> memoryview:
+		"""
+		Receive one datagram from the socket directly into a free slab.
+
+		Datagrams larger than `size` are truncated, like with `socket.recv`. On error the slab is
+		returned to the pool before the error propagates.
+
+		Args:
+			sock (socket.socket): The socket to receive data from.
+			drops (multicast.skt.DropCounter, optional): Count the kernel's receive drops.
+			stamps (list, optional): Append the arrival time (see `tryrecv`) to this list.
+
+		Returns:
+			memoryview: A view of just the received bytes; return it with `release` when done.
+		"""
+		view = self.acquire()
+		try:
+			if drops is None and stamps is None:
+				nbytes = sock.recv_into(view)
+			else:
+				nbytes = multicast.skt.recv_into_meta(sock, view, drops, stamps)
+		except BaseException:
+			self.release(view)
+			raise
+		received = view[:nbytes]
+		view.release()
+		return received
+
+
+def _recv_one(sock: _socket.socket, pool=None, drops=None, stamps=None):
+	"""Receive one datagram, into a slab of the pool when one is given.
+
+	This is a helper function and should NOT be called directly.
+	"""
+	if pool is not None:
+		return pool.recv_into(sock, drops, stamps)
+	if drops is not None or stamps is not None:
+		return multicast.skt.recvfrom_meta(
+			sock, multicast._MCAST_DEFAULT_BUFFER_SIZE, drops, stamps,  # skipcq: PYL-W0212
+		)[0]
+	return sock.recv(multicast._MCAST_DEFAULT_BUFFER_SIZE)  # skipcq: PYL-W0212 - module ok
+
+
+def iter_datagrams(
+	groups, port, iface=None, bind_group=None, max_count=None, timeout=None, pool=None, drops=None,
+	timestamps=False,
+):
+	"""
+	Join multicast groups once and yield received datagrams until stopped.
+
+	Unlike `McastRECV`, which joins, receives a single hunk, and then closes the socket, this
+	generator keeps one joined socket for as long as the consumer keeps iterating. The socket is
+	closed (leaving the groups) when the iteration ends, either because `max_count` datagrams were
+	yielded, because no datagram arrived within `timeout` seconds, or because the consumer closed
+	the generator (e.g., by leaving a `for` loop early).
+
+	Individual datagrams are truncated to `_MCAST_DEFAULT_BUFFER_SIZE` bytes, the same as
+	`tryrecv`.
+
+	Args:
+		groups (list): List of multicast group addresses to join.
+		port (int): Port number to bind the socket to.
+		iface (str, optional): Network interface to use.
+		bind_group (str, optional): Specific group address to bind to.
+		max_count (int, optional): Stop after this many datagrams. Defaults to None (unlimited).
+		timeout (float, optional): Stop after this many idle seconds. Defaults to None
+			(block until the next datagram arrives).
+		pool (BufferPool, optional): Receive into the slabs of this pool instead of allocating a
+			new `bytes` object per datagram. Defaults to None.
+		drops (multicast.skt.DropCounter, optional): Count the datagrams the kernel dropped
+			(e.g., on receive buffer overflow) in this counter. Defaults to None.
+		timestamps (bool, optional): Enable kernel receive timestamps, and yield each payload with
+			its arrival time (see `tryrecv`). Defaults to False.
+
+	Yields:
+		bytes: The payload of each received datagram, or when a `pool` is given, a `memoryview`
+			of the payload that the consumer should return with `pool.release(view)`. With
+			`timestamps`, a (payload, arrival_ns) tuple instead.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> multicast.recv.iter_datagrams is not None
+		True
+		>>>
+
+	Testcase 1: iter_datagrams should be a generator that stops when idle.
+		A: Test that iter_datagrams returns a generator.
+		B: Test that the iteration ends after the idle timeout.
+
+		>>> import types
+		>>> tst_fxtr = multicast._MCAST_DEFAULT_GROUP
+		>>> tst_iter = multicast.recv.iter_datagrams(
+		... 	[tst_fxtr], 59992, None, tst_fxtr, timeout=0.1
+		... )
+		>>> isinstance(tst_iter, types.GeneratorType)
+		True
+		>>> list(tst_iter)
+		[]
+		>>>
+
+	Testcase 2: iter_datagrams should stop after max_count datagrams.
+
+		>>> list(multicast.recv.iter_datagrams(
+		... 	[tst_fxtr], 59992, None, tst_fxtr, max_count=0
+		... ))
+		[]
+		>>>
+
+	Testcase 3: iter_datagrams should accept a buffer pool.
+
+		>>> tst_pool = multicast.recv.BufferPool(4)
+		>>> list(multicast.recv.iter_datagrams(
+		... 	[tst_fxtr], 59992, None, tst_fxtr, timeout=0.1, pool=tst_pool
+		... ))
+		[]
+		>>> tst_pool.available
+		4
+		>>>
+
+
+	"""
+	sock = joinstep(groups, port, iface, bind_group, None)
+	sock.settimeout(timeout)
+	if drops is not None:
+		drops.enable(sock)
+	stamps = None
+	if timestamps:
+		multicast.skt.enableTimestamps(sock)
+		stamps = []
+	module_logger.debug("Opened %s", sock)  # lazy formatting to avoid PYL-W1203
+	count = 0
+	try:
+		while (max_count is None) or (count < max_count):
+			try:
+				chunk = _recv_one(sock, pool, drops, stamps)
+			except _socket.timeout:
+				module_logger.debug("Idle timeout reached.")
+				break
+			count += 1
+			yield (chunk, stamps.pop()) if timestamps else chunk
+	finally:
+		module_logger.debug("Closing.")
+		multicast.endSocket(sock)
+
+
+def drainstep(sock: _socket.socket, max_batch=None, pool=None) -> list:
+	"""
+	Read every datagram already queued on the socket, without blocking, up to a cap.
+
+	Meant to be called once the socket is known to be readable (e.g., right after a blocking
+	receive returned). The socket is switched to non-blocking mode and read in a loop until the
+	kernel reports it would block (`EAGAIN`), or `max_batch` datagrams were read; then the
+	previous timeout is restored. This amortizes the per-wakeup overhead across bursts.
+
+	On Linux, the whole batch is instead read with a single `recvmmsg` system call, into a
+	preallocated buffer array (or the slabs of the given `pool`). Elsewhere, or if that fails as
+	unsupported, the pure-Python loop above is used transparently. With a `pool`, a single call
+	only uses the slabs that are free (at least one), so a large `max_batch` does not grow it.
+
+	Args:
+		sock (socket.socket): The socket to receive data from.
+		max_batch (int, optional): Maximum number of datagrams to read. Defaults to
+			`_MCAST_DEFAULT_DRAIN_LIMIT`.
+		pool (BufferPool, optional): Receive into the slabs of this pool. Defaults to None.
+
+	Returns:
+		list: The received payloads (`bytes`, or `memoryview` when a `pool` is given), possibly
+			empty.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> tst_sock = multicast.genSocket()
+		>>> tst_sock.bind(("127.0.0.1", 0))
+		>>> tst_addr = tst_sock.getsockname()
+		>>>
+
+	Testcase 1: drainstep should return an empty list for an idle socket without blocking.
+
+		>>> multicast.recv.drainstep(tst_sock)
+		[]
+		>>>
+
+	Testcase 2: drainstep should read queued datagrams up to the cap and keep the timeout.
+		A: Test that at most max_batch datagrams are read.
+		B: Test that the remaining datagrams are read by the next call.
+		C: Test that the socket timeout is restored.
+
+		>>> tst_timeout = tst_sock.gettimeout()
+		>>> for tst_msg in (b"one", b"two", b"three"):
+		... 	_ = tst_sock.sendto(tst_msg, tst_addr)
+		>>> multicast.recv.drainstep(tst_sock, 2)
+		[b'one', b'two']
+		>>> multicast.recv.drainstep(tst_sock, 2)
+		[b'three']
+		>>> tst_sock.gettimeout() == tst_timeout
+		True
+		>>> multicast.endSocket(tst_sock)
+		>>>
+
+
+	"""
+	limit = int(max_batch) if max_batch is not None else _MCAST_DEFAULT_DRAIN_LIMIT
+	if limit <= 0:
+		return []
+	if multicast.skt.has_mmsg():
+		try:
+			return _drain_mmsg(sock, limit, pool)
+		except NotImplementedError:  # pragma: no cover -- defensive fallback
+			module_logger.debug("recvmmsg is unavailable, falling back.")
+	batch = []
+	timeout = sock.gettimeout()
+	sock.settimeout(0.0)
+	try:
+		while len(batch) < limit:
+			try:
+				batch.append(_recv_one(sock, pool))
+			except BlockingIOError:
+				break
+	finally:
+		sock.settimeout(timeout)
+	return batch
+
+
+_SCRATCH = threading.local()
+"""Per-thread preallocated `recvmmsg` buffer array for `_drain_mmsg` without a pool."""
+
+
+def _drain_mmsg(sock: _socket.socket, limit: int, pool=None) -> list:
+	"""Read up to `limit` queued datagrams with one `recvmmsg` system call.
+
+	This is a helper function and should NOT be called directly.
+	"""
+	if pool is None:
+		size = multicast._MCAST_DEFAULT_BUFFER_SIZE  # skipcq: PYL-W0212 - module ok
+		scratch = getattr(_SCRATCH, "batch", None)
+		if scratch is None or scratch.count < limit or scratch.size != size:
+			scratch = multicast.skt.MMsgBuffer(limit, size)
+			_SCRATCH.batch = scratch
+		return scratch.payloads(scratch.recv(sock, limit))
+	# only take free slabs, the rest stays queued for the next call instead of growing the pool
+	views = [pool.acquire() for _ in range(max(1, min(limit, pool.available)))]
+	try:
+		sizes = multicast.skt.recvmmsg(sock, views)
+	except BaseException:
+		for view in views:
+			pool.release(view)
+		raise
+	batch = []
+	for (index, view) in enumerate(views):
+		if index < len(sizes):
+			batch.append(view[:sizes[index]])
+			view.release()
+		else:
+			pool.release(view)
+	return batch
+
+
+def iter_batches(
+	groups, port, iface=None, bind_group=None, max_batch=None, timeout=None, pool=None, drops=None,
+):
+	"""
+	Join multicast groups once and yield lists of datagrams, one list per wakeup.
+
+	Like `iter_datagrams`, but after each blocking receive returns, everything else already
+	queued on the socket is read without blocking (see `drainstep`), and the whole burst is
+	yielded as one list of at most `max_batch` datagrams.
+
+	Args:
+		groups (list): List of multicast group addresses to join.
+		port (int): Port number to bind the socket to.
+		iface (str, optional): Network interface to use.
+		bind_group (str, optional): Specific group address to bind to.
+		max_batch (int, optional): Maximum number of datagrams per batch. Defaults to
+			`_MCAST_DEFAULT_DRAIN_LIMIT`.
+		timeout (float, optional): Stop after this many idle seconds. Defaults to None
+			(block until the next datagram arrives).
+		pool (BufferPool, optional): Receive into the slabs of this pool. Defaults to None.
+		drops (multicast.skt.DropCounter, optional): Count the datagrams the kernel dropped in
+			this counter, as of the first datagram of each batch. Defaults to None.
+
+	Yields:
+		list: A non-empty list of payloads (`bytes`, or `memoryview` when a `pool` is given).
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> tst_fxtr = multicast._MCAST_DEFAULT_GROUP
+		>>>
+
+	Testcase 1: iter_batches should stop when idle.
+
+		>>> list(multicast.recv.iter_batches([tst_fxtr], 59992, None, tst_fxtr, timeout=0.1))
+		[]
+		>>>
+
+
+	"""
+	limit = int(max_batch) if max_batch is not None else _MCAST_DEFAULT_DRAIN_LIMIT
+	sock = joinstep(groups, port, iface, bind_group, None)
+	sock.settimeout(timeout)
+	if drops is not None:
+		drops.enable(sock)
+	module_logger.debug("Opened %s", sock)  # lazy formatting to avoid PYL-W1203
+	try:
+		while True:
+			try:
+				batch = [_recv_one(sock, pool, drops)]
+			except _socket.timeout:
+				module_logger.debug("Idle timeout reached.")
+				break
+			batch.extend(drainstep(sock, limit - 1, pool))
+			yield batch
+	finally:
+		module_logger.debug("Closing.")
+		multicast.endSocket(sock)
+
+
 class McastRECV(multicast.mtool):
 	"""
 	Subclasses the multicast.mtool to provide the RECV functions.
@@ -578,7 +1704,10 @@ def setupArgs(cls, parser):
 		pass  # skipcq - Optional abstract method
 
 	@staticmethod
-	def _hearstep(groups, port, iface=None, bind_group=None):
+	def _hearstep(
+		groups, port, iface=None, bind_group=None, binary=False, accumulator=None,
+		sources=None, blocked=None,
+	):
 		"""
 		Will listen on the given port of an interface for multicast messages to the given group(s).
 
@@ -591,9 +1720,16 @@ def _hearstep(groups, port, iface=None, bind_group=None):
 			port (int): Port number for receiving messages.
 			iface (str, optional): Network interface to use.
 			bind_group (str, optional): Specific group address to bind to.
+			binary (bool, optional): Return the raw bytes without decoding. Defaults to False.
+			accumulator (MessageAccumulator, optional): Collects the received data, e.g., to bound
+				memory use with `max_size` and `spill`. Defaults to an unbounded accumulator.
+			sources (list, optional): Only receive from these senders (see `joinstep`).
+			blocked (list, optional): Block these senders (see `joinstep`).
 
 		Returns:
-			str: Any received message buffer as a string. May be empty.
+			str: Any received message buffer as a string (or as bytes if binary). May be empty.
+				When the accumulator spilled to disk, it is returned itself instead, to be read
+				back a chunk at a time (see `MessageAccumulator.iter_chunks`).
 		Raises:
 			NotImplementedError: if joining the multicast group is unsupported on the current system.
 
@@ -638,9 +1774,9 @@ def _hearstep(groups, port, iface=None, bind_group=None):
 			"Joining %s on port %d using %s as %s",  # lazy formatting to avoid PYL-W1203
 			str(groups), port, str(iface), bind_group,
 		)
-		sock = joinstep(groups, port, iface, bind_group, None)
+		sock = joinstep(groups, port, iface, bind_group, None, sources, blocked)
 		module_logger.debug("Opened %s", sock)  # lazy formatting to avoid PYL-W1203
-		msgbuffer = str(multicast._BLANK)  # skipcq: PYL-W0212 - module ok
+		msgbuffer = MessageAccumulator() if accumulator is None else accumulator
 		chunk = None
 		module_logger.debug("Ready.")
 		msgbuffer = recvstep(msgbuffer, chunk, sock)
@@ -648,7 +1784,36 @@ def _hearstep(groups, port, iface=None, bind_group=None):
 		module_logger.debug("Closing.")
 		multicast.endSocket(sock)
 		module_logger.debug("Done.")
-		return msgbuffer
+		if msgbuffer.spilled:
+			return msgbuffer  # too large to join in memory
+		return msgbuffer.getvalue() if binary else msgbuffer.text()
+
+	@staticmethod
+	def _print_response(response, binary: bool) -> None:  # pragma: no cover
+		"""
+		Print a received response to the console, streaming it when it spilled to disk.
+
+		This is a helper method and should NOT be called directly.
+
+		Args:
+			response (str, bytes, or MessageAccumulator): The response from `_hearstep`.
+			binary (bool): Write raw bytes to the underlying binary stdout when available.
+		"""
+		_pieces = [response]
+		if isinstance(response, MessageAccumulator):  # spilled, so stream it from disk
+			_pieces = response.iter_chunks() if binary else response.iter_text()
+		_raw_out = getattr(sys.stdout, "buffer", None) if binary else None
+		if _raw_out is not None:
+			sys.stdout.flush()
+			for _piece in _pieces:
+				_raw_out.write(_piece)
+			_raw_out.flush()
+		else:
+			print(multicast._BLANK)  # skipcq: PYL-W0212 - module ok
+			for _piece in _pieces:
+				sys.stdout.write(str(_piece))
+			print(multicast._BLANK)  # skipcq: PYL-W0212 - module ok
+			print(multicast._BLANK)  # skipcq: PYL-W0212 - module ok
 
 	def doStep(self, *args, **kwargs):
 		"""
@@ -660,11 +1825,27 @@ def doStep(self, *args, **kwargs):
 		Args:
 			*args: Variable length argument list containing command-line arguments.
 			**kwargs: Arbitrary keyword arguments.
+			- binary (bool): Receive raw bytes without any text transcoding (default: False).
+			- accumulator (MessageAccumulator): Collects the received data (default: unbounded).
+			- sources (list): Only receive from these senders (default: MULTICAST_SOURCES).
+			- blocked_sources (list): Block these senders (default: MULTICAST_BLOCKED_SOURCES).
 
 		Returns:
-			tuple: A tuple containing received data and a status indicator.
+			tuple: A tuple containing received data and a status indicator. Data spilled to disk
+				by the accumulator is returned as the accumulator itself, see `_hearstep`.
 		"""
 		module_logger.debug("RECV")
+		_is_binary = kwargs.get("binary", False)
+		# only pass the optional arguments when requested, to keep the legacy text call unchanged
+		_hear_kwargs = {}
+		if _is_binary:
+			_hear_kwargs["binary"] = True
+		if kwargs.get("accumulator") is not None:
+			_hear_kwargs["accumulator"] = kwargs["accumulator"]
+		if kwargs.get("sources") is not None:
+			_hear_kwargs["sources"] = kwargs["sources"]
+		if kwargs.get("blocked_sources") is not None:
+			_hear_kwargs["blocked"] = kwargs["blocked_sources"]
 		response = self._hearstep(
 			kwargs.get(
 				"groups",
@@ -673,13 +1854,12 @@ def doStep(self, *args, **kwargs):
 			kwargs.get("port", multicast._MCAST_DEFAULT_PORT),  # skipcq: PYL-W0212 - module ok
 			kwargs.get("iface", None),  # skipcq: PTC-W0039 - ensure None by default
 			kwargs.get("group", multicast._MCAST_DEFAULT_GROUP),  # skipcq: PYL-W0212 - module ok
+			**_hear_kwargs,
 		)
 		_is_std = kwargs.get("is_std", False)
 		if (sys.stdout.isatty() or _is_std) and (len(response) > 0):  # pragma: no cover
 			module_logger.debug("Will Print to Console.")
-			print(multicast._BLANK)  # skipcq: PYL-W0212 - module ok
-			print(str(response))
-			print(multicast._BLANK)  # skipcq: PYL-W0212 - module ok
+			self._print_response(response, _is_binary)
 		_result = (len(response) > 0) is True
 		if _result:
 			module_logger.info("Success")
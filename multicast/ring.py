@@ -0,0 +1,735 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Provides a shared-memory fan-out ring for local multicast subscribers.
+
+When many processes on one host join the same group, the kernel copies every datagram into each
+of their socket buffers. Instead, a single fan-out process may receive each datagram once (through
+`multicast.recv.joinstep`), straight into a slot of a `multiprocessing.shared_memory` ring buffer,
+from which any number of local processes then read it, without copying, through memoryviews.
+
+The ring has one writer and any number of readers. Every datagram gets the next sequence number
+(starting at 1), and is stored in the slot of that sequence number modulo the number of slots. So
+a reader that falls more than a full ring behind the writer has lost datagrams: readers detect
+such overruns, skip to the oldest datagram still in the ring, and count the lost datagrams.
+
+Caution: See details regarding dynamic imports [documented](../__init__.py) in this module.
+
+Classes:
+	McastRing: A shared-memory ring buffer of datagrams, written by one process.
+	RingReader: A reader of a McastRing, in any local process, with overrun detection.
+	RingFanout: Receives multicast datagrams once, and writes them into a McastRing.
+
+Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+	Testcase 0: Multicast should be importable.
+
+		>>> import multicast
+		>>>
+
+	Testcase 1: Ring should be automatically imported.
+		A: Test that the ring component is initialized.
+		B: Test that the ring.__MAGIC__ components are initialized.
+
+		>>> multicast.ring is not None
+		True
+		>>> multicast.ring.__doc__ is not None
+		True
+		>>> multicast.ring.__module__ is not None
+		True
+		>>> multicast.ring.McastRing is not None
+		True
+		>>> multicast.ring.RingReader is not None
+		True
+		>>>
+
+
+"""
+
+__package__ = "multicast"  # skipcq: PYL-W0622
+"""The package of this program.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+	Testcase 0: Multicast should be importable.
+
+		>>> import multicast
+		>>>
+
+	Testcase 1: Ring should be automatically imported.
+
+		>>> multicast.ring.__package__ is not None
+		True
+		>>>
+		>>> multicast.ring.__package__ == multicast.__package__
+		True
+		>>>
+
+"""
+
+__module__ = "multicast"
+"""The module of this program.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+	Testcase 0: Multicast should be importable.
+
+		>>> import multicast
+		>>>
+
+	Testcase 1: Ring should be automatically imported.
+
+		>>> multicast.ring.__module__ is not None
+		True
+		>>>
+
+"""
+
+__file__ = "multicast/ring.py"
+"""The file of this component."""
+
+__name__ = "multicast.ring"  # skipcq: PYL-W0622 - Ensures the correct name value.
+"""The name of this component.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+	Testcase 0: Multicast should be importable.
+
+		>>> import multicast
+		>>>
+
+	Testcase 1: Ring should be automatically imported.
+
+		>>> multicast.ring.__name__ is not None
+		True
+		>>>
+
+"""
+
+try:
+	import sys
+	if "multicast" not in sys.modules:
+		# skipcq
+		from . import multicast as multicast  # pylint: disable=cyclic-import - skipcq: PYL-C0414
+	else:  # pragma: no branch
+
+		multicast = sys.modules["multicast"]
+	_BLANK = multicast._BLANK  # skipcq: PYL-W0212 - module ok
+	# skipcq
+	from . import recv as recv  # pylint: disable=useless-import-alias  -  skipcq: PYL-C0414
+except Exception as _cause:
+	del _cause  # skipcq - cleanup any error leaks early
+	# skipcq
+	import multicast as multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401, PYL-C0414
+
+try:
+	import logging
+	import select
+	import threading
+	import time
+	from multiprocessing import shared_memory
+	from multicast import socket as _socket  # skipcq: PYL-C0414
+	from multicast import struct as _struct  # skipcq: PYL-C0414
+	depends = [shared_memory, _socket, _struct]
+	for unit in depends:
+		try:
+			if unit.__name__ is None:  # pragma: no branch
+				raise ImportError(
+					f"[CWE-440] module failed to import {str(unit)}."
+				) from None
+		except Exception as _cause:  # pragma: no branch
+			raise ImportError("[CWE-758] Module failed completely.") from _cause
+except Exception as baton:  # pragma: no branch
+	raise ImportError(baton) from baton
+
+
+module_logger = logging.getLogger(__name__)
+module_logger.debug(
+	"Loading %s",  # lazy formatting to avoid PYL-W1203
+	__name__,
+)
+
+
+_RING_MAGIC: bytes = b"MCRG"
+"""Identifies the shared memory of a McastRing."""
+
+
+_RING_HEADER = _struct.Struct("=4sIIIQ")
+"""The ring header: magic, slot count, slot size, reserved, and the last written sequence number.
+
+	The last written sequence number is the 8-byte aligned field at `_RING_HEAD_OFFSET`.
+"""
+
+
+_RING_HEAD_OFFSET: int = 16
+"""Offset of the last written sequence number in the ring header."""
+
+
+_RING_SLOT = _struct.Struct("=QI4x")
+"""The slot header: the sequence number of the datagram in the slot (0 while writing), and its
+length. The payload follows."""
+
+
+_RING_SEQUENCE = _struct.Struct("=Q")
+"""A sequence number, as stored in the ring."""
+
+
+_MCAST_DEFAULT_RING_SLOTS: int = 1024
+"""Default number of slots (datagrams) in a McastRing.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> multicast.ring._MCAST_DEFAULT_RING_SLOTS >= 1
+		True
+		>>>
+
+"""
+
+
+_MCAST_DEFAULT_RING_SLOT_SIZE: int = 65507
+"""Default payload size of each McastRing slot, enough for any UDP datagram over IPv4."""
+
+
+def _slot_stride(slot_size: int) -> int:
+	"""Return the bytes used per slot, keeping every slot header 8-byte aligned."""
+	return _RING_SLOT.size + ((slot_size + 7) & ~7)
+
+
+def _untrack(shm) -> None:
+	"""
+	Stop the resource tracker of this process from unlinking shared memory it did not create.
+
+	Before Python 3.13, merely attaching to shared memory registers it with the resource tracker,
+	which then unlinks it (out from under the writer and the other readers) when this process exits.
+	"""
+	if sys.version_info >= (3, 13):  # pragma: no cover -- attaching is no longer tracked
+		return
+	try:
+		from multiprocessing import resource_tracker
+		resource_tracker.unregister(shm._name, "shared_memory")  # skipcq: PYL-W0212 - fixes bpo-39959
+	except Exception as _cause:  # pragma: no cover -- defensive code branch
+		module_logger.debug(
+			"Could not untrack shared memory: %s",  # lazy formatting to avoid PYL-W1203
+			_cause,
+		)
+
+
+class McastRing:
+	"""
+	A shared-memory ring buffer of datagrams, with one writer.
+
+	The writer creates the ring, and local readers attach to it by `name` (see `RingReader`). Each
+	datagram is either copied in with `write`, or received straight into its slot with `recv_into`.
+	Either way, a slot is marked as being written (sequence number 0) before its payload changes,
+	and its sequence number is only stored (followed by the ring's `head`) once the payload is
+	complete, so readers never mistake a partially written slot for a datagram. A write that fails
+	(e.g., a receive timing out) restores the slot (see `abort`), so the oldest datagram survives.
+
+	Attributes:
+		name (str): The name of the shared memory, for readers to attach to.
+		slots (int): The number of datagrams the ring holds.
+		slot_size (int): The maximum payload size of each datagram.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: McastRing should number each written datagram.
+
+		>>> ring = multicast.ring.McastRing(slots=4, slot_size=16)
+		>>> (ring.head, ring.write(b"one"), ring.write(b"two"), ring.head)
+		(0, 1, 2, 2)
+		>>> ring.close()
+		>>> ring.unlink()
+		>>>
+
+	Testcase 1: McastRing should reject oversized datagrams.
+
+		>>> ring = multicast.ring.McastRing(slots=4, slot_size=2)
+		>>> ring.write(b"one")  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: [CWE-120] Datagram of 3 bytes exceeds the slot size of 2.
+		>>> ring.close()
+		>>> ring.unlink()
+		>>>
+
+	"""
+
+	__module__ = "multicast.ring"
+
+	__name__ = "multicast.ring.McastRing"
+
+	def __init__(
+		self,
+		name: str = None,
+		slots: int = _MCAST_DEFAULT_RING_SLOTS,
+		slot_size: int = _MCAST_DEFAULT_RING_SLOT_SIZE,
+	) -> None:
+		"""
+		Create a new ring in shared memory.
+
+		Args:
+			name (str, optional): The name of the shared memory. Defaults to a random name.
+			slots (int): The number of datagrams the ring holds. Defaults to 1024.
+			slot_size (int): The maximum payload size of each datagram. Defaults to 65507.
+		"""
+		self.slots = max(1, int(slots))
+		self.slot_size = max(1, int(slot_size))
+		self._stride = _slot_stride(self.slot_size)
+		self._shm = shared_memory.SharedMemory(
+			name=name, create=True, size=_RING_HEADER.size + (self.slots * self._stride),
+		)
+		self.name = self._shm.name
+		_RING_HEADER.pack_into(self._shm.buf, 0, _RING_MAGIC, self.slots, self.slot_size, 0, 0)
+		self._head = 0
+		self._pending = 0
+		self._replaced = (0, 0)
+
+	@property
+	def head(self) -> int:
+		"""The sequence number of the last written datagram (0 before the first one)."""
+		return self._head
+
+	def _slot_offset(self, seq: int) -> int:
+		"""Return the offset of the slot holding the sequence number."""
+		return _RING_HEADER.size + ((seq % self.slots) * self._stride)
+
+	def reserve(self) -> memoryview:
+		"""
+		Claim the slot of the next datagram, and return its payload buffer.
+
+		The slot is marked as being written, until `commit` publishes it (or `abort` restores it).
+
+		Returns:
+			memoryview: The writable payload buffer of the slot, of `slot_size` bytes.
+		"""
+		self._pending = self._head + 1
+		offset = self._slot_offset(self._pending)
+		self._replaced = _RING_SLOT.unpack_from(self._shm.buf, offset)
+		_RING_SLOT.pack_into(self._shm.buf, offset, 0, 0)
+		start = offset + _RING_SLOT.size
+		return self._shm.buf[start:start + self.slot_size]
+
+	def commit(self, nbytes: int) -> int:
+		"""
+		Publish the reserved slot, holding a datagram of `nbytes` bytes.
+
+		Args:
+			nbytes (int): The length of the datagram in the reserved slot.
+
+		Returns:
+			int: The sequence number of the datagram.
+		"""
+		seq = self._pending
+		_RING_SLOT.pack_into(self._shm.buf, self._slot_offset(seq), seq, nbytes)
+		_RING_SEQUENCE.pack_into(self._shm.buf, _RING_HEAD_OFFSET, seq)
+		self._head = seq
+		return seq
+
+	def abort(self) -> None:
+		"""
+		Give up the reserved slot, restoring the header of the datagram it held.
+
+		Only valid while the slot's payload is unchanged, i.e. when nothing was written into the
+		buffer returned by `reserve`.
+		"""
+		_RING_SLOT.pack_into(self._shm.buf, self._slot_offset(self._pending), *self._replaced)
+
+	def write(self, data) -> int:
+		"""
+		Copy one datagram into the ring.
+
+		Args:
+			data (bytes): The datagram.
+
+		Returns:
+			int: The sequence number of the datagram.
+
+		Raises:
+			ValueError: If the datagram is larger than `slot_size`.
+		"""
+		nbytes = len(data)
+		if nbytes > self.slot_size:
+			raise ValueError(
+				f"[CWE-120] Datagram of {nbytes} bytes exceeds the slot size of {self.slot_size}."
+			)
+		view = self.reserve()
+		try:
+			view[:nbytes] = data
+		except BaseException:
+			self.abort()
+			raise
+		finally:
+			view.release()
+		return self.commit(nbytes)
+
+	def recv_into(self, sock: _socket.socket, drops=None) -> int:
+		"""
+		Receive one datagram from the socket straight into the ring, without an extra copy.
+
+		Waits (up to the socket's timeout) for a datagram before claiming its slot, so the oldest
+		datagram stays readable while the socket is idle, and restores the slot if the receive
+		fails anyway.
+
+		Args:
+			sock (socket.socket): The receive socket.
+			drops (multicast.skt.DropCounter, optional): Updated from the ancillary data.
+
+		Returns:
+			int: The sequence number of the datagram.
+
+		Raises:
+			socket.timeout: If no datagram arrived within the socket's timeout.
+		"""
+		timeout = sock.gettimeout()
+		if timeout != 0 and not select.select([sock], [], [], timeout)[0]:
+			raise _socket.timeout("timed out")
+		view = self.reserve()
+		try:
+			nbytes = multicast.skt.recv_into_meta(sock, view, drops)
+		except BaseException:
+			self.abort()
+			raise
+		finally:
+			view.release()
+		return self.commit(nbytes)
+
+	def close(self) -> None:
+		"""Detach from the shared memory. Readers keep their own attachment."""
+		self._shm.close()
+
+	def unlink(self) -> None:
+		"""Remove the shared memory, once every process is done with it."""
+		self._shm.unlink()
+
+	def __enter__(self):
+		"""Return the ring."""
+		return self
+
+	def __exit__(self, *args) -> None:
+		"""Close and remove the ring."""
+		self.close()
+		self.unlink()
+
+
+class RingReader:
+	"""
+	A reader of a McastRing, in any local process.
+
+	Each reader keeps its own position, so every reader sees every datagram (unless it falls
+	behind). Datagrams are returned as read-only memoryviews into the shared memory, so reading
+	copies nothing. A view remains valid until the writer laps the ring and reuses its slot; check
+	`valid` after using a view, or copy it with `bytes` to keep it.
+
+	When the writer gets more than a full ring ahead, the reader detects the overrun, skips ahead to
+	the oldest datagram still in the ring, and adds the skipped datagrams to `lost`.
+
+	Attributes:
+		name (str): The name of the ring's shared memory.
+		next_seq (int): The sequence number of the next datagram to read.
+		overruns (int): The number of times the reader fell a full ring behind.
+		lost (int): The cumulative number of datagrams overwritten before they were read.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: RingReader should read each datagram, in order.
+
+		>>> ring = multicast.ring.McastRing(slots=4, slot_size=16)
+		>>> reader = multicast.ring.RingReader(ring.name, start=1)
+		>>> _ = ring.write(b"one")
+		>>> _ = ring.write(b"two")
+		>>> [(seq, bytes(view)) for (seq, view) in reader]
+		[(1, b'one'), (2, b'two')]
+		>>> reader.read() is None
+		True
+		>>>
+
+	Testcase 1: RingReader should detect overruns, and count the lost datagrams.
+
+		>>> for count in range(6):
+		... 	_ = ring.write(f"{count}".encode())
+		>>> [(seq, bytes(view)) for (seq, view) in reader]
+		[(5, b'2'), (6, b'3'), (7, b'4'), (8, b'5')]
+		>>> (reader.overruns, reader.lost)
+		(1, 2)
+		>>> reader.close()
+		>>> ring.close()
+		>>> ring.unlink()
+		>>>
+
+	"""
+
+	__module__ = "multicast.ring"
+
+	__name__ = "multicast.ring.RingReader"
+
+	def __init__(self, name: str, start: int = None) -> None:
+		"""
+		Attach to a ring by name.
+
+		Args:
+			name (str): The name of the ring's shared memory (see `McastRing.name`).
+			start (int, optional): The sequence number to start reading from. Defaults to None,
+				to only read datagrams written from now on.
+
+		Raises:
+			ValueError: If the shared memory does not hold a McastRing.
+		"""
+		self._shm = shared_memory.SharedMemory(name=name, create=False)
+		_untrack(self._shm)
+		(magic, slots, slot_size, _, head) = _RING_HEADER.unpack_from(self._shm.buf, 0)
+		if magic != _RING_MAGIC:
+			self._shm.close()
+			raise ValueError(f"[CWE-20] Shared memory {name} does not hold a McastRing.")
+		self.name = name
+		self.slots = slots
+		self.slot_size = slot_size
+		self._stride = _slot_stride(slot_size)
+		self.next_seq = (head + 1) if start is None else max(1, int(start))
+		self.overruns = 0
+		self.lost = 0
+
+	@property
+	def head(self) -> int:
+		"""The sequence number of the last datagram the writer published."""
+		return _RING_SEQUENCE.unpack_from(self._shm.buf, _RING_HEAD_OFFSET)[0]
+
+	@property
+	def backlog(self) -> int:
+		"""The number of published datagrams not read yet (may exceed the ring)."""
+		return max(0, self.head - self.next_seq + 1)
+
+	def _slot_offset(self, seq: int) -> int:
+		"""Return the offset of the slot holding the sequence number."""
+		return _RING_HEADER.size + ((seq % self.slots) * self._stride)
+
+	def _skip_to(self, seq: int) -> None:
+		"""Record an overrun, skipping ahead to the sequence number."""
+		self.overruns += 1
+		self.lost += seq - self.next_seq
+		module_logger.debug(
+			"Ring %s overrun, lost %d datagrams.",  # lazy formatting to avoid PYL-W1203
+			self.name, seq - self.next_seq,
+		)
+		self.next_seq = seq
+
+	def valid(self, seq: int) -> bool:
+		"""
+		Check that the datagram of a sequence number is still in its slot.
+
+		Args:
+			seq (int): The sequence number returned with a view by `read`.
+
+		Returns:
+			bool: True if the view's contents are still that datagram, False if it was overwritten.
+		"""
+		return _RING_SLOT.unpack_from(self._shm.buf, self._slot_offset(seq))[0] == seq
+
+	def read(self, timeout: float = 0.0):
+		"""
+		Read the next datagram.
+
+		Args:
+			timeout (float): Seconds to wait for a datagram to be published. Defaults to 0.0.
+
+		Returns:
+			tuple: The (sequence number, read-only memoryview) of the datagram, or None if no
+				datagram was published before the timeout.
+		"""
+		deadline = None
+		while True:
+			head = self.head
+			if head >= self.next_seq:
+				if head - self.next_seq >= self.slots:
+					self._skip_to(head - self.slots + 1)
+				offset = self._slot_offset(self.next_seq)
+				(seq, nbytes) = _RING_SLOT.unpack_from(self._shm.buf, offset)
+				if seq == self.next_seq:
+					start = offset + _RING_SLOT.size
+					view = self._shm.buf[start:start + nbytes].toreadonly()
+					if self.valid(seq):
+						self.next_seq += 1
+						return (seq, view)
+					view.release()
+				# the writer lapped this reader while reading, so catch up to the writer
+				self._skip_to(max(self.next_seq + 1, self.head - self.slots + 2))
+				continue
+			if deadline is None:
+				if timeout <= 0:
+					return None
+				deadline = time.monotonic() + timeout
+			elif time.monotonic() >= deadline:
+				return None
+			time.sleep(0.0005)
+
+	def __iter__(self):
+		"""Yield every datagram published so far, without waiting."""
+		item = self.read()
+		while item is not None:
+			yield item
+			item = self.read()
+
+	def close(self) -> None:
+		"""Detach from the shared memory. Views returned by `read` must be released first."""
+		self._shm.close()
+
+	def __enter__(self):
+		"""Return the reader."""
+		return self
+
+	def __exit__(self, *args) -> None:
+		"""Detach from the shared memory."""
+		self.close()
+
+
+class RingFanout:
+	"""
+	Receives multicast datagrams once, and writes them into a McastRing for local readers.
+
+	The socket is joined by `multicast.recv.joinstep`, and each datagram is received straight into
+	its ring slot (see `McastRing.recv_into`), so it is neither copied per subscriber by the kernel,
+	nor copied again in user space.
+
+	Attributes:
+		ring (McastRing): The ring the datagrams are written into.
+		drops (multicast.skt.DropCounter): The datagrams the kernel dropped before they were read.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: RingFanout should write received datagrams into the ring.
+
+		>>> fanout = multicast.ring.RingFanout(['224.0.0.1'], 0, bind_group='224.0.0.1', slots=8)
+		>>> reader = multicast.ring.RingReader(fanout.ring.name)
+		>>> tst_port = fanout.socket.getsockname()[1]
+		>>> with multicast.send.McastSender('224.0.0.1', tst_port) as tst_sender:
+		... 	_ = tst_sender.send(b"fan-out")
+		>>> fanout.step()
+		1
+		>>> [bytes(view) for (_, view) in reader]
+		[b'fan-out']
+		>>> reader.close()
+		>>> fanout.close()
+		>>>
+
+	"""
+
+	__module__ = "multicast.ring"
+
+	__name__ = "multicast.ring.RingFanout"
+
+	def __init__(
+		self,
+		groups: list = None,
+		port: int = None,
+		iface: str = None,
+		bind_group: str = None,
+		name: str = None,
+		slots: int = _MCAST_DEFAULT_RING_SLOTS,
+		slot_size: int = _MCAST_DEFAULT_RING_SLOT_SIZE,
+	) -> None:
+		"""
+		Join the groups, and create the ring.
+
+		Args:
+			groups (list, optional): List of multicast group addresses to join.
+			port (int, optional): Port number to bind to. Defaults to the default port.
+			iface (str, optional): Network interface to use.
+			bind_group (str, optional): Specific group address to bind to.
+			name (str, optional): The name of the ring's shared memory. Defaults to a random name.
+			slots (int): The number of datagrams the ring holds. Defaults to 1024.
+			slot_size (int): The maximum payload size of each datagram. Defaults to 65507.
+		"""
+		if port is None:
+			port = multicast._MCAST_DEFAULT_PORT  # skipcq: PYL-W0212 - module ok
+		self.socket = recv.joinstep(groups, port, iface, bind_group, multicast.genSocket())
+		self.drops = multicast.skt.DropCounter()
+		self.drops.enable(self.socket)
+		self.ring = McastRing(name, slots, slot_size)
+		self._stopped = threading.Event()
+
+	def step(self) -> int:
+		"""
+		Receive one datagram into the ring.
+
+		Returns:
+			int: The sequence number of the datagram, or 0 if none arrived before the timeout.
+		"""
+		try:
+			return self.ring.recv_into(self.socket, self.drops)
+		except _socket.timeout:
+			return 0
+
+	def serve_forever(self) -> None:
+		"""Receive datagrams into the ring, until `shutdown` is called."""
+		self._stopped.clear()
+		while not self._stopped.is_set():
+			self.step()
+
+	def shutdown(self) -> None:
+		"""Stop `serve_forever`, within the socket timeout."""
+		self._stopped.set()
+
+	def close(self) -> None:
+		"""Leave the groups, and remove the ring."""
+		multicast.endSocket(self.socket)
+		self.ring.close()
+		self.ring.unlink()
+
+	def __enter__(self):
+		"""Return the fan-out."""
+		return self
+
+	def __exit__(self, *args) -> None:
+		"""Leave the groups, and remove the ring."""
+		self.close()
+
+
+__all__ = [
+	"""__package__""",
+	"""__module__""",
+	"""__name__""",
+	"""__doc__""",  # skipcq: PYL-E0603
+	"""McastRing""",
+	"""RingReader""",
+	"""RingFanout""",
+]
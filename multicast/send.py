@@ -63,6 +63,10 @@
 		True
 		>>>
 
+		>>> multicast.send.McastSender is not None
+		True
+		>>>
+
 
 """
 
@@ -171,6 +175,270 @@
 )
 
 
+_MCAST_DEFAULT_SEND_BATCH: int = 64
+"""Number of buffer-sized chunks of piped input read, and sent as one batch, at a time.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> multicast.send._MCAST_DEFAULT_SEND_BATCH >= 1
+		True
+		>>>
+
+"""
+
+
+class McastSender:
+	"""
+	Reusable multicast sender with a long-lived send socket.
+
+	Opens its socket once (lazily, on first use or explicitly via `open()`) and keeps it until
+	`close()` is called, so sending many messages costs one `sendto` each, instead of a full
+	socket create/configure/send/shutdown/close cycle per message. Safe to use as a context
+	manager, which closes the socket on exit.
+
+	Args:
+		group (str, optional): Multicast group address to send to.
+			Defaults to multicast._MCAST_DEFAULT_GROUP.
+		port (int, optional): Port number to send to. Defaults to multicast._MCAST_DEFAULT_PORT.
+		ttl (int, optional): Multicast time-to-live. Defaults to multicast._MCAST_DEFAULT_TTL.
+		iface (str, optional): IPv4 address of the local interface to send from.
+			Defaults to None (let the system choose).
+
+	Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>> multicast.send.McastSender is not None
+			True
+			>>>
+
+		Testcase 0: McastSender should use the defaults.
+
+			>>> tst_sender = multicast.send.McastSender()
+			>>> tst_sender.group == multicast._MCAST_DEFAULT_GROUP
+			True
+			>>> tst_sender.port == multicast._MCAST_DEFAULT_PORT
+			True
+			>>> tst_sender.ttl == multicast._MCAST_DEFAULT_TTL
+			True
+			>>> tst_sender.is_open
+			False
+			>>>
+
+		Testcase 1: McastSender should keep one socket across sends.
+
+			>>> with multicast.send.McastSender(port=59991) as tst_sender:
+			...     tst_sock = tst_sender.socket
+			...     tst_sender.send(b"one") == 3
+			...     tst_sender.send(b"two") == 3
+			...     tst_sender.socket is tst_sock
+			True
+			True
+			True
+			>>> tst_sender.is_open
+			False
+			>>> tst_sock #doctest: -DONT_ACCEPT_BLANKLINE, +ELLIPSIS
+			<socket.socket [closed]...>
+			>>>
+
+	"""
+
+	__module__ = "multicast.send"
+
+	__name__ = "multicast.send.McastSender"
+
+	def __init__(self, group=None, port=None, ttl=None, iface=None) -> None:
+		"""
+		Initialize a new McastSender without opening the socket yet.
+
+		Args:
+			group (str, optional): Multicast group address to send to.
+			port (int, optional): Port number to send to.
+			ttl (int, optional): Multicast time-to-live.
+			iface (str, optional): IPv4 address of the local interface to send from.
+
+		Returns:
+			None
+		"""
+		self.group = multicast._MCAST_DEFAULT_GROUP if group is None else group  # skipcq: PYL-W0212
+		_default_port = multicast._MCAST_DEFAULT_PORT  # skipcq: PYL-W0212 - module ok
+		self.port = _default_port if port is None else int(port)
+		self.ttl = multicast._MCAST_DEFAULT_TTL if ttl is None else int(ttl)  # skipcq: PYL-W0212
+		self.iface = iface
+		self._sock = None
+		self._use_gso = multicast.skt.UDP_SEGMENT is not None
+		self._use_mmsg = multicast.skt.has_mmsg()
+
+	@property
+	def socket(self) -> _socket.socket:
+		"""The underlying send socket, or None when not open."""
+		return self._sock
+
+	@property
+	def is_open(self) -> bool:
+		"""True while the underlying send socket is open."""
+		return self._sock is not None
+
+	def open(self):
+		"""
+		Open and configure the send socket, if not already open.
+
+		Returns:
+			McastSender: This sender, for chaining.
+		"""
+		if self._sock is None:
+			sock = multicast.genSocket()
+			try:
+				if self.ttl != multicast._MCAST_DEFAULT_TTL:  # skipcq: PYL-W0212 - module ok
+					sock.setsockopt(_socket.IPPROTO_IP, _socket.IP_MULTICAST_TTL, self.ttl)
+				if self.iface is not None:
+					sock.setsockopt(
+						_socket.IPPROTO_IP, _socket.IP_MULTICAST_IF, _socket.inet_aton(self.iface),
+					)
+			except OSError as _cause:
+				multicast.endSocket(sock)
+				raise OSError("[CWE-440] Socket operation failed.") from _cause
+			self._sock = sock
+			if __debug__:
+				module_logger.debug(
+					"Opened sender for (%s, %d).",  # lazy formatting to avoid PYL-W1203
+					self.group, self.port,
+				)
+		return self
+
+	def send(self, data) -> int:
+		"""
+		Send one datagram to the group.
+
+		Args:
+			data (bytes): The payload to send (any bytes-like object).
+
+		Returns:
+			int: The number of bytes sent.
+		"""
+		if self._sock is None:
+			self.open()
+		return self._sock.sendto(data, (self.group, self.port))
+
+	def send_to(self, data, address: tuple) -> int:
+		"""
+		Send one datagram to another address, such as a unicast reply, over the same socket.
+
+		Args:
+			data (bytes): The payload to send (any bytes-like object).
+			address (tuple): The (host, port) to send to.
+
+		Returns:
+			int: The number of bytes sent.
+		"""
+		if self._sock is None:
+			self.open()
+		return self._sock.sendto(data, address)
+
+	def send_many(self, payloads) -> int:
+		"""
+		Send many datagrams to the group, with as few system calls as possible.
+
+		On Linux, equally sized payloads (all but the last, which may be shorter) are sent with
+		UDP segmentation offload (`UDP_SEGMENT`), up to 64 datagrams per system call. Otherwise, or
+		if the kernel rejects segmentation offload (which then stays disabled for this sender), the
+		payloads are sent with a ctypes `sendmmsg` binding. On other platforms, this falls back to
+		one `send` per payload. Either way each payload arrives as its own datagram.
+
+		Args:
+			payloads (iterable): The payloads to send (any bytes-like objects), one datagram each.
+
+		Returns:
+			int: The number of datagrams sent.
+
+		Minimal Acceptance Testing:
+
+		First set up test fixtures by importing multicast.
+
+			>>> import multicast
+			>>>
+
+		Testcase 1: send_many should send one datagram per payload.
+
+			>>> tst_rx = multicast.genSocket()
+			>>> tst_rx.bind(("127.0.0.1", 0))
+			>>> (tst_host, tst_port) = tst_rx.getsockname()
+			>>> with multicast.send.McastSender(tst_host, tst_port) as tst_sender:
+			... 	tst_sender.send_many([b"one", b"two", b"six"])
+			... 	tst_sender.send_many([b"odd", b"sizes"])
+			... 	tst_sender.send_many([])
+			3
+			2
+			0
+			>>> [tst_rx.recv(64) for _ in range(5)]
+			[b'one', b'two', b'six', b'odd', b'sizes']
+			>>> multicast.endSocket(tst_rx)
+			>>>
+
+
+		"""
+		payloads = list(payloads)
+		if not payloads:
+			return 0
+		if self._sock is None:
+			self.open()
+		address = (self.group, self.port)
+		sent = 0
+		if self._use_gso and len(payloads) > 1:
+			sent = self._send_gso(payloads, address)
+		if sent < len(payloads) and self._use_mmsg:
+			sent += multicast.skt.sendmmsg(self._sock, payloads[sent:], address)
+		for payload in payloads[sent:]:
+			self._sock.sendto(payload, address)
+			sent += 1
+		return sent
+
+	def _send_gso(self, payloads: list, address: tuple) -> int:
+		"""Send what segmentation offload can of the payloads, returning how many were sent.
+
+		This is a helper method and should NOT be called directly.
+		"""
+		segment_size = len(payloads[0])
+		uneven = any(len(payload) != segment_size for payload in payloads[:-1])
+		if uneven or len(payloads[-1]) > segment_size:
+			return 0
+		step = multicast.skt.max_gso_segments(segment_size)
+		sent = 0
+		try:
+			while sent < len(payloads):
+				sent += multicast.skt.sendgso(self._sock, payloads[sent:sent + step], address)
+		except (OSError, ValueError, NotImplementedError) as _cause:
+			self._use_gso = False
+			module_logger.debug(
+				"Disabled segmentation offload: %s",  # lazy formatting to avoid PYL-W1203
+				_cause,
+			)
+		return sent
+
+	def close(self) -> None:
+		"""
+		Close the send socket, if open.
+
+		Returns:
+			None
+		"""
+		if self._sock is not None:
+			multicast.endSocket(self._sock)
+			self._sock = None
+
+	def __enter__(self):
+		"""Open the sender for use as a context manager."""
+		return self.open()
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		"""Close the sender when leaving the context."""
+		self.close()
+
+
 class McastSAY(multicast.mtool):
 	"""
 	Multicast Broacaster tool.
@@ -321,9 +589,15 @@ def setupArgs(cls, parser):
 				dest="data",
 				help="read message from stdin (equivalent to --message -)"
 			)
+			parser.add_argument(
+				"--binary",
+				action="store_true",
+				dest="binary",
+				help="send raw bytes without text transcoding (e.g., binary data via --pipe)"
+			)
 
 	@staticmethod
-	def _sayStep(group, port, data):
+	def _sayStep(group, port, data, sender=None):
 		"""
 		Internal method to send a message via multicast.
 
@@ -333,20 +607,28 @@ def _sayStep(group, port, data):
 		Args:
 			group (str): Multicast group address to send the message to.
 			port (int): Port number to use for sending.
-			data (str): Message data to be sent.
+			data (str or bytes-like): Message data to be sent. Text is encoded as UTF-8, while
+				bytes-like data (`bytes`, `bytearray` or `memoryview`) is sent as-is.
+			sender (McastSender, optional): An open sender to reuse. If omitted, an ephemeral
+				sender is created and closed for just this message.
 
 		Returns:
 			bool: True if the message was sent successfully, False otherwise.
 		"""
 		_success = False
-		sock = multicast.genSocket()
+		_is_ephemeral = sender is None
+		if _is_ephemeral:
+			sender = McastSender(group, port)
 		if __debug__:
 			module_logger.info(
 				"Preparing to send %d",  # lazy formatting to avoid PYL-W1203
 				len(data),
 			)
 		try:
-			if __debug__ and module_logger.isEnabledFor(logging.DEBUG):  # pragma: no branch
+			if isinstance(data, (bytes, bytearray, memoryview)):
+				module_logger.debug("Sending raw binary payload.")
+				sender.send(data)
+			elif __debug__ and module_logger.isEnabledFor(logging.DEBUG):  # pragma: no branch
 				module_logger.debug("Encoding.")
 				_payload = data.encode('utf8')
 				module_logger.debug(
@@ -357,16 +639,17 @@ def _sayStep(group, port, data):
 					"Sending %s to (%s, %d).",  # lazy formatting to avoid PYL-W1203
 					_payload, group, port,
 				)
-				sock.sendto(_payload, (group, port))
+				sender.send(_payload)
 				module_logger.debug(
 					"Sent %d.",  # lazy formatting to avoid PYL-W1203
 					len(_payload),
 				)
 			else:
-				sock.sendto(data.encode('utf8'), (group, port))
+				sender.send(data.encode('utf8'))
 			_success = True
 		finally:
-			multicast.endSocket(sock)
+			if _is_ephemeral:
+				sender.close()
 		if __debug__:  # pragma: no branch
 			if _success:
 				module_logger.info("Finished sending. Reporting success.")
@@ -374,6 +657,86 @@ def _sayStep(group, port, data):
 				module_logger.warning("Failed to send. Reporting failure.")
 		return _success
 
+	@staticmethod
+	def _sayManyStep(payloads, sender):
+		"""
+		Internal method to send many messages via multicast, batched into few system calls.
+
+		Args:
+			payloads (list): Message data (str or bytes-like) to be sent, one datagram each.
+			sender (McastSender): The open sender to use.
+
+		Returns:
+			bool: True if every message was sent successfully, False otherwise.
+		"""
+		_payloads = [
+			payload.encode('utf8') if isinstance(payload, str) else payload for payload in payloads
+		]
+		if __debug__:
+			module_logger.info(
+				"Preparing to send %d messages",  # lazy formatting to avoid PYL-W1203
+				len(_payloads),
+			)
+		return sender.send_many(_payloads) == len(_payloads)
+
+	@staticmethod
+	def _payloadOf(data, binary=False):
+		"""
+		Internal method to normalize message data into one payload.
+
+		Args:
+			data (str, list, or bytes): Message data; a list of arguments is joined by spaces.
+			binary (bool, optional): Keep the payload as bytes. Defaults to False.
+
+		Returns:
+			str or bytes-like: Text, or bytes-like data when binary.
+		"""
+		if isinstance(data, list):
+			message = " ".join(data)
+			return message.encode('utf8') if binary else message
+		if binary and isinstance(data, (bytes, bytearray, memoryview)):
+			return data
+		return data.decode('utf8') if isinstance(data, bytes) else str(data)
+
+	@staticmethod
+	def _pipeStep(sender, binary=False):
+		"""
+		Internal method to send stdin via multicast, one datagram per buffer-sized chunk.
+
+		Args:
+			sender (McastSender): The open sender to use.
+			binary (bool, optional): Read stdin as raw bytes. Defaults to False.
+
+		Returns:
+			bool: True if every chunk was sent successfully, False otherwise.
+		"""
+		_logger = logging.getLogger(McastSAY.__name__)
+		_logger.debug("Reading from stdin")
+		_result = True
+		# Read from stdin in chunks
+		_size = multicast._MCAST_DEFAULT_BUFFER_SIZE  # skipcq: PYL-W0212 - module ok
+		if binary:
+			_stdin = getattr(sys.stdin, "buffer", sys.stdin)
+			# read1 returns as soon as any data is available, up to a batch of chunks
+			_read = getattr(_stdin, "read1", _stdin.read)
+			_batch = _size * _MCAST_DEFAULT_SEND_BATCH
+		else:
+			# text reads block until full, so streaming pipes are read one chunk at a time
+			_read = sys.stdin.read
+			_batch = _size
+		while True:
+			try:
+				chunk = _read(_batch)
+			except OSError:
+				_logger.exception("[CWE-228] Error reading from stdin.")
+				break
+			if not chunk:
+				break
+			_payloads = [chunk[_at:_at + _size] for _at in range(0, len(chunk), _size)]
+			_result = _result and McastSAY._sayManyStep(_payloads, sender)
+		_logger.debug("Finished reading stdin.")
+		return _result
+
 	def doStep(self, *args, **kwargs):
 		"""
 		Execute the SAY operation to send multicast messages.
@@ -386,7 +749,11 @@ def doStep(self, *args, **kwargs):
 			**kwargs: Arbitrary keyword arguments.
 			- group (str): Multicast group address (default: multicast._MCAST_DEFAULT_GROUP)
 			- port (int): Port number (default: multicast._MCAST_DEFAULT_PORT)
+			- ttl (int): Multicast time-to-live (default: multicast._MCAST_DEFAULT_TTL)
+			- iface (str): IPv4 address of the interface to send from (default: None)
 			- data (str, list, or bytes): Message to be sent. If set to ['-'], reads from stdin.
+			- binary (bool): Send raw bytes without any text transcoding (default: False).
+				With this stdin is read as bytes, and bytes data is sent as-is.
 
 		Returns:
 			tuple: A tuple containing a status indicator and optional error message.
@@ -399,32 +766,13 @@ def doStep(self, *args, **kwargs):
 		)
 		port = kwargs.get("port", multicast._MCAST_DEFAULT_PORT)  # skipcq: PYL-W0212 - module ok
 		data = kwargs.get("data")
+		_is_binary = kwargs.get("binary", False)
 		_result = False
-		if data == ["-"]:
-			_logger.debug("Reading from stdin")
-			_result = True
-			# Read from stdin in chunks
-			while True:
-				try:
-					# Read configured amount of bytes at a time - matches read size by default
-					# skipcq: PYL-W0212
-					chunk = sys.stdin.read(
-						multicast._MCAST_DEFAULT_BUFFER_SIZE,  # skipcq: PYL-W0212 - module ok
-					)
-				except OSError:
-					_logger.exception("[CWE-228] Error reading from stdin.")
-					break
-				if not chunk:
-					break
-				_result = _result and self._sayStep(group, port, chunk)
-			_logger.debug("Finished reading stdin.")
-		elif isinstance(data, list):
-			# Join multiple arguments into a single string
-			message = " ".join(data)
-			_result = self._sayStep(group, port, message)
-		else:
-			message = data.decode('utf8') if isinstance(data, bytes) else str(data)
-			_result = self._sayStep(group, port, message)
+		with McastSender(group, port, kwargs.get("ttl"), kwargs.get("iface")) as sender:
+			if data == ["-"]:
+				_result = self._pipeStep(sender, _is_binary)
+			else:
+				_result = self._sayStep(group, port, self._payloadOf(data, _is_binary), sender)
 		if __debug__:  # pragma: no branch
 			if _result:
 				module_logger.debug(
@@ -19,7 +19,10 @@
 
 """Socket utility functions for multicast communication.
 
-Provides helper functions for creating and managing multicast sockets.
+Provides helper functions for creating and managing multicast sockets, and the optional
+kernel-batched (Linux) fast paths used by `multicast.send.McastSender.send_many` (sends) and by
+`multicast.recv.drainstep` and `multicast.hear.McastServer.get_batch` (receives), and the receive
+drop accounting of `DropCounter`.
 
 NOT intended for DIRECT use!
 
@@ -138,9 +141,15 @@
 
 try:
 	from . import logging
+	from . import sys as _sys  # skipcq: PYL-C0414
 	from . import socket as _socket  # skipcq: PYL-C0414
 	from . import struct as _struct  # noqa
+	import time as _time
 	from . import _MCAST_DEFAULT_TTL as _MCAST_DEFAULT_TTL  # skipcq: PYL-C0414
+	from . import _MCAST_DEFAULT_TUNING as _MCAST_DEFAULT_TUNING  # skipcq: PYL-C0414
+	import errno as _errno
+	import os as _os
+	import select as _select
 except Exception as _cause:
 	baton = ImportError(_cause, "[CWE-758] Module failed completely.")
 	baton.module = __module__
@@ -148,6 +157,11 @@
 	baton.__cause__ = _cause
 	raise baton from _cause
 
+try:
+	import ctypes as _ctypes
+except ImportError:  # pragma: no cover -- optional, only needed for the Linux fast paths
+	_ctypes = None
+
 
 module_logger = logging.getLogger(__module__)
 module_logger.debug(
@@ -162,7 +176,8 @@ def genSocket() -> _socket.socket:
 
 	Generates an unbound socket.socket object ready to receive network traffic.
 	Implementation allows reuse of socket (to allow another instance of python running
-	this script binding to the same ip/port).
+	this script binding to the same ip/port). Any default socket tuning (see
+	multicast.env.load_tuning) is applied on a best-effort basis by tuneSocket.
 
 	Returns:
 		socket.socket: A configured multicast socket ready for communication.
@@ -208,6 +223,8 @@ def genSocket() -> _socket.socket:
 	if hasattr(_socket, 'IP_MULTICAST_TTL'):  # pragma: no branch
 		sock.setsockopt(_socket.IPPROTO_IP, _socket.IP_MULTICAST_TTL, _MCAST_DEFAULT_TTL)
 	sock.settimeout(_MCAST_DEFAULT_TTL)
+	if _MCAST_DEFAULT_TUNING:
+		tuneSocket(sock, _MCAST_DEFAULT_TUNING)
 	return sock
 
 
@@ -282,3 +299,1246 @@ def endSocket(sock=None):
 				sock.close()  # Some systems won't close
 		except OSError:  # pragma: no branch
 			sock = None  # So catch and zero the socket
+
+
+_IS_LINUX = _sys.platform.startswith("linux")
+"""True when running on Linux, where the kernel-batched fast paths may be available."""
+
+
+SOL_UDP = getattr(_socket, "SOL_UDP", _socket.IPPROTO_UDP)
+"""The socket option level for UDP options."""
+
+
+UDP_SEGMENT = getattr(_socket, "UDP_SEGMENT", 103 if _IS_LINUX else None)
+"""The UDP generic segmentation offload (GSO) socket option (Linux 4.18+), or None.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> import sys
+		>>> (multicast.skt.UDP_SEGMENT is not None) or (not sys.platform.startswith("linux"))
+		True
+		>>>
+
+"""
+
+
+_UDP_MAX_SEGMENTS: int = 64
+"""The maximum number of segments the kernel accepts in one UDP GSO send."""
+
+
+_UDP_MAX_PAYLOAD: int = 65507
+"""The maximum UDP payload size over IPv4."""
+
+
+_LIBC = None
+"""Cached libc handle for the sendmmsg/recvmmsg bindings (False once found unavailable)."""
+
+
+if _ctypes is not None:  # pragma: no branch
+
+	class _IOVec(_ctypes.Structure):
+		"""ctypes mirror of the C `struct iovec`."""
+
+		_fields_ = [
+			("iov_base", _ctypes.c_void_p),
+			("iov_len", _ctypes.c_size_t),
+		]
+
+	class _MsgHdr(_ctypes.Structure):
+		"""ctypes mirror of the C `struct msghdr`."""
+
+		_fields_ = [
+			("msg_name", _ctypes.c_void_p),
+			("msg_namelen", _ctypes.c_uint32),
+			("msg_iov", _ctypes.c_void_p),
+			("msg_iovlen", _ctypes.c_size_t),
+			("msg_control", _ctypes.c_void_p),
+			("msg_controllen", _ctypes.c_size_t),
+			("msg_flags", _ctypes.c_int),
+		]
+
+	class _MMsgHdr(_ctypes.Structure):
+		"""ctypes mirror of the C `struct mmsghdr`."""
+
+		_fields_ = [
+			("msg_hdr", _MsgHdr),
+			("msg_len", _ctypes.c_uint),
+		]
+
+
+def _load_libc():
+	"""Load (once) the libc handle for the sendmmsg/recvmmsg bindings.
+
+	This is a helper function and should NOT be called directly.
+
+	Returns:
+		ctypes.CDLL: The libc handle, or None when the bindings are unavailable.
+	"""
+	global _LIBC  # skipcq: PYL-W0603 - lazy cache
+	if _LIBC is None:
+		_LIBC = False
+		if _IS_LINUX and _ctypes is not None:  # pragma: no branch
+			try:
+				libc = _ctypes.CDLL(None, use_errno=True)
+				for func_name in ("sendmmsg", "recvmmsg"):
+					func = getattr(libc, func_name)
+					func.restype = _ctypes.c_int
+				libc.sendmmsg.argtypes = [
+					_ctypes.c_int, _ctypes.c_void_p, _ctypes.c_uint, _ctypes.c_int,
+				]
+				libc.recvmmsg.argtypes = [
+					_ctypes.c_int, _ctypes.c_void_p, _ctypes.c_uint, _ctypes.c_int,
+					_ctypes.c_void_p,
+				]
+				_LIBC = libc
+			except (OSError, AttributeError):  # pragma: no cover -- non-glibc platforms
+				module_logger.debug("sendmmsg/recvmmsg are unavailable.")
+	return _LIBC or None
+
+
+def has_mmsg() -> bool:
+	"""
+	Check whether the ctypes sendmmsg/recvmmsg bindings are available.
+
+	Returns:
+		bool: True if `sendmmsg` (and `recvmmsg`) may be used.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> import sys
+		>>> multicast.skt.has_mmsg() or (not sys.platform.startswith("linux"))
+		True
+		>>>
+
+	"""
+	return _load_libc() is not None
+
+
+def _sockaddr_in(address: tuple):
+	"""Pack an IPv4 (host, port) address into a C `struct sockaddr_in` buffer.
+
+	This is a helper function and should NOT be called directly.
+	"""
+	raw = b"".join((
+		_struct.pack("=H", _socket.AF_INET),
+		_struct.pack("!H", int(address[1])),
+		_socket.inet_aton(_socket.gethostbyname(address[0])),
+		bytes(8),
+	))
+	return _ctypes.create_string_buffer(raw, len(raw))
+
+
+def _wait_writable(sock: _socket.socket) -> None:
+	"""Wait until the socket may send again, honoring its timeout.
+
+	This is a helper function and should NOT be called directly.
+	"""
+	(_, writable, _) = _select.select([], [sock], [], sock.gettimeout())
+	if not writable:
+		raise _socket.timeout("timed out")
+
+
+def sendmmsg(sock: _socket.socket, payloads: list, address: tuple) -> int:
+	"""
+	Send many datagrams to one address with as few `sendmmsg` system calls as possible.
+
+	Uses a ctypes binding of the Linux `sendmmsg(2)` system call, sending the payloads directly from
+	their buffers (no copying into a joined buffer).
+
+	Args:
+		sock (socket.socket): The (IPv4 UDP) socket to send from.
+		payloads (list): The bytes-like payloads to send, one datagram each.
+		address (tuple): The (group, port) destination address.
+
+	Returns:
+		int: The number of datagrams sent.
+
+	Raises:
+		NotImplementedError: If `sendmmsg` is unavailable on the current system.
+		OSError: If the system call fails.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> tst_rx = multicast.genSocket()
+		>>> tst_rx.bind(("127.0.0.1", 0))
+		>>> tst_tx = multicast.genSocket()
+		>>>
+
+	Testcase 1: sendmmsg should send each payload as one datagram.
+
+		>>> if multicast.skt.has_mmsg():
+		... 	tst_sent = multicast.skt.sendmmsg(tst_tx, [b"one", b"two"], tst_rx.getsockname())
+		... else:
+		... 	tst_sent = sum(tst_tx.sendto(p, tst_rx.getsockname()) > 0 for p in [b"one", b"two"])
+		>>> tst_sent
+		2
+		>>> (tst_rx.recv(64), tst_rx.recv(64))
+		(b'one', b'two')
+		>>> multicast.endSocket(tst_tx)
+		>>> multicast.endSocket(tst_rx)
+		>>>
+
+
+	"""
+	libc = _load_libc()
+	if libc is None:
+		raise NotImplementedError("[CWE-440] sendmmsg is not supported on this system.")
+	count = len(payloads)
+	if count == 0:
+		return 0
+	name = _sockaddr_in(address)
+	buffers = [bytes(payload) for payload in payloads]  # keeps the buffers alive
+	iovs = (_IOVec * count)()
+	msgs = (_MMsgHdr * count)()
+	iov_size = _ctypes.sizeof(_IOVec)
+	iov_base = _ctypes.addressof(iovs)
+	for (index, buffer) in enumerate(buffers):
+		iovs[index].iov_base = _ctypes.cast(_ctypes.c_char_p(buffer), _ctypes.c_void_p)
+		iovs[index].iov_len = len(buffer)
+		hdr = msgs[index].msg_hdr
+		hdr.msg_name = _ctypes.addressof(name)
+		hdr.msg_namelen = _ctypes.sizeof(name)
+		hdr.msg_iov = iov_base + (index * iov_size)
+		hdr.msg_iovlen = 1
+	msgs_base = _ctypes.addressof(msgs)
+	msg_size = _ctypes.sizeof(_MMsgHdr)
+	sent = 0
+	while sent < count:
+		result = libc.sendmmsg(sock.fileno(), msgs_base + (sent * msg_size), count - sent, 0)
+		if result < 0:
+			err = _ctypes.get_errno()
+			if err == _errno.EINTR:
+				continue
+			if err in (_errno.EAGAIN, _errno.EWOULDBLOCK):
+				_wait_writable(sock)
+				continue
+			raise OSError(err, _os.strerror(err))
+		sent += result
+	return sent
+
+
+def _recvmmsg_into(sock: _socket.socket, msgs, vlen: int) -> int:
+	"""
+	Fill the first `vlen` prepared `mmsghdr` entries with already-queued datagrams.
+
+	This is a helper function and should NOT be called directly; the C library must be loaded
+	(see `_load_libc`). Interrupted calls are retried.
+
+	Args:
+		sock (socket.socket): The (IPv4 UDP) socket to receive from.
+		msgs (ctypes.Array): The prepared `mmsghdr` array.
+		vlen (int): Receive at most this many datagrams.
+
+	Returns:
+		int: The number of datagrams received (zero if none were queued).
+
+	Raises:
+		OSError: If the system call fails.
+	"""
+	while True:
+		result = _LIBC.recvmmsg(sock.fileno(), msgs, vlen, _socket.MSG_DONTWAIT, None)
+		if result >= 0:
+			return result
+		err = _ctypes.get_errno()
+		if err in (_errno.EAGAIN, _errno.EWOULDBLOCK):
+			return 0
+		if err != _errno.EINTR:
+			raise OSError(err, _os.strerror(err))
+
+
+def recvmmsg(sock: _socket.socket, buffers: list, with_address: bool = False) -> list:
+	"""
+	Receive as many already-queued datagrams as fit in the given buffers, in one system call.
+
+	Uses a ctypes binding of the Linux `recvmmsg(2)` system call, with `MSG_DONTWAIT`, so this never
+	blocks: it returns an empty list when nothing is queued. Each datagram is received directly into
+	its own buffer (truncated to the buffer size, like with `socket.recv_into`).
+
+	Args:
+		sock (socket.socket): The (IPv4 UDP) socket to receive from.
+		buffers (list): Writable buffers (e.g., `bytearray` or writable `memoryview`), one per
+			datagram.
+		with_address (bool, optional): Also return each sender's (host, port). Defaults to False.
+
+	Returns:
+		list: The size of each received datagram, in buffer order, or (size, address) tuples when
+			`with_address` is True.
+
+	Raises:
+		NotImplementedError: If `recvmmsg` is unavailable on the current system.
+		OSError: If the system call fails.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> tst_rx = multicast.genSocket()
+		>>> tst_rx.bind(("127.0.0.1", 0))
+		>>> tst_tx = multicast.genSocket()
+		>>> tst_bufs = [bytearray(8) for _ in range(4)]
+		>>>
+
+	Testcase 1: recvmmsg should not block when nothing is queued.
+
+		>>> multicast.skt.recvmmsg(tst_rx, tst_bufs) if multicast.skt.has_mmsg() else []
+		[]
+		>>>
+
+	Testcase 2: recvmmsg should receive every queued datagram into its own buffer.
+
+		>>> for tst_msg in (b"one", b"two", b"three"):
+		... 	_ = tst_tx.sendto(tst_msg, tst_rx.getsockname())
+		>>> if multicast.skt.has_mmsg():
+		... 	tst_got = multicast.skt.recvmmsg(tst_rx, tst_bufs, with_address=True)
+		... else:
+		... 	tst_got = [tst_rx.recvfrom_into(b) for b in tst_bufs[:3]]
+		>>> [bytes(tst_bufs[i][:n]) for (i, (n, _)) in enumerate(tst_got)]
+		[b'one', b'two', b'three']
+		>>> tst_got[0][1] == ("127.0.0.1", tst_tx.getsockname()[1])
+		True
+		>>> multicast.endSocket(tst_tx)
+		>>> multicast.endSocket(tst_rx)
+		>>>
+
+
+	"""
+	if _load_libc() is None:
+		raise NotImplementedError("[CWE-440] recvmmsg is not supported on this system.")
+	count = len(buffers)
+	if count == 0:
+		return []
+	iovs = (_IOVec * count)()
+	msgs = (_MMsgHdr * count)()
+	name_size = 16  # sizeof(struct sockaddr_in)
+	names = _ctypes.create_string_buffer(name_size * count) if with_address else None
+	names_base = _ctypes.addressof(names) if with_address else 0
+	iov_size = _ctypes.sizeof(_IOVec)
+	iov_base = _ctypes.addressof(iovs)
+	# each ctypes view exports its buffer, and must stay referenced until the call returns
+	views = [(_ctypes.c_char * len(buffer)).from_buffer(buffer) for buffer in buffers]
+	for (index, view) in enumerate(views):
+		iovs[index].iov_base = _ctypes.addressof(view)
+		iovs[index].iov_len = len(view)
+		hdr = msgs[index].msg_hdr
+		if with_address:
+			hdr.msg_name = names_base + (index * name_size)
+			hdr.msg_namelen = name_size
+		hdr.msg_iov = iov_base + (index * iov_size)
+		hdr.msg_iovlen = 1
+	result = _recvmmsg_into(sock, msgs, count)
+	del views
+	if not with_address:
+		return [msgs[index].msg_len for index in range(result)]
+	raw_names = names.raw
+	received = []
+	for index in range(result):
+		(port, host) = _struct.unpack_from("!H4s", raw_names, (index * name_size) + 2)
+		received.append((msgs[index].msg_len, (_socket.inet_ntoa(host), port)))
+	return received
+
+
+class MMsgBuffer:
+	"""
+	A preallocated buffer array for receiving many datagrams with one `recvmmsg` system call.
+
+	All the C structures (`iovec`, `mmsghdr` and, optionally, `sockaddr_in` arrays) are built once,
+	over one contiguous `bytearray` split into `count` slots of `size` bytes, so each `recv` call is
+	one system call plus decoding the results, with no per-datagram setup.
+
+	Not thread-safe; use one instance per receiving thread.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> tst_rx = multicast.genSocket()
+		>>> tst_rx.bind(("127.0.0.1", 0))
+		>>> tst_tx = multicast.genSocket()
+		>>>
+
+	Testcase 1: MMsgBuffer should receive every queued datagram, without blocking.
+
+		>>> def tst_drain(sock):
+		... 	if not multicast.skt.has_mmsg():
+		... 		return (0, [sock.recv(16) for _ in range(3)], "127.0.0.1")
+		... 	tst_batch = multicast.skt.MMsgBuffer(4, 16, with_address=True)
+		... 	tst_idle = tst_batch.recv(sock)
+		... 	for tst_msg in (b"one", b"two", b"three"):
+		... 		_ = tst_tx.sendto(tst_msg, sock.getsockname())
+		... 	tst_count = tst_batch.recv(sock)
+		... 	tst_from = tst_batch.addresses(tst_count)[0][0]
+		... 	return (tst_idle, tst_batch.payloads(tst_count), tst_from)
+		>>> tst_drain(tst_rx)
+		(0, [b'one', b'two', b'three'], '127.0.0.1')
+		>>> multicast.endSocket(tst_tx)
+		>>> multicast.endSocket(tst_rx)
+		>>>
+
+
+	"""
+
+	__module__ = "multicast.skt"
+
+	__slots__ = (
+		"count", "size", "buffer", "views", "_c_buffer", "_iovs", "_msgs", "_names",
+		"_lengths", "_hosts",
+	)
+
+	_NAME_SIZE: int = 16
+	"""The size of a C `struct sockaddr_in`."""
+
+	def __init__(self, count: int, size: int, with_address: bool = False) -> None:
+		"""
+		Preallocate the buffer array.
+
+		Args:
+			count (int): The maximum number of datagrams per `recv` call.
+			size (int): The size of each slot in bytes (longer datagrams are truncated).
+			with_address (bool, optional): Also record each sender's address. Defaults to False.
+
+		Raises:
+			NotImplementedError: If `recvmmsg` is unavailable on the current system.
+		"""
+		if _load_libc() is None:
+			raise NotImplementedError("[CWE-440] recvmmsg is not supported on this system.")
+		self.count = int(count)
+		self.size = int(size)
+		self.buffer = bytearray(self.count * self.size)
+		whole = memoryview(self.buffer)
+		self.views = [whole[slot * self.size:(slot + 1) * self.size] for slot in range(self.count)]
+		self._c_buffer = (_ctypes.c_char * len(self.buffer)).from_buffer(self.buffer)
+		self._iovs = (_IOVec * self.count)()
+		self._msgs = (_MMsgHdr * self.count)()
+		self._names = None
+		buffer_base = _ctypes.addressof(self._c_buffer)
+		iov_base = _ctypes.addressof(self._iovs)
+		iov_size = _ctypes.sizeof(_IOVec)
+		if with_address:
+			self._names = _ctypes.create_string_buffer(self._NAME_SIZE * self.count)
+		for slot in range(self.count):
+			self._iovs[slot].iov_base = buffer_base + (slot * self.size)
+			self._iovs[slot].iov_len = self.size
+			hdr = self._msgs[slot].msg_hdr
+			hdr.msg_iov = iov_base + (slot * iov_size)
+			hdr.msg_iovlen = 1
+			if with_address:
+				hdr.msg_name = _ctypes.addressof(self._names) + (slot * self._NAME_SIZE)
+				hdr.msg_namelen = self._NAME_SIZE
+		# decode every msg_len (and sender address) with one cached, precompiled unpack each
+		self._lengths = {}
+		self._hosts = {}
+
+	def recv(self, sock: _socket.socket, limit=None) -> int:
+		"""
+		Receive as many already-queued datagrams as fit, without blocking.
+
+		Args:
+			sock (socket.socket): The (IPv4 UDP) socket to receive from.
+			limit (int, optional): Receive at most this many datagrams. Defaults to `count`.
+
+		Returns:
+			int: The number of datagrams received into the first slots (zero if none were queued).
+
+		Raises:
+			OSError: If the system call fails.
+		"""
+		vlen = self.count if limit is None else max(0, min(self.count, int(limit)))
+		return _recvmmsg_into(sock, self._msgs, vlen)
+
+	def lengths(self, received: int) -> tuple:
+		"""Get the sizes of the first `received` datagrams."""
+		decoder = self._lengths.get(received)
+		if decoder is None:
+			msg_size = _ctypes.sizeof(_MMsgHdr)
+			len_offset = _MMsgHdr.msg_len.offset
+			entry = f"{len_offset}xI{msg_size - len_offset - 4}x"
+			decoder = _struct.Struct("=" + (entry * received))
+			self._lengths[received] = decoder
+		return decoder.unpack_from(self._msgs)
+
+	def payloads(self, received: int) -> list:
+		"""Copy out the first `received` datagrams as `bytes`."""
+		views = self.views
+		return [
+			views[slot][:nbytes].tobytes() for (slot, nbytes) in enumerate(self.lengths(received))
+		]
+
+	def addresses(self, received: int) -> list:
+		"""Get the (host, port) senders of the first `received` datagrams."""
+		decoder = self._hosts.get(received)
+		if decoder is None:
+			decoder = _struct.Struct("!" + ("2xH4s8x" * received))
+			self._hosts[received] = decoder
+		fields = decoder.unpack_from(self._names)
+		inet_ntoa = _socket.inet_ntoa
+		return [
+			(inet_ntoa(fields[index + 1]), fields[index]) for index in range(0, len(fields), 2)
+		]
+
+
+def sendgso(sock: _socket.socket, payloads: list, address: tuple) -> int:
+	"""
+	Send equally sized datagrams to one address in a single UDP segmentation offload send.
+
+	The kernel (Linux 4.18+) splits the combined buffer into one datagram per payload, so this costs
+	one system call for up to `_UDP_MAX_SEGMENTS` datagrams. Every payload but the last must have
+	the same size, and the last may not be larger.
+
+	Args:
+		sock (socket.socket): The (IPv4 UDP) socket to send from.
+		payloads (list): The bytes-like payloads to send, at most `max_gso_segments` of them.
+		address (tuple): The (group, port) destination address.
+
+	Returns:
+		int: The number of datagrams sent.
+
+	Raises:
+		NotImplementedError: If UDP segmentation offload is unavailable on the current system.
+		ValueError: If the payloads are not suitable for one segmentation offload send.
+		OSError: If the kernel (or the route's device) rejects the send.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 1: sendgso should reject unequal payloads.
+
+		>>> tst_to = ("127.0.0.1", 9)
+		>>> multicast.skt.sendgso(None, [b"a", b"bb"], tst_to)  #doctest: +IGNORE_EXCEPTION_DETAIL
+		Traceback (most recent call last):
+		ValueError: [CWE-1284] Payloads are not suitable for segmentation offload.
+		>>>
+
+
+	"""
+	count = len(payloads)
+	segment_size = len(payloads[0]) if count else 0
+	too_many = segment_size == 0 or count > max_gso_segments(segment_size)
+	uneven = not too_many and any(len(payload) != segment_size for payload in payloads[:-1])
+	if too_many or uneven or len(payloads[-1]) > segment_size:
+		raise ValueError("[CWE-1284] Payloads are not suitable for segmentation offload.")
+	if UDP_SEGMENT is None:
+		raise NotImplementedError("[CWE-440] UDP_SEGMENT is not supported on this system.")
+	sock.sendmsg(
+		payloads, [(SOL_UDP, UDP_SEGMENT, _struct.pack("=H", segment_size))], 0, address,
+	)
+	return count
+
+
+def max_gso_segments(segment_size: int) -> int:
+	"""
+	Get the maximum number of segments of the given size allowed in one `sendgso` call.
+
+	Args:
+		segment_size (int): The size of each segment in bytes.
+
+	Returns:
+		int: The segment limit, at least one.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> multicast.skt.max_gso_segments(100)
+		64
+		>>> multicast.skt.max_gso_segments(1316)
+		49
+		>>>
+
+	"""
+	return max(1, min(_UDP_MAX_SEGMENTS, _UDP_MAX_PAYLOAD // max(1, int(segment_size))))
+
+
+SO_BUSY_POLL = getattr(_socket, "SO_BUSY_POLL", 46 if _IS_LINUX else None)
+"""The busy-poll socket option (Linux 3.11+), or None."""
+
+
+_TUNING_OPTIONS: dict = {
+	"rcvbuf": (_socket.SOL_SOCKET, getattr(_socket, "SO_RCVBUF", None)),
+	"sndbuf": (_socket.SOL_SOCKET, getattr(_socket, "SO_SNDBUF", None)),
+	"busy_poll": (_socket.SOL_SOCKET, SO_BUSY_POLL),
+	"tos": (_socket.IPPROTO_IP, getattr(_socket, "IP_TOS", None)),
+	"priority": (_socket.SOL_SOCKET, getattr(_socket, "SO_PRIORITY", None)),
+	"loop": (_socket.IPPROTO_IP, getattr(_socket, "IP_MULTICAST_LOOP", None)),
+}
+"""The socket option level and name of each tuning knob (see multicast.env._MCAST_TUNING_KNOBS)."""
+
+
+def tuneSocket(sock: _socket.socket, tuning: dict = None) -> dict:
+	"""
+	Apply socket tuning knobs to a socket, on a best-effort basis.
+
+	Knobs this platform does not support, or that the kernel refuses (e.g. a priority that
+	needs CAP_NET_ADMIN), are skipped and logged, rather than failing the socket.
+
+	Args:
+		sock (socket.socket): The socket to tune.
+		tuning (dict, optional): Knob names and integer values. Defaults to the configured
+			default tuning (see multicast.env.load_tuning).
+
+	Returns:
+		dict: The knobs and values that were applied.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> import socket
+		>>>
+
+	Testcase 0: tuneSocket should apply supported knobs.
+
+		>>> test_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		>>> multicast.skt.tuneSocket(test_sock, {"loop": 0, "tos": 184})
+		{'loop': 0, 'tos': 184}
+		>>> test_sock.getsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP)
+		0
+		>>> test_sock.getsockopt(socket.IPPROTO_IP, socket.IP_TOS)
+		184
+		>>>
+
+	Testcase 1: tuneSocket should skip unknown knobs.
+
+		>>> multicast.skt.tuneSocket(test_sock, {"no_such_knob": 1})
+		{}
+		>>> multicast.endSocket(test_sock)
+		>>>
+
+	"""
+	applied = {}
+	for knob, value in (_MCAST_DEFAULT_TUNING if tuning is None else tuning).items():
+		(level, option) = _TUNING_OPTIONS.get(knob, (None, None))
+		if option is None:
+			module_logger.debug(
+				"Skipping unsupported socket tuning %s.",  # lazy formatting to avoid PYL-W1203
+				knob,
+			)
+			continue
+		try:
+			sock.setsockopt(level, option, int(value))
+			applied[knob] = int(value)
+		except OSError as _cause:
+			module_logger.debug(
+				"Skipping socket tuning %s=%s: %s",  # lazy formatting to avoid PYL-W1203
+				knob, value, _cause,
+			)
+	return applied
+
+
+SO_RXQ_OVFL = getattr(_socket, "SO_RXQ_OVFL", 40 if _IS_LINUX else None)
+"""The socket option reporting the receive queue drop counter as ancillary data (Linux 2.6.33+)."""
+
+
+_DROP_COUNT = _struct.Struct("=I")
+"""The layout of the SO_RXQ_OVFL ancillary data (a native unsigned 32-bit counter)."""
+
+
+SO_TIMESTAMPNS = getattr(_socket, "SO_TIMESTAMPNS", 35 if _IS_LINUX else None)
+"""The socket option reporting the kernel arrival time in nanoseconds (Linux 2.6.22+)."""
+
+
+SO_TIMESTAMP = getattr(_socket, "SO_TIMESTAMP", 29 if _IS_LINUX else None)
+"""The socket option reporting the kernel arrival time in microseconds."""
+
+
+_TIMESTAMP = _struct.Struct("@ll")
+"""The layout of the kernel arrival time ancillary data (a native timespec, or timeval)."""
+
+
+IP_PKTINFO = getattr(_socket, "IP_PKTINFO", 8 if _IS_LINUX else None)
+"""The socket option reporting the destination address of each datagram as ancillary data."""
+
+
+_PKTINFO = _struct.Struct("=i4s4s")
+"""The layout of the IP_PKTINFO ancillary data (the interface index, local, and destination)."""
+
+
+_ANCBUFSIZE: int = sum(
+	_socket.CMSG_SPACE(size) for size in (_DROP_COUNT.size, _TIMESTAMP.size, _PKTINFO.size)
+) if hasattr(_socket, "CMSG_SPACE") else 0
+"""The ancillary buffer size needed to receive the drop counter, arrival time, and destination."""
+
+
+def udp_drops(port=None, inode=None, path="/proc/net/udp"):
+	"""
+	Read the kernel's UDP receive drop counters from /proc/net/udp.
+
+	Sums the "drops" column of every UDP socket bound to the local `port`, or of the one socket
+	with the given `inode` (see `os.fstat(sock.fileno()).st_ino`), which is more precise when other
+	sockets share the port.
+
+	Args:
+		port (int, optional): The local port of the sockets to count.
+		inode (int, optional): The inode of the one socket to count.
+		path (str, optional): The table to read. Defaults to "/proc/net/udp".
+
+	Returns:
+		int: The summed drop count, or None when the table is unavailable (e.g., not Linux).
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: udp_drops should return None when the table is unavailable.
+
+		>>> multicast.skt.udp_drops(59259, path="/nonexistent/udp") is None
+		True
+		>>>
+
+	"""
+	try:
+		with open(path, "r", encoding="ascii") as table:
+			lines = table.readlines()[1:]
+	except OSError:
+		return None
+	dropped = 0
+	for line in lines:
+		fields = line.split()
+		if len(fields) < 13:
+			continue
+		if inode is not None:
+			if int(fields[9]) != int(inode):
+				continue
+		elif port is None or int(fields[1].rsplit(":", 1)[-1], 16) != int(port):
+			continue
+		dropped += int(fields[12])
+	return dropped
+
+
+class DropCounter:
+	"""
+	Count the datagrams the kernel dropped before a receive socket could read them.
+
+	`enable` turns on the SO_RXQ_OVFL socket option, so each datagram read with `recvfrom` or
+	`recv_into` (via `recvmsg`) carries the socket's cumulative drop counter as ancillary data.
+	The kernel only attaches the counter once it is non-zero. `sample` reads the same counter from
+	/proc/net/udp instead, e.g. when the socket is read through paths without ancillary data.
+
+	`total` is the cumulative count, across every socket enabled in turn (e.g., when an ephemeral
+	server replaces its socket), and `interval` is the count since the previous `interval` call.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> tst_drops = multicast.skt.DropCounter()
+		>>> (tst_drops.total, tst_drops.interval())
+		(0, 0)
+		>>>
+
+	Testcase 1: DropCounter should track the cumulative and per-interval counts.
+
+		>>> import socket
+		>>> tst_level = (socket.SOL_SOCKET, multicast.skt.SO_RXQ_OVFL)
+		>>> tst_drops.observe([tst_level + ((3).to_bytes(4, "little"),)])
+		>>> tst_drops.observe([tst_level + ((5).to_bytes(4, "little"),)])
+		>>> (tst_drops.total, tst_drops.interval(), tst_drops.interval())
+		(5, 5, 0)
+		>>>
+
+	Testcase 2: DropCounter should keep receiving the data of enabled sockets.
+
+		>>> tst_sock = multicast.genSocket()
+		>>> tst_sock.bind(("127.0.0.1", 0))
+		>>> tst_drops.enable(tst_sock) or not multicast.skt._IS_LINUX
+		True
+		>>> _ = tst_sock.sendto(b"data", tst_sock.getsockname())
+		>>> tst_drops.recvfrom(tst_sock, 1316)[0]
+		b'data'
+		>>> (tst_drops.total, tst_drops.sample())
+		(5, 5)
+		>>> multicast.endSocket(tst_sock)
+		>>>
+
+	"""
+
+	__slots__ = ("_retired", "_current", "_mark", "inode", "enabled")
+
+	def __init__(self):
+		"""Initialize a counter with no drops, and no enabled socket."""
+		self._retired = 0
+		self._current = 0
+		self._mark = 0
+		self.inode = None
+		self.enabled = False
+
+	@property
+	def total(self) -> int:
+		"""The cumulative number of dropped datagrams."""
+		return self._retired + self._current
+
+	def interval(self) -> int:
+		"""
+		Get the number of datagrams dropped since the previous call.
+
+		Returns:
+			int: The drops counted since the previous call (or since creation).
+		"""
+		total = self.total
+		dropped = total - self._mark
+		self._mark = total
+		return dropped
+
+	def enable(self, sock: _socket.socket) -> bool:
+		"""
+		Count the drops of the given socket from now on, replacing any previous socket.
+
+		Args:
+			sock (socket.socket): The receive socket.
+
+		Returns:
+			bool: True if the kernel will attach the drop counter to received datagrams.
+		"""
+		self._retired += self._current
+		self._current = 0
+		try:
+			self.inode = _os.fstat(sock.fileno()).st_ino
+		except (OSError, ValueError):  # pragma: no cover -- defensive
+			self.inode = None
+		self.enabled = False
+		if SO_RXQ_OVFL is not None and _ANCBUFSIZE:
+			try:
+				sock.setsockopt(_socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+				self.enabled = True
+			except OSError as _cause:  # pragma: no cover -- platform dependent
+				module_logger.debug(
+					"Drop counting is unavailable: %s",  # lazy formatting to avoid PYL-W1203
+					_cause,
+				)
+		return self.enabled
+
+	def observe(self, ancdata: list) -> None:
+		"""
+		Update the counter from the ancillary data of a received datagram.
+
+		Args:
+			ancdata (list): The ancillary data, as returned by `socket.recvmsg`.
+		"""
+		for (level, kind, data) in ancdata:
+			is_drop_count = level == _socket.SOL_SOCKET and kind == SO_RXQ_OVFL
+			if is_drop_count and len(data) >= _DROP_COUNT.size:
+				self._current = max(self._current, _DROP_COUNT.unpack_from(data)[0])
+
+	def recvfrom(self, sock: _socket.socket, bufsize: int) -> tuple:
+		"""
+		Receive one datagram like `socket.recvfrom`, updating the counter.
+
+		Args:
+			sock (socket.socket): The enabled socket.
+			bufsize (int): The maximum number of bytes to receive.
+
+		Returns:
+			tuple: The (data, address) of the received datagram.
+		"""
+		return recvfrom_meta(sock, bufsize, self)
+
+	def recv_into(self, sock: _socket.socket, buffer) -> int:
+		"""
+		Receive one datagram like `socket.recv_into`, updating the counter.
+
+		Args:
+			sock (socket.socket): The enabled socket.
+			buffer: The writable buffer to receive into.
+
+		Returns:
+			int: The number of bytes received.
+		"""
+		return recv_into_meta(sock, buffer, self)
+
+	def sample(self) -> int:
+		"""
+		Update the counter from /proc/net/udp, where available.
+
+		Returns:
+			int: The cumulative number of dropped datagrams (see `total`).
+		"""
+		if self.inode is not None:
+			dropped = udp_drops(inode=self.inode)
+			if dropped is not None:
+				self._current = max(self._current, dropped)
+		return self.total
+
+
+def enableTimestamps(sock: _socket.socket) -> bool:
+	"""
+	Ask the kernel to attach the arrival time to every datagram received on the socket.
+
+	Prefers nanosecond resolution (SO_TIMESTAMPNS), and falls back to microsecond resolution
+	(SO_TIMESTAMP). See `recvfrom_meta` for reading the arrival times.
+
+	Args:
+		sock (socket.socket): The receive socket.
+
+	Returns:
+		bool: True if either option was enabled, False if unsupported (arrival times then fall back
+			to the user-space time when the datagram was read).
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: enableTimestamps should enable kernel timestamps on Linux.
+
+		>>> tst_sock = multicast.genSocket()
+		>>> multicast.skt.enableTimestamps(tst_sock) or not multicast.skt._IS_LINUX
+		True
+		>>> multicast.endSocket(tst_sock)
+		>>>
+
+	"""
+	for option in (SO_TIMESTAMPNS, SO_TIMESTAMP):
+		if option is None or not _ANCBUFSIZE:
+			continue
+		try:
+			sock.setsockopt(_socket.SOL_SOCKET, option, 1)
+			return True
+		except OSError as _cause:  # pragma: no cover -- platform dependent
+			module_logger.debug(
+				"Kernel timestamps are unavailable: %s",  # lazy formatting to avoid PYL-W1203
+				_cause,
+			)
+	return False
+
+
+def arrival_ns(ancdata: list):
+	"""
+	Get the kernel arrival time from the ancillary data of a received datagram.
+
+	Args:
+		ancdata (list): The ancillary data, as returned by `socket.recvmsg`.
+
+	Returns:
+		int: The arrival time in nanoseconds since the epoch (comparable with `time.time_ns()`), or
+			None when the data carries no arrival time.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> import socket
+		>>> import struct
+		>>>
+
+	Testcase 0: arrival_ns should convert both resolutions to nanoseconds.
+
+		>>> tst_time = struct.pack("@ll", 1, 500)
+		>>> multicast.skt.arrival_ns([(socket.SOL_SOCKET, multicast.skt.SO_TIMESTAMPNS, tst_time)])
+		1000000500
+		>>> multicast.skt.arrival_ns([(socket.SOL_SOCKET, multicast.skt.SO_TIMESTAMP, tst_time)])
+		1000500000
+		>>> multicast.skt.arrival_ns([]) is None
+		True
+		>>>
+
+	"""
+	for (level, kind, data) in ancdata:
+		if level != _socket.SOL_SOCKET or len(data) < _TIMESTAMP.size:
+			continue
+		if kind == SO_TIMESTAMPNS:
+			(seconds, nanoseconds) = _TIMESTAMP.unpack_from(data)
+			return (seconds * 1000000000) + nanoseconds
+		if kind == SO_TIMESTAMP:
+			(seconds, microseconds) = _TIMESTAMP.unpack_from(data)
+			return (seconds * 1000000000) + (microseconds * 1000)
+	return None
+
+
+def enablePacketInfo(sock: _socket.socket) -> bool:
+	"""
+	Ask the kernel to attach the destination address to every datagram received on the socket.
+
+	On a socket bound to the wildcard address and joined to several groups, the destination tells
+	which group each datagram was sent to. See `destination_of` for reading it.
+
+	Args:
+		sock (socket.socket): The receive socket.
+
+	Returns:
+		bool: True if IP_PKTINFO was enabled, False if unsupported.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: enablePacketInfo should enable IP_PKTINFO on Linux.
+
+		>>> tst_sock = multicast.genSocket()
+		>>> multicast.skt.enablePacketInfo(tst_sock) or not multicast.skt._IS_LINUX
+		True
+		>>> multicast.endSocket(tst_sock)
+		>>>
+
+	"""
+	if IP_PKTINFO is None or not _ANCBUFSIZE:  # pragma: no cover -- platform dependent
+		return False
+	try:
+		sock.setsockopt(_socket.IPPROTO_IP, IP_PKTINFO, 1)
+		return True
+	except OSError as _cause:  # pragma: no cover -- platform dependent
+		module_logger.debug(
+			"Packet info is unavailable: %s",  # lazy formatting to avoid PYL-W1203
+			_cause,
+		)
+	return False
+
+
+def destination_of(ancdata: list):
+	"""
+	Get the destination address (e.g., the multicast group) from the ancillary data of a datagram.
+
+	Args:
+		ancdata (list): The ancillary data, as returned by `socket.recvmsg`.
+
+	Returns:
+		str: The destination IPv4 address, or None when the data carries no IP_PKTINFO.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> import socket
+		>>> import struct
+		>>>
+
+	Testcase 0: destination_of should decode the destination of the IP_PKTINFO data.
+
+		>>> tst_info = struct.pack(
+		... 	"=i4s4s", 1, socket.inet_aton("192.0.2.1"), socket.inet_aton("224.0.0.2"),
+		... )
+		>>> multicast.skt.destination_of([(socket.IPPROTO_IP, multicast.skt.IP_PKTINFO, tst_info)])
+		'224.0.0.2'
+		>>> multicast.skt.destination_of([]) is None
+		True
+		>>>
+
+	"""
+	for (level, kind, data) in ancdata:
+		if level == _socket.IPPROTO_IP and kind == IP_PKTINFO and len(data) >= _PKTINFO.size:
+			(_, _, destination) = _PKTINFO.unpack_from(data)
+			return _socket.inet_ntoa(destination)
+	return None
+
+
+def recvfrom_meta(
+	sock: _socket.socket, bufsize: int, drops=None, stamps=None, destinations=None,
+) -> tuple:
+	"""
+	Receive one datagram like `socket.recvfrom`, collecting its ancillary metadata.
+
+	Args:
+		sock (socket.socket): The receive socket.
+		bufsize (int): The maximum number of bytes to receive.
+		drops (DropCounter, optional): Update this counter from the SO_RXQ_OVFL data.
+		stamps (list, optional): Append the arrival time (see `arrival_ns`) to this list. Falls
+			back to `time.time_ns()` after reading, when the kernel did not attach one.
+		destinations (list, optional): Append the destination address (see `destination_of`) to
+			this list, or None when the kernel did not attach one (see `enablePacketInfo`).
+
+	Returns:
+		tuple: The (data, address) of the received datagram.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>> import time
+		>>> tst_sock = multicast.genSocket()
+		>>> tst_sock.bind(("127.0.0.1", 0))
+		>>> _ = multicast.skt.enableTimestamps(tst_sock)
+		>>>
+
+	Testcase 0: recvfrom_meta should return the datagram, and its arrival time.
+
+		>>> tst_stamps = []
+		>>> _ = tst_sock.sendto(b"data", tst_sock.getsockname())
+		>>> multicast.skt.recvfrom_meta(tst_sock, 1316, None, tst_stamps)[0]
+		b'data'
+		>>> 0 < tst_stamps[0] <= time.time_ns()
+		True
+		>>> multicast.endSocket(tst_sock)
+		>>>
+
+	"""
+	if not _ANCBUFSIZE or (
+		stamps is None and destinations is None and (drops is None or not drops.enabled)
+	):
+		received = sock.recvfrom(bufsize)
+		if stamps is not None:
+			stamps.append(_time.time_ns())
+		if destinations is not None:
+			destinations.append(None)
+		return received
+	(data, ancdata, _, address) = sock.recvmsg(bufsize, _ANCBUFSIZE)
+	if drops is not None:
+		drops.observe(ancdata)
+	if stamps is not None:
+		arrival = arrival_ns(ancdata)
+		stamps.append(_time.time_ns() if arrival is None else arrival)
+	if destinations is not None:
+		destinations.append(destination_of(ancdata))
+	return (data, address)
+
+
+def recv_into_meta(sock: _socket.socket, buffer, drops=None, stamps=None) -> int:
+	"""
+	Receive one datagram like `socket.recv_into`, collecting its ancillary metadata.
+
+	See `recvfrom_meta` for the arguments.
+
+	Returns:
+		int: The number of bytes received.
+	"""
+	if not _ANCBUFSIZE or (stamps is None and (drops is None or not drops.enabled)):
+		nbytes = sock.recv_into(buffer)
+		if stamps is not None:
+			stamps.append(_time.time_ns())
+		return nbytes
+	(nbytes, ancdata, _, _) = sock.recvmsg_into([buffer], _ANCBUFSIZE)
+	if drops is not None:
+		drops.observe(ancdata)
+	if stamps is not None:
+		arrival = arrival_ns(ancdata)
+		stamps.append(_time.time_ns() if arrival is None else arrival)
+	return nbytes
+
+
+SO_REUSEPORT = getattr(_socket, "SO_REUSEPORT", 15 if _IS_LINUX else None)
+"""Socket option letting several sockets bind the same address and port (None if unsupported)."""
+
+
+def enableReusePort(sock: _socket.socket) -> bool:
+	"""
+	Allow other sockets (of the same user) to bind the same address and port as the socket.
+
+	Must be called before binding, and every socket sharing the port needs it. The kernel then
+	balances unicast datagrams across the sockets, while each of them still receives its own copy
+	of every multicast datagram.
+
+	Args:
+		sock (socket.socket): The not yet bound socket.
+
+	Returns:
+		bool: True if the option was enabled, False if unsupported.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: enableReusePort should enable port sharing on Linux.
+
+		>>> tst_sock = multicast.genSocket()
+		>>> multicast.skt.enableReusePort(tst_sock) or not multicast.skt._IS_LINUX
+		True
+		>>> multicast.endSocket(tst_sock)
+		>>>
+
+	"""
+	if SO_REUSEPORT is None:  # pragma: no cover -- platform dependent
+		return False
+	try:
+		sock.setsockopt(_socket.SOL_SOCKET, SO_REUSEPORT, 1)
+		return True
+	except OSError as _cause:  # pragma: no cover -- platform dependent
+		module_logger.debug(
+			"Port sharing is unavailable: %s",  # lazy formatting to avoid PYL-W1203
+			_cause,
+		)
+	return False
+
+
+IP_ADD_SOURCE_MEMBERSHIP = getattr(_socket, "IP_ADD_SOURCE_MEMBERSHIP", 39 if _IS_LINUX else None)
+"""Socket option joining a group for one source only (source-specific multicast), or None."""
+
+
+IP_DROP_SOURCE_MEMBERSHIP = getattr(
+	_socket, "IP_DROP_SOURCE_MEMBERSHIP", 40 if _IS_LINUX else None,
+)
+"""Socket option leaving the source-specific membership of a group, or None."""
+
+
+IP_BLOCK_SOURCE = getattr(_socket, "IP_BLOCK_SOURCE", 38 if _IS_LINUX else None)
+"""Socket option blocking one source of an any-source membership, or None."""
+
+
+IP_UNBLOCK_SOURCE = getattr(_socket, "IP_UNBLOCK_SOURCE", 37 if _IS_LINUX else None)
+"""Socket option unblocking a source blocked with IP_BLOCK_SOURCE, or None."""
+
+
+IP_MULTICAST_ALL = getattr(_socket, "IP_MULTICAST_ALL", 49 if _IS_LINUX else None)
+"""Socket option (Linux 2.6.31+) delivering the groups joined by any socket on the host, or None."""
+
+
+def isolateSocket(sock: _socket.socket) -> bool:
+	"""
+	Only deliver the multicast groups this socket joined itself, on Linux.
+
+	By default (IP_MULTICAST_ALL set), Linux delivers the datagrams of every group joined by any
+	socket on the host to each socket bound to a matching address and port, so receivers sharing a
+	port on the wildcard address wake up for each other's traffic. Clearing IP_MULTICAST_ALL limits
+	each socket to its own memberships. Elsewhere, sockets are already isolated.
+
+	Args:
+		sock (socket.socket): The receive socket.
+
+	Returns:
+		bool: True if IP_MULTICAST_ALL was cleared, False if unsupported.
+
+	Minimal Acceptance Testing:
+
+	First set up test fixtures by importing multicast.
+
+		>>> import multicast
+		>>>
+
+	Testcase 0: isolateSocket should clear IP_MULTICAST_ALL on Linux.
+
+		>>> tst_sock = multicast.genSocket()
+		>>> multicast.skt.isolateSocket(tst_sock) or not multicast.skt._IS_LINUX
+		True
+		>>> multicast.endSocket(tst_sock)
+		>>>
+
+	"""
+	if IP_MULTICAST_ALL is None:  # pragma: no cover -- platform dependent
+		return False
+	try:
+		sock.setsockopt(_socket.IPPROTO_IP, IP_MULTICAST_ALL, 0)
+		return True
+	except OSError as _cause:  # pragma: no cover -- platform dependent
+		module_logger.debug(
+			"Multicast isolation is unavailable: %s",  # lazy formatting to avoid PYL-W1203
+			_cause,
+		)
+	return False
@@ -226,6 +226,16 @@ def emit(self, record: logging.LogRecord) -> None:
 	from tests import test_hear_cleanup
 	from tests import test_hear_data_processing
 	from tests import test_hear_keyboard_interrupt
+	from tests import test_hear_persistent
+	from tests import test_hear_thread_pool
+	from tests import test_aio
+	from tests import test_hear_workers
+	from tests import test_ring
+	from tests import test_send
+	from tests import test_send_batch
+	from tests import test_recv_batch
+	from tests import test_recv_isolation
+	from tests import test_tuning
 
 	depends = [
 		profiling,
@@ -239,7 +249,17 @@ def emit(self, record: logging.LogRecord) -> None:
 		test_hear_data_processing,
 		test_exceptions,
 		test_hear_keyboard_interrupt,
-		test_hear_server
+		test_hear_server,
+		test_hear_persistent,
+		test_hear_thread_pool,
+		test_aio,
+		test_hear_workers,
+		test_ring,
+		test_send,
+		test_send_batch,
+		test_recv_batch,
+		test_recv_isolation,
+		test_tuning,
 	]
 
 	try:
@@ -360,6 +380,7 @@ def loadDocstringsFromModule(module: types.ModuleType) -> unittest.TestSuite:
 	"bootstrap": [
 		# Init/exceptions/env/skt tests
 		test_exceptions.ExceptionsTestSuite,  # Also in basic, but crucial for bootstrap
+		test_tuning.SocketTuningTestSuite,
 	],
 	"basic": [
 		test_basic.BasicTestSuite,
@@ -380,10 +401,13 @@ def loadDocstringsFromModule(module: types.ModuleType) -> unittest.TestSuite:
 		loadDocstringsFromModule(multicast.recv),
 		loadDocstringsFromModule(multicast.send),
 		loadDocstringsFromModule(multicast.hear),
+		loadDocstringsFromModule(multicast.aio),
+		loadDocstringsFromModule(multicast.ring),
 	],
 	"say": [
 		# Tests focused on multicast/send.py
 		test_usage.MulticastTestSuite,  # send-related tests
+		test_send.McastSenderTestSuite,
 	],
 	"hear": [
 		# Tests focused on multicast/recv.py and multicast/hear.py
@@ -393,6 +417,10 @@ def loadDocstringsFromModule(module: types.ModuleType) -> unittest.TestSuite:
 		test_hear_data_processing.RecvDataProcessingTestSuite,
 		test_hear_data_processing.HearHandleNoneDataTestSuite,
 		test_hear_cleanup.HearCleanupTestSuite,
+		test_hear_thread_pool.McastThreadPoolServerTestSuite,
+		test_aio.AsyncMcastTestSuite,
+		test_hear_workers.McastSupervisorTestSuite,
+		test_ring.RingFanoutTestSuite,
 	],
 	"usage": [
 		# Tests focused on multicast/__main__.py and API use cases
@@ -415,6 +443,8 @@ def loadDocstringsFromModule(module: types.ModuleType) -> unittest.TestSuite:
 	from tests import test_recv  # added in v2.0.7
 	depends.insert(11, test_recv)
 	EXTRA_TESTS["coverage"].append(test_recv.McastRECVTestSuite)
+	MINIMUM_ACCEPTANCE_TESTS["hear"].append(test_recv.IterDatagramsTestSuite)
+	MINIMUM_ACCEPTANCE_TESTS["hear"].append(test_recv.DropAccountingTestSuite)
 except Exception:  # pragma: no branch
 	_LOGGER.warning("Error loading optional debug tests", exc_info=True)
 
@@ -446,9 +476,16 @@ def loadDocstringsFromModule(module: types.ModuleType) -> unittest.TestSuite:
 	FUZZING_TESTS = {"slow": []}
 
 PERFORMANCE_TESTS = {
-	"scalability": [],  # Future implementation
-	"multi_sender": [],  # Future implementation
-	"multi_receiver": [],  # Future implementation
+	"scalability": [
+		test_hear_persistent.McastServerPersistentTestSuite,
+	],
+	"multi_sender": [
+		test_send_batch.McastSenderBatchTestSuite,
+	],
+	"multi_receiver": [
+		test_recv_batch.RecvBatchTestSuite,
+		test_recv_isolation.RecvIsolationTestSuite,
+	],
 }
 
 # Load specific group/category
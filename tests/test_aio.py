@@ -0,0 +1,166 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module (Testing)
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test module for the asyncio-native multicast server and sender.
+
+This module contains tests that run `multicast.aio.AsyncMcastServer` and
+`multicast.aio.AsyncMcastSender` on an event loop over loopback, and check that they reuse the
+blocking join logic, stream and hand off datagrams, and serve many groups without threads.
+"""
+
+__module__ = "tests"
+
+try:
+	try:
+		import context
+	except Exception as _cause:  # pragma: no branch
+		del _cause  # skipcq - cleanup any error vars early
+		from . import context
+	if not hasattr(context, '__name__') or not context.__name__:  # pragma: no branch
+		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
+	else:
+		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
+		from context import unittest
+		from unittest import mock
+		import asyncio
+		import threading
+except Exception as baton:
+	raise ImportError("[CWE-758] Failed to import test context") from baton
+
+
+@context.markWithMetaTag("mat", "hear")
+class AsyncMcastTestSuite(context.BasicUsageTestSuite):
+	"""Test cases for multicast.aio."""
+
+	__module__ = "tests.test_aio"
+
+	__name__ = "tests.test_aio.AsyncMcastTestSuite"
+
+	TEST_MULTICAST_GROUP: str = "224.0.0.1"
+	"""Standard multicast group address for testing."""
+
+	def test_endpoint_reuses_joinstep_WHEN_receiving(self) -> None:
+		"""Test that receiving endpoints are bound and joined by multicast.recv.joinstep."""
+		async def _run() -> tuple:
+			(transport, _) = await multicast.aio.create_multicast_endpoint(
+				asyncio.DatagramProtocol, [self.TEST_MULTICAST_GROUP], self._the_test_port,
+				None, self.TEST_MULTICAST_GROUP,
+			)
+			try:
+				return transport.get_extra_info("socket").gettimeout()
+			finally:
+				transport.close()
+
+		with mock.patch.object(
+			multicast.recv, "joinstep", wraps=multicast.recv.joinstep,
+		) as mock_join:
+			self.assertEqual(asyncio.run(_run()), 0.0, "The endpoint socket should be non-blocking.")
+		mock_join.assert_called_once()
+
+	def test_server_streams_datagrams_WHEN_iterated(self) -> None:
+		"""Test that async iteration yields every datagram, and ends when the server is closed."""
+		messages = [f"message {i}".encode() for i in range(10)]
+
+		async def _run() -> list:
+			received = []
+			server = await multicast.aio.AsyncMcastServer(
+				self.TEST_MULTICAST_GROUP, self._the_test_port,
+			).start()
+			async with multicast.aio.AsyncMcastSender(
+				self.TEST_MULTICAST_GROUP, self._the_test_port,
+			) as sender:
+				self.assertEqual(sender.send_many(messages), len(messages))
+			async for (data, _) in server:
+				received.append(data)
+				if len(received) == len(messages):
+					server.close()
+			await server.wait_closed()
+			return received
+
+		self.assertEqual(asyncio.run(_run()), messages)
+
+	def test_server_calls_plain_handler_WHEN_given(self) -> None:
+		"""Test that a plain function handler is called on the loop for each datagram."""
+		async def _run() -> list:
+			received = []
+			done = asyncio.Event()
+
+			def handler(data, address) -> None:
+				received.append((data, threading.current_thread()))
+				done.set()
+
+			async with multicast.aio.AsyncMcastServer(
+				self.TEST_MULTICAST_GROUP, self._the_test_port, handler,
+			):
+				async with multicast.aio.AsyncMcastSender(
+					self.TEST_MULTICAST_GROUP, self._the_test_port,
+				) as sender:
+					sender.send(b"plain")
+				await asyncio.wait_for(done.wait(), timeout=3)
+			return received
+
+		self.assertEqual(asyncio.run(_run()), [(b"plain", threading.current_thread())])
+
+	def test_server_counts_dropped_WHEN_queue_full(self) -> None:
+		"""Test that datagrams beyond the queue size are dropped and counted."""
+		async def _run() -> tuple:
+			async with multicast.aio.AsyncMcastServer(
+				self.TEST_MULTICAST_GROUP, self._the_test_port, queue_size=2,
+			) as server:
+				async with multicast.aio.AsyncMcastSender(
+					self.TEST_MULTICAST_GROUP, self._the_test_port,
+				) as sender:
+					sender.send_many([b"one", b"two", b"three", b"four"])
+				await asyncio.sleep(0.2)
+				return ((await server.recv())[0], (await server.recv())[0], server.dropped)
+
+		self.assertEqual(asyncio.run(_run()), (b"one", b"two", 2))
+
+	def test_many_groups_share_one_thread_WHEN_served(self) -> None:
+		"""Test that servers for several groups run on the one event loop thread."""
+		groups = ["224.0.0.1", "224.0.0.2", "224.0.0.3"]
+
+		async def _run() -> tuple:
+			before = threading.active_count()
+			servers = [
+				await multicast.aio.AsyncMcastServer(group, self._the_test_port).start()
+				for group in groups
+			]
+			try:
+				during = threading.active_count()
+				for group in groups:
+					async with multicast.aio.AsyncMcastSender(group, self._the_test_port) as sender:
+						sender.send(group)
+				received = [
+					(await asyncio.wait_for(server.recv(), timeout=3))[0] for server in servers
+				]
+			finally:
+				for server in servers:
+					server.close()
+					await server.wait_closed()
+			return (before, during, received)
+
+		(before, during, received) = asyncio.run(_run())
+		self.assertEqual(before, during)
+		self.assertEqual(received, [group.encode() for group in groups])
+
+
+if __name__ == '__main__':
+	unittest.main()
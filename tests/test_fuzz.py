@@ -278,7 +278,7 @@ def test_say_works_WHEN_using_stdin_GIVEN_alnum_of_any_size_fuzz_input(self, tex
 					self.assertIsNotNone(p)
 					self.assertTrue(p.is_alive())
 					while p.is_alive():
-						sender(group="224.0.0.1", port=_fixture_port_num, data=["STOP", "Test"])
+						sender(group="224.0.0.1", port=_fixture_port_num, data=["STOP"])
 						managed_p.join(1)
 					self.assertFalse(managed_p.is_alive())
 				except Exception as _root_cause:
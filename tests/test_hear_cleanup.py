@@ -61,7 +61,7 @@ class HearCleanupTestSuite(context.BasicUsageTestSuite):
 	Test suite for verifying the cleanup behavior of the multicast hearing mechanism.
 
 	This suite tests that the `McastHEAR` class correctly releases resources
-	and terminates gracefully when the hearing process receives a "STOP Test"
+	and terminates gracefully when the hearing process receives a "STOP"
 	message. It ensures that sockets are properly closed and no lingering
 	processes remain after execution, adhering to the expected cleanup
 	protocols.
@@ -112,7 +112,7 @@ def test_cleanup_on_exit(self) -> None:
 
 		Expected behavior:
 			1. Start McastHEAR process in daemon mode
-			2. Send "STOP Test" message
+			2. Send "STOP" message
 			3. Verify process terminates cleanly
 			4. Ensure all resources are released
 
@@ -145,7 +145,7 @@ def test_cleanup_on_exit(self) -> None:
 				while p.is_alive() and (p_tick <= self.PROCESS_TIMEOUT_SECONDS):
 					(didSend, _) = sender(
 						group=self.TEST_MULTICAST_GROUP, port=_fixture_port_num,
-						ttl=1, data="STOP Test",
+						ttl=1, data="STOP",
 					)
 					if not didSend:  # pragma: no branch
 						raise unittest.SkipTest("Can't test without transmitting") from None
@@ -286,8 +286,8 @@ def test_should_invoke_kill_func_when_handle_error_called(self) -> None:
 			self.server = multicast.hear.McastServer(server_address, None, False)
 			self.server.shutdown = MagicMock()  # Mock the shutdown method
 			client_address = (self.get_default_ip(), _fixture_port_num)
-			# Mock a request containing "STOP"
-			request = ("STOP message", multicast.genSocket())
+			# Mock a "STOP" request
+			request = ("STOP", multicast.genSocket())
 			# Add assertions for initial state
 			self.assertIsNotNone(request[1], "Socket should be created")
 			self.assertIsInstance(request[0], str, "Request should be a string")
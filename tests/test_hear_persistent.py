@@ -0,0 +1,148 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module (Testing)
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test module for benchmarking the persistent-socket mode of the multicast HEAR server.
+
+This module contains regression benchmarks that send a sustained loopback burst to a
+`McastServer` in the ephemeral (re-join per datagram), persistent (one socket for the server
+lifetime), and drain (many datagrams per wakeup) modes, and compare packet loss and throughput.
+"""
+
+__module__ = "tests"
+
+try:
+	try:
+		import context
+	except Exception as _cause:  # pragma: no branch
+		del _cause  # skipcq - cleanup any error vars early
+		from . import context
+	if not hasattr(context, '__name__') or not context.__name__:  # pragma: no branch
+		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
+	else:
+		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
+		from context import unittest
+		import logging
+		import socketserver
+		import threading
+		import time
+except Exception as baton:
+	raise ImportError("[CWE-758] Failed to import test context") from baton
+
+
+@context.markWithMetaTag("performance", "scalability")
+class McastServerPersistentTestSuite(context.BasicUsageTestSuite):
+	"""
+	Regression benchmark for the persistent-socket mode of McastServer.
+
+	Sends the same sustained loopback burst to an ephemeral and to a persistent server, and
+	records how many datagrams each one handled and at what rate.
+	"""
+
+	__module__ = "tests.test_hear_persistent"
+
+	__name__ = "tests.test_hear_persistent.McastServerPersistentTestSuite"
+
+	TEST_MULTICAST_GROUP: str = "224.0.0.1"
+	"""Standard multicast group address for testing."""
+
+	BURST_COUNT: int = 2000
+	"""Number of datagrams sent per burst."""
+
+	SETTLE_SECONDS: float = 0.5
+	"""Time to wait after the burst for the server to drain its socket."""
+
+	THREAD_JOIN_TIMEOUT: float = 5.0
+	"""Maximum time to wait for the serving thread to exit."""
+
+	def _run_burst(self, persistent: bool, drain_limit: int = 1) -> tuple:
+		"""
+		Send a loopback burst to a McastServer and count the handled datagrams.
+
+		Args:
+			persistent (bool): The server mode to benchmark.
+			drain_limit (int): The maximum datagrams the server reads per wakeup.
+
+		Returns:
+			tuple: The count of handled datagrams and the handled datagrams per second.
+		"""
+		handled = []
+
+		class CountingHandler(socketserver.BaseRequestHandler):
+			"""Counts each handled datagram without replying."""
+
+			def handle(self) -> None:
+				"""Record the arrival time of the datagram."""
+				handled.append(time.monotonic())
+
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		server = multicast.hear.McastServer(
+			(self.TEST_MULTICAST_GROUP, _fixture_port_num), CountingHandler,
+			persistent=persistent, drain_limit=drain_limit,
+		)
+		server_thread = threading.Thread(
+			target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True,
+		)
+		server_thread.start()
+		sock = multicast.genSocket()
+		try:
+			payload = b"x" * 64
+			start = time.monotonic()
+			for _ in range(self.BURST_COUNT):
+				sock.sendto(payload, (self.TEST_MULTICAST_GROUP, _fixture_port_num))
+			time.sleep(self.SETTLE_SECONDS)
+		finally:
+			multicast.endSocket(sock)
+			server.shutdown()
+			server.server_close()
+			server_thread.join(timeout=self.THREAD_JOIN_TIMEOUT)
+		self.assertFalse(server_thread.is_alive(), "Server thread did not terminate")
+		elapsed = (handled[-1] - start) if handled else 0
+		rate = (len(handled) / elapsed) if elapsed > 0 else 0
+		return (len(handled), rate)
+
+	def test_persistent_loses_fewer_datagrams_WHEN_burst(self) -> None:
+		"""Test the persistent server handles at least as many datagrams as the ephemeral one."""
+		(ephemeral_count, ephemeral_rate) = self._run_burst(persistent=False)
+		(persistent_count, persistent_rate) = self._run_burst(persistent=True)
+		logging.getLogger(self.__module__).info(
+			"burst of %d: ephemeral handled %d (%.0f/s), persistent handled %d (%.0f/s)",
+			self.BURST_COUNT, ephemeral_count, ephemeral_rate, persistent_count, persistent_rate,
+		)
+		self.assertGreater(persistent_count, 0, "Persistent server handled nothing.")
+		self.assertGreaterEqual(persistent_count, ephemeral_count, "Persistent mode lost more.")
+
+	def test_drain_mode_handles_burst_WHEN_enabled(self) -> None:
+		"""Test the drain mode server handles a burst at least as well as the ephemeral one."""
+		(ephemeral_count, ephemeral_rate) = self._run_burst(persistent=False)
+		(drain_count, drain_rate) = self._run_burst(persistent=True, drain_limit=64)
+		logging.getLogger(self.__module__).info(
+			"burst of %d: ephemeral handled %d (%.0f/s), drain handled %d (%.0f/s)",
+			self.BURST_COUNT, ephemeral_count, ephemeral_rate, drain_count, drain_rate,
+		)
+		self.assertGreater(drain_count, 0, "Drain mode server handled nothing.")
+		self.assertGreaterEqual(drain_count, ephemeral_count, "Drain mode lost more.")
+
+	def tearDown(self) -> None:
+		"""Tear down test fixtures."""
+		super(McastServerPersistentTestSuite, self).tearDown()
+
+
+if __name__ == '__main__':
+	unittest.main()
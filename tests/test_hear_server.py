@@ -29,8 +29,12 @@
 		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
 	else:
 		import socket
+		import sys
 		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
 		from context import unittest
+		from unittest import mock
+		import threading
+		import time
 except Exception as baton:
 	raise ImportError("[CWE-758] Failed to import test context") from baton
 
@@ -168,6 +172,290 @@ def test_handle_error_with_none_request(self) -> None:
 			self.fail(fail_fixtures[1])
 		self.assertTrue(theResult, fail_fixtures[1])
 
+	def _serve_in_thread(self, server, poll_interval) -> threading.Thread:
+		"""Start serving in a new thread, and give the loop a moment to start waiting."""
+		server_thread = threading.Thread(
+			target=server.serve_forever, args=(poll_interval,), daemon=True,
+		)
+		server_thread.start()
+		time.sleep(0.1)
+		return server_thread
+
+	def test_shutdown_returns_quickly_WHEN_idle(self) -> None:
+		"""Test that shutdown stops an idle server without waiting for its poll interval."""
+		for poll_interval in (None, 0, 5):
+			server = multicast.hear.McastServer(
+				("224.0.0.1", self._always_generate_random_port_WHEN_called()), None,
+			)
+			try:
+				server_thread = self._serve_in_thread(server, poll_interval)
+				start = time.monotonic()
+				server.shutdown()
+				elapsed = time.monotonic() - start
+				server_thread.join(1)
+				self.assertFalse(server_thread.is_alive(), "Server thread did not terminate")
+				self.assertLess(elapsed, 0.25, f"shutdown took {elapsed}s at {poll_interval}")
+			finally:
+				server.server_close()
+
+	def test_stop_request_stops_without_helper_threads_WHEN_serving(self) -> None:
+		"""Test that a STOP request ends serving promptly, without spawning any thread."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		server = multicast.hear.McastServer(
+			("224.0.0.1", _fixture_port_num), multicast.hear.HearUDPHandler,
+			payload_commands=True,
+		)
+		try:
+			server_thread = self._serve_in_thread(server, None)
+			threads_before = threading.active_count()
+			with multicast.send.McastSender("224.0.0.1", _fixture_port_num) as tx:
+				tx.send(b"STOP")
+			server_thread.join(1)
+			self.assertFalse(server_thread.is_alive(), "STOP did not stop the server")
+			self.assertLessEqual(threading.active_count(), threads_before - 1)
+			self.assertNotIn("Kill_Thread", [thread.name for thread in threading.enumerate()])
+		finally:
+			server.server_close()
+
+	def test_stop_payload_is_ignored_WHEN_payload_commands_disabled(self) -> None:
+		"""Test that a server only checks payloads for STOP when payload commands are enabled."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		server = multicast.hear.McastServer(
+			("224.0.0.1", _fixture_port_num), multicast.hear.HearUDPHandler, reply_policy="none",
+			payload_commands=False,
+		)
+		try:
+			server_thread = self._serve_in_thread(server, None)
+			with multicast.send.McastSender("224.0.0.1", _fixture_port_num) as tx:
+				tx.send(b"STOP")
+			time.sleep(0.2)
+			self.assertTrue(server_thread.is_alive(), "A STOP payload stopped the server")
+			self.assertEqual(server.accepted, 1)
+			server.shutdown()
+			server_thread.join(1)
+		finally:
+			server.server_close()
+
+	def test_handler_errors_keep_serving_WHEN_payload_mentions_stop(self) -> None:
+		"""Test that only an exact STOP payload stops a default server whose handler raises."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		handled = []
+
+		class RaisingHandler(multicast.hear.HearUDPHandler):
+			def handle(self) -> None:
+				handled.append(self.request[0])
+				raise RuntimeError("handler failed")
+
+		server = multicast.hear.McastServer(("224.0.0.1", _fixture_port_num), RaisingHandler)
+		self.assertTrue(server.payload_commands)
+		try:
+			server_thread = self._serve_in_thread(server, None)
+			with mock.patch("socketserver.BaseServer.handle_error") as reported:
+				with multicast.send.McastSender("224.0.0.1", _fixture_port_num) as tx:
+					tx.send(b"no STOP please")
+					time.sleep(0.2)
+					self.assertTrue(server_thread.is_alive(), "A payload mentioning STOP stopped it")
+					self.assertEqual(reported.call_count, 1)
+					tx.send(b"STOP")
+				server_thread.join(1)
+			self.assertFalse(server_thread.is_alive(), "STOP did not stop the server")
+			self.assertEqual(reported.call_count, 1)
+		finally:
+			server.server_close()
+		self.assertEqual(handled, [b"no STOP please", b"STOP"])
+
+	def test_control_channel_replaces_stop_payloads_WHEN_enabled(self) -> None:
+		"""Test that a control channel server ignores STOP payloads, and obeys control commands."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		server = multicast.hear.McastServer(
+			("224.0.0.1", _fixture_port_num), multicast.hear.HearUDPHandler,
+			reply_policy="none", control_address=("127.0.0.1", 0),
+		)
+		control_address = server.control_socket.getsockname()
+		try:
+			server_thread = self._serve_in_thread(server, None)
+			with multicast.send.McastSender("224.0.0.1", _fixture_port_num) as tx:
+				tx.send(b"STOP")
+			time.sleep(0.2)
+			self.assertTrue(server_thread.is_alive(), "A STOP payload stopped the server")
+			self.assertEqual(multicast.hear.control(control_address, "reload")["status"], 0)
+			with multicast.send.McastSender("224.0.0.1", _fixture_port_num) as tx:
+				tx.send(b"after reload")
+			time.sleep(0.2)
+			stats = multicast.hear.control(control_address, "stats")
+			self.assertEqual((stats["status"], stats["accepted"], stats["paused"]), (0, 2, False))
+			self.assertEqual(stats["rate_limited"], 0)
+			self.assertEqual(multicast.hear.control(control_address, "stop")["status"], 0)
+			server_thread.join(1)
+			self.assertFalse(server_thread.is_alive(), "The stop command did not stop the server")
+		finally:
+			server.server_close()
+
+	def test_init_closes_every_socket_WHEN_setup_fails(self) -> None:
+		"""Test that a server failing to bind, or to open its control socket, leaks no socket."""
+		opened = []
+		original_socketpair = socket.socketpair
+
+		def _capturing_socketpair(*args, **kwargs):
+			opened.extend(original_socketpair(*args, **kwargs))
+			return tuple(opened[-2:])
+
+		with mock.patch.object(socket, "socketpair", side_effect=_capturing_socketpair):
+			with mock.patch.object(
+				multicast.hear.McastServer, "server_bind", side_effect=OSError("bind failed"),
+			):
+				with self.assertRaises(OSError):
+					multicast.hear.McastServer(("224.0.0.1", self._the_test_port), None)
+			with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as taken:
+				taken.bind(("127.0.0.1", 0))
+				with mock.patch.object(
+					multicast.hear.McastServer, "server_close",
+					autospec=True, side_effect=multicast.hear.McastServer.server_close,
+				) as mock_close:
+					with self.assertRaises(OSError):
+						multicast.hear.McastServer(
+							("224.0.0.1", self._the_test_port), None,
+							control_address=taken.getsockname(),
+						)
+				mock_close.assert_called_once()
+				server = mock_close.call_args[0][0]
+		self.assertEqual([sock.fileno() for sock in opened], [-1, -1])
+		self.assertEqual(server.socket.fileno(), -1)
+		self.assertEqual(server.control_socket.fileno(), -1)
+
+	def test_hear_serves_one_group_WHEN_groups_not_given(self) -> None:
+		"""Test that HEAR only binds the wildcard address for groups passed explicitly."""
+		configured = ["224.0.0.1", "224.0.0.2"]
+		with mock.patch.object(multicast, "_MCAST_DEFAULT_GROUPS", configured):
+			with mock.patch.object(multicast.hear, "McastServer") as mock_server:
+				multicast.hear.McastHEAR().doStep(group="224.0.0.1", port=self._the_test_port)
+				self.assertIsNone(mock_server.call_args.kwargs["groups"])
+				multicast.hear.McastHEAR().doStep(
+					group="224.0.0.1", port=self._the_test_port, groups=configured,
+				)
+				self.assertEqual(mock_server.call_args.kwargs["groups"], configured)
+
+	def test_one_socket_serves_every_group_WHEN_multi_group(self) -> None:
+		"""Test that a multi-group server tells handlers which group each datagram was sent to."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		views = []
+
+		class ViewHandler(multicast.hear.HearUDPHandler):
+			def handle(self) -> None:
+				views.append(self.datagram)
+
+		server = multicast.hear.McastServer(
+			("224.0.0.1", _fixture_port_num), ViewHandler, groups=["224.0.0.1", "224.0.0.2"],
+		)
+		try:
+			server_thread = self._serve_in_thread(server, None)
+			for group in ("224.0.0.1", "224.0.0.2"):
+				with multicast.send.McastSender(group, _fixture_port_num) as tx:
+					tx.send(f"to {group}".encode())
+			time.sleep(0.2)
+			server.shutdown()
+			server_thread.join(1)
+		finally:
+			server.server_close()
+		self.assertEqual(
+			sorted((group, payload) for (group, payload, _) in views),
+			[("224.0.0.1", b"to 224.0.0.1"), ("224.0.0.2", b"to 224.0.0.2")],
+		)
+
+	def test_memberships_change_without_rebinding_WHEN_serving(self) -> None:
+		"""Test that groups joined and left while serving take effect on the same socket."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		views = []
+
+		class ViewHandler(multicast.hear.HearUDPHandler):
+			def handle(self) -> None:
+				views.append(self.datagram[:2])
+
+		server = multicast.hear.McastServer(
+			("224.0.0.1", _fixture_port_num), ViewHandler, groups=["224.0.0.1"],
+		)
+		bound_socket = server.socket
+
+		def say(group: str, data: bytes) -> None:
+			with multicast.send.McastSender(group, _fixture_port_num) as tx:
+				tx.send(data)
+			time.sleep(0.2)
+
+		try:
+			server_thread = self._serve_in_thread(server, None)
+			say("224.0.0.3", b"before join")
+			self.assertTrue(server.memberships.join("224.0.0.3"))
+			say("224.0.0.3", b"joined")
+			self.assertTrue(server.memberships.leave("224.0.0.3"))
+			say("224.0.0.3", b"after leave")
+			say("224.0.0.1", b"still joined")
+			server.shutdown()
+			server_thread.join(1)
+			self.assertIs(server.socket, bound_socket)
+		finally:
+			server.server_close()
+		self.assertEqual(views, [("224.0.0.3", b"joined"), ("224.0.0.1", b"still joined")])
+
+	@unittest.skipUnless(sys.platform.startswith("linux"), "Requires IP_ADD_SOURCE_MEMBERSHIP")
+	def test_memberships_keep_source_filters_WHEN_joined_while_serving(self) -> None:
+		"""Test that groups joined while serving only receive from the sources of the server."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		views = []
+
+		class ViewHandler(multicast.hear.HearUDPHandler):
+			def handle(self) -> None:
+				views.append(self.datagram[:2])
+
+		server = multicast.hear.McastServer(
+			("224.0.0.1", _fixture_port_num), ViewHandler, groups=["224.0.0.1"],
+			sources=["192.0.2.1"],
+		)
+		try:
+			server_thread = self._serve_in_thread(server, None)
+			self.assertTrue(server.memberships.join("224.0.0.3"))
+			with multicast.send.McastSender("224.0.0.3", _fixture_port_num) as tx:
+				tx.send(b"not from 192.0.2.1")
+			time.sleep(0.2)
+			self.assertTrue(server.memberships.leave("224.0.0.3"))
+			server.shutdown()
+			server_thread.join(1)
+		finally:
+			server.server_close()
+		self.assertEqual(views, [])
+
+	def test_chatty_source_is_rate_limited_WHEN_limit_set(self) -> None:
+		"""Test that a source over its rate limit is dropped before handling, without others."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		handled = []
+
+		class CountingHandler(multicast.hear.HearUDPHandler):
+			def handle(self) -> None:
+				handled.append(self.client_address)
+
+		server = multicast.hear.McastServer(
+			("224.0.0.1", _fixture_port_num), CountingHandler, rate_limit=0.5, rate_burst=5,
+			control_address=("127.0.0.1", 0),
+		)
+		control_address = server.control_socket.getsockname()
+		try:
+			server_thread = self._serve_in_thread(server, None)
+			with multicast.send.McastSender("224.0.0.1", _fixture_port_num) as chatty:
+				chatty.send_many([b"chatty"] * 50)
+				with multicast.send.McastSender("224.0.0.1", _fixture_port_num) as quiet:
+					quiet.send(b"quiet")
+				time.sleep(0.2)
+			stats = multicast.hear.control(control_address, "stats")
+			server.shutdown()
+			server_thread.join(1)
+		finally:
+			server.server_close()
+		sources = sorted(set(handled), key=handled.count)
+		self.assertEqual(len(sources), 2)
+		self.assertEqual([handled.count(source) for source in sources], [1, 5])
+		self.assertEqual(server.rate_limiter.drops(sources[1]), 45)
+		self.assertEqual(server.rate_limiter.dropped, 45)
+		self.assertEqual((stats["accepted"], stats["rate_limited"]), (6, 45))
+
 
 class HearUDPHandlerTestSuite(McastHearTestSuite):
 	"""
@@ -298,6 +586,87 @@ def test_handle_with_valid_data_and_sock(self) -> None:
 			self.fail(fail_fixture)
 		self.assertIsNone(result, fail_fixture)
 
+	def test_handle_reuses_reply_socket_WHEN_served(self) -> None:
+		"""Test that the handler replies over the server's one cached socket, not a new socket."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		server = multicast.hear.McastServer(
+			("224.0.0.1", _fixture_port_num), multicast.hear.HearUDPHandler,
+		)
+		client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		client.bind(("127.0.0.1", 0))
+		client.settimeout(2)
+		try:
+			reply_socket = server.reply_sender.socket
+			with mock.patch.object(multicast, "genSocket", wraps=multicast.genSocket) as gen:
+				for count in range(3):
+					multicast.hear.HearUDPHandler(  # handles the request on creation
+						request=(f"message {count}".encode(), server.socket),
+						client_address=client.getsockname(),
+						server=server,
+					)
+				self.assertEqual(gen.call_count, 0, "A socket was created per reply.")
+			self.assertIs(server.reply_sender.socket, reply_socket)
+			replies = [client.recv(1024) for _ in range(3)]
+			self.assertTrue(all(reply.startswith(b"HEAR [ MESSAGE ") for reply in replies))
+		finally:
+			client.close()
+			server.server_close()
+
+	def _handle_from_client(self, reply_policy: str, payloads=(b"one", b"two", b"three")) -> list:
+		"""
+		Handle requests (three by default) from one client under a reply policy, then flush.
+
+		Returns:
+			list: The replies the client received.
+		"""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		server = multicast.hear.McastServer(
+			("224.0.0.1", _fixture_port_num), multicast.hear.HearUDPHandler,
+			reply_policy=reply_policy, reply_interval=60,
+		)
+		client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		client.bind(("127.0.0.1", 0))
+		client.settimeout(0.2)
+		replies = []
+		try:
+			for payload in payloads:
+				multicast.hear.HearUDPHandler(  # handles the request on creation
+					request=(payload, server.socket), client_address=client.getsockname(),
+					server=server,
+				)
+			server.flush_replies()
+			while True:
+				try:
+					replies.append(client.recv(1024))
+				except socket.timeout:
+					break
+		finally:
+			client.close()
+			server.server_close()
+		return replies
+
+	def test_handle_replies_per_message_WHEN_default(self) -> None:
+		"""Test that every request gets its own echo reply by default."""
+		replies = self._handle_from_client("per-message")
+		self.assertEqual(len(replies), 3)
+		self.assertTrue(replies[0].startswith(b"HEAR [ ONE SAID "))
+
+	def test_handle_sends_no_replies_WHEN_policy_none(self) -> None:
+		"""Test that no replies are sent with the none policy."""
+		self.assertEqual(self._handle_from_client("none"), [])
+
+	def test_handle_sends_one_summary_WHEN_policy_aggregated(self) -> None:
+		"""Test that one summary reply acknowledges all the requests of a source."""
+		replies = self._handle_from_client("aggregated")
+		self.assertEqual(len(replies), 1)
+		self.assertTrue(replies[0].startswith(b"HEAR [ ACK 3 datagrams 11 bytes SAID "))
+
+	def test_handle_counts_datagram_bytes_WHEN_text_is_multibyte(self) -> None:
+		"""Test that the aggregated summary counts received bytes, not decoded characters."""
+		replies = self._handle_from_client("aggregated", ["caf\u00e9".encode("utf8")])
+		self.assertEqual(len(replies), 1)
+		self.assertTrue(replies[0].startswith(b"HEAR [ ACK 1 datagrams 5 bytes SAID "))
+
 
 if __name__ == '__main__':
 	unittest.main()
@@ -0,0 +1,170 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module (Testing)
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test module for the worker-pool variant of the multicast HEAR server.
+
+This module contains tests that send loopback datagrams to a `McastThreadPoolServer` with a slow
+handler, and check that reception is not stalled, and that each overflow policy of the bounded
+request queue drops (or keeps) the expected requests.
+"""
+
+__module__ = "tests"
+
+try:
+	try:
+		import context
+	except Exception as _cause:  # pragma: no branch
+		del _cause  # skipcq - cleanup any error vars early
+		from . import context
+	if not hasattr(context, '__name__') or not context.__name__:  # pragma: no branch
+		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
+	else:
+		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
+		from context import unittest
+		import socketserver
+		import threading
+		import time
+except Exception as baton:
+	raise ImportError("[CWE-758] Failed to import test context") from baton
+
+
+@context.markWithMetaTag("mat", "hear")
+class McastThreadPoolServerTestSuite(context.BasicUsageTestSuite):
+	"""Test cases for the bounded request queue of McastThreadPoolServer."""
+
+	__module__ = "tests.test_hear_thread_pool"
+
+	__name__ = "tests.test_hear_thread_pool.McastThreadPoolServerTestSuite"
+
+	TEST_MULTICAST_GROUP: str = "224.0.0.1"
+	"""Standard multicast group address for testing."""
+
+	MESSAGES: list = [b"one", b"two", b"three", b"four", b"five"]
+	"""The datagrams sent to the server, in order."""
+
+	def _start(self, **kwargs) -> tuple:
+		"""
+		Start a server whose handler records each payload, then waits for the release event.
+
+		Returns:
+			tuple: The server, the list of handled payloads, and the release event.
+		"""
+		handled = []
+		release = threading.Event()
+
+		class BlockingHandler(socketserver.BaseRequestHandler):
+			"""Records each payload, then blocks until released."""
+
+			def handle(self) -> None:
+				"""Record the payload, and wait for the release event."""
+				handled.append(self.request[0])
+				release.wait(timeout=5)
+
+		server = multicast.hear.McastThreadPoolServer(
+			(self.TEST_MULTICAST_GROUP, self._the_test_port), BlockingHandler, **kwargs,
+		)
+		return (server, handled, release)
+
+	def _send_and_read(self, server, handled: list) -> None:
+		"""Send every message, then read all of them on this (the serving) thread.
+
+		Waits for a worker to take the first request before reading the others, so the queue
+		contents do not depend on how fast the worker threads are scheduled.
+		"""
+		with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, self._the_test_port) as tx:
+			for message in self.MESSAGES:
+				tx.send(message)
+		time.sleep(0.1)
+		server.handle_request()
+		deadline = time.monotonic() + 2
+		while not handled and time.monotonic() < deadline:
+			time.sleep(0.01)
+		for _ in self.MESSAGES[1:]:
+			server.handle_request()
+
+	def test_slow_handler_does_not_stall_reception_WHEN_pooled(self) -> None:
+		"""Test that every datagram is read while all workers are still busy."""
+		(server, handled, release) = self._start(workers=2, queue_size=16)
+		try:
+			start = time.monotonic()
+			self._send_and_read(server, handled)
+			self.assertLess(time.monotonic() - start, 2, "Reception was stalled by the handler.")
+			self.assertEqual((server.enqueued, server.dropped), (5, 0))
+			self.assertGreaterEqual(server.peak_queue_depth, 3)  # at most two taken by workers
+		finally:
+			release.set()
+			server.server_close()
+		self.assertEqual(sorted(handled), sorted(self.MESSAGES))
+
+	def test_drop_newest_keeps_oldest_WHEN_queue_full(self) -> None:
+		"""Test that the drop-newest policy drops the requests arriving at a full queue."""
+		(server, handled, release) = self._start(workers=1, queue_size=1, overflow="drop-newest")
+		try:
+			self._send_and_read(server, handled)
+			self.assertEqual(server.dropped, 3)
+			self.assertEqual(server.queue_depth, 1)
+		finally:
+			release.set()
+			server.server_close()
+		self.assertEqual(handled, [b"one", b"two"])
+
+	def test_drop_oldest_keeps_newest_WHEN_queue_full(self) -> None:
+		"""Test that the drop-oldest policy drops the queued requests, to keep the newest."""
+		(server, handled, release) = self._start(workers=1, queue_size=1, overflow="drop-oldest")
+		try:
+			self._send_and_read(server, handled)
+			self.assertEqual(server.dropped, 3)
+		finally:
+			release.set()
+			server.server_close()
+		self.assertEqual(handled, [b"one", b"five"])
+
+	def test_block_keeps_everything_WHEN_queue_full(self) -> None:
+		"""Test that the block policy waits for room instead of dropping requests."""
+		(server, handled, release) = self._start(workers=1, queue_size=1, overflow="block")
+		timer = threading.Timer(0.3, release.set)
+		timer.start()
+		try:
+			self._send_and_read(server, handled)
+			self.assertEqual((server.enqueued, server.dropped), (5, 0))
+		finally:
+			release.set()
+			timer.join()
+			server.server_close()
+		self.assertEqual(handled, self.MESSAGES)
+
+	def test_forwards_server_options_WHEN_pooled(self) -> None:
+		"""Test that the McastServer options reach the base server through the pool server."""
+		(server, _, release) = self._start(
+			workers=1, control_address=("127.0.0.1", 0), rate_limit=10.0,
+			sources=["127.0.0.1"], blocked_sources=[],
+		)
+		try:
+			self.assertIsNotNone(server.control_socket)
+			self.assertIsNotNone(server.rate_limiter)
+			self.assertEqual(server.sources, ["127.0.0.1"])
+			self.assertTrue(server.persistent)
+		finally:
+			release.set()
+			server.server_close()
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,189 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module (Testing)
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test module for the sharded multi-process variant of the multicast HEAR server.
+
+This module contains tests that send loopback datagrams from many sources to a `McastSupervisor`
+and check that each datagram is processed by exactly one worker process, that dead workers are
+restarted without losing their counts, that workers failing to start are given up on, and that a
+STOP request ends the supervision.
+"""
+
+__module__ = "tests"
+
+try:
+	try:
+		import context
+	except Exception as _cause:  # pragma: no branch
+		del _cause  # skipcq - cleanup any error vars early
+		from . import context
+	if not hasattr(context, '__name__') or not context.__name__:  # pragma: no branch
+		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
+	else:
+		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
+		from context import unittest
+		from unittest import mock
+		import socket
+		import sys
+		import time
+except Exception as baton:
+	raise ImportError("[CWE-758] Failed to import test context") from baton
+
+
+def _fail_to_start(*args) -> None:
+	"""Stand in for a worker that exits with an error before it binds its socket."""
+	sys.exit(1)
+
+
+@context.markWithMetaTag("mat", "hear")
+class McastSupervisorTestSuite(context.BasicUsageTestSuite):
+	"""Test cases for the SO_REUSEPORT worker processes of McastSupervisor."""
+
+	__module__ = "tests.test_hear_workers"
+
+	__name__ = "tests.test_hear_workers.McastSupervisorTestSuite"
+
+	TEST_MULTICAST_GROUP: str = "224.0.0.1"
+	"""Standard multicast group address for testing."""
+
+	WORKERS: int = 3
+	"""Number of worker processes."""
+
+	SOURCES: int = 24
+	"""Number of distinct senders (each with its own source port)."""
+
+	def _send_from_sources(self, port: int, count: int) -> None:
+		"""Send one datagram from each of `count` new sender sockets."""
+		for number in range(count):
+			with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, port) as tx:
+				tx.send(f"source {number}".encode())
+
+	def _wait_for(self, supervisor, accepted: int) -> dict:
+		"""Wait (up to 5 seconds) for the workers to publish `accepted` requests."""
+		deadline = time.monotonic() + 5
+		stats = supervisor.stats()
+		while stats["accepted"] < accepted and time.monotonic() < deadline:
+			time.sleep(0.05)
+			stats = supervisor.stats()
+		time.sleep(0.3)  # let any duplicate processing show up too
+		return supervisor.stats()
+
+	def test_each_datagram_processed_once_WHEN_sharded(self) -> None:
+		"""Test that every worker gets a copy, and exactly one of them processes it."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		supervisor = multicast.hear.McastSupervisor(
+			(self.TEST_MULTICAST_GROUP, _fixture_port_num), workers=self.WORKERS,
+			poll_interval=0.05,
+		)
+		with supervisor:
+			self.assertEqual(supervisor.alive, self.WORKERS)
+			self._send_from_sources(_fixture_port_num, self.SOURCES)
+			stats = self._wait_for(supervisor, self.SOURCES)
+		self.assertEqual(stats["accepted"], self.SOURCES)
+		self.assertEqual(stats["filtered"], self.SOURCES * (self.WORKERS - 1))
+		self.assertEqual(stats["rate_limited"], 0)
+
+	def test_restarts_dead_worker_WHEN_polled(self) -> None:
+		"""Test that a killed worker is restarted, and its counts are kept."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		supervisor = multicast.hear.McastSupervisor(
+			(self.TEST_MULTICAST_GROUP, _fixture_port_num), workers=2, poll_interval=0.05,
+		)
+		with supervisor:
+			self._send_from_sources(_fixture_port_num, self.SOURCES)
+			before = self._wait_for(supervisor, self.SOURCES)
+			victim = supervisor._processes[0]  # skipcq: PYL-W0212 - test access ok
+			victim.kill()
+			victim.join(5)
+			self.assertTrue(supervisor.poll())
+			self.assertTrue(supervisor.wait_ready())
+			self.assertEqual(supervisor.alive, 2)
+			self.assertEqual(supervisor.restarts, 1)
+			self.assertEqual(supervisor.stats()["accepted"], before["accepted"])
+			self._send_from_sources(_fixture_port_num, self.SOURCES)
+			after = self._wait_for(supervisor, 2 * self.SOURCES)
+		self.assertEqual(after["accepted"], 2 * self.SOURCES)
+
+	def test_unicast_processed_by_receiving_worker_WHEN_multi_group(self) -> None:
+		"""Test that unicast datagrams, balanced by the kernel, are never filtered by shard."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		supervisor = multicast.hear.McastSupervisor(
+			(self.TEST_MULTICAST_GROUP, _fixture_port_num), workers=self.WORKERS,
+			poll_interval=0.05, groups=[self.TEST_MULTICAST_GROUP, "224.0.0.2"], reply_policy="none",
+		)
+		with supervisor:
+			for number in range(self.SOURCES):
+				with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tx:
+					tx.sendto(f"source {number}".encode(), ("127.0.0.1", _fixture_port_num))
+			stats = self._wait_for(supervisor, self.SOURCES)
+		self.assertEqual((stats["accepted"], stats["filtered"]), (self.SOURCES, 0))
+
+	def test_start_raises_WHEN_workers_fail_to_start(self) -> None:
+		"""Test that start stops the workers and raises, when a worker dies before it is ready."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		supervisor = multicast.hear.McastSupervisor(
+			(self.TEST_MULTICAST_GROUP, _fixture_port_num), workers=2, poll_interval=0.05,
+		)
+		with mock.patch.object(multicast.hear, "_serve_shard", _fail_to_start):
+			start = time.monotonic()
+			with self.assertRaises(RuntimeError):
+				supervisor.start()
+		self.assertLess(time.monotonic() - start, 2)
+		self.assertEqual(supervisor.alive, 0)
+
+	def test_gives_up_on_worker_WHEN_restarts_keep_failing(self) -> None:
+		"""Test that a worker dying before it is ready is only restarted `max_failures` times."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		supervisor = multicast.hear.McastSupervisor(
+			(self.TEST_MULTICAST_GROUP, _fixture_port_num), workers=2, poll_interval=0.05,
+			max_failures=3,
+		)
+		with supervisor:
+			with mock.patch.object(multicast.hear, "_serve_shard", _fail_to_start):
+				victim = supervisor._processes[0]  # skipcq: PYL-W0212 - test access ok
+				victim.kill()
+				victim.join(5)
+				deadline = time.monotonic() + 5
+				with self.assertRaises(RuntimeError):
+					while time.monotonic() < deadline:
+						supervisor.poll()
+						time.sleep(0.05)
+		self.assertEqual(supervisor.restarts, 3)
+		self.assertEqual(supervisor.alive, 0)
+
+	def test_stops_supervising_WHEN_worker_stopped(self) -> None:
+		"""Test that a STOP request ends the supervision, rather than restarting the worker."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		supervisor = multicast.hear.McastSupervisor(
+			(self.TEST_MULTICAST_GROUP, _fixture_port_num), workers=2, poll_interval=0.05,
+		)
+		with supervisor:
+			self._send_from_sources(_fixture_port_num, 1)
+			with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, _fixture_port_num) as tx:
+				tx.send(b"STOP")
+			start = time.monotonic()
+			supervisor.serve_forever()
+			self.assertLess(time.monotonic() - start, 5)
+		self.assertEqual(supervisor.restarts, 0)
+		self.assertEqual(supervisor.alive, 0)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -94,6 +94,8 @@ def test_sdist_includes_required_files(self):
 			f"{package_prefix}/multicast/recv.py",
 			f"{package_prefix}/multicast/send.py",
 			f"{package_prefix}/multicast/hear.py",
+			f"{package_prefix}/multicast/aio.py",
+			f"{package_prefix}/multicast/ring.py",
 			f"{package_prefix}/multicast/env.py",
 			f"{package_prefix}/multicast/exceptions.py",
 			# Include other important files and directories
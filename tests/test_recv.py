@@ -20,7 +20,8 @@
 """Test module for multicast.recv functionality.
 
 This module provides test cases for the recv module, focusing on the
-McastRECV.doStep method's branching logic for success/failure logging.
+McastRECV.doStep method's branching logic for success/failure logging, and on the
+streaming iter_datagrams generator.
 """
 
 
@@ -41,6 +42,9 @@
 		from context import unittest
 		from unittest import mock
 		import io
+		import socket
+		import threading
+		import time
 except ImportError as baton:
 	raise ImportError("[CWE-758] Failed to import test context") from baton
 
@@ -167,5 +171,330 @@ def test_doStep_with_custom_parameters(self, mock_logger: mock.MagicMock) -> Non
 			mock_logger.info.assert_called_once_with("Success")
 
 
+@context.markWithMetaTag("mat", "hear")
+class IterDatagramsTestSuite(context.BasicUsageTestSuite):
+	"""Test cases for the streaming multicast.recv.iter_datagrams generator."""
+
+	__module__ = "tests.test_recv"
+
+	__name__ = "tests.test_recv.IterDatagramsTestSuite"
+
+	TEST_MULTICAST_GROUP: str = "224.0.0.1"
+	"""Standard multicast group address for testing."""
+
+	def _send_later(self, messages: list, delay: float = 0.25) -> threading.Timer:
+		"""Send the given messages to the test group after a short delay."""
+		def _send() -> None:
+			with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, self._the_test_port) as tx:
+				for message in messages:
+					tx.send(message)
+
+		timer = threading.Timer(delay, _send)
+		timer.start()
+		return timer
+
+	def test_iter_datagrams_joins_once_WHEN_receiving_many(self) -> None:
+		"""Test that many datagrams are received through a single joined socket."""
+		messages = [f"message {i}".encode() for i in range(5)]
+		with mock.patch.object(
+			multicast.recv, "joinstep", wraps=multicast.recv.joinstep,
+		) as mock_join:
+			timer = self._send_later(messages)
+			received = list(multicast.recv.iter_datagrams(
+				[self.TEST_MULTICAST_GROUP], self._the_test_port,
+				bind_group=self.TEST_MULTICAST_GROUP, max_count=len(messages), timeout=3,
+			))
+			timer.join()
+		self.assertEqual(received, messages)
+		self.assertEqual(mock_join.call_count, 1)
+
+	def test_iter_datagrams_closes_socket_WHEN_consumer_stops(self) -> None:
+		"""Test that the socket is closed when the consumer leaves the loop early."""
+		joined = []
+		original_joinstep = multicast.recv.joinstep
+
+		def _capturing_joinstep(*args, **kwargs):
+			joined.append(original_joinstep(*args, **kwargs))
+			return joined[-1]
+
+		with mock.patch.object(multicast.recv, "joinstep", side_effect=_capturing_joinstep):
+			timer = self._send_later([b"first", b"second"])
+			stream = multicast.recv.iter_datagrams(
+				[self.TEST_MULTICAST_GROUP], self._the_test_port,
+				bind_group=self.TEST_MULTICAST_GROUP, timeout=3,
+			)
+			for datagram in stream:
+				self.assertEqual(datagram, b"first")
+				break
+			stream.close()
+			timer.join()
+		self.assertEqual(len(joined), 1)
+		self.assertEqual(joined[0].fileno(), -1, "Socket was left open.")
+
+	def test_iter_datagrams_reuses_pool_WHEN_views_released(self) -> None:
+		"""Test that steady-state reception with a buffer pool allocates no new slabs."""
+		messages = [f"pooled {i}".encode() for i in range(20)]
+		pool = multicast.recv.BufferPool(2)
+		received = []
+		timer = self._send_later(messages)
+		for view in multicast.recv.iter_datagrams(
+			[self.TEST_MULTICAST_GROUP], self._the_test_port,
+			bind_group=self.TEST_MULTICAST_GROUP, max_count=len(messages), timeout=3, pool=pool,
+		):
+			self.assertIsInstance(view, memoryview)
+			received.append(bytes(view))
+			pool.release(view)
+		timer.join()
+		self.assertEqual(received, messages)
+		self.assertEqual(pool.grown, 0)
+		self.assertEqual(pool.available, 2)
+
+	def test_drainstep_keeps_pool_size_WHEN_max_batch_exceeds_it(self) -> None:
+		"""Test that draining into a pool with a large cap only uses the free slabs."""
+		pool = multicast.recv.BufferPool(2)
+		sock = multicast.genSocket()
+		try:
+			sock.bind(("127.0.0.1", 0))
+			for message in (b"one", b"two", b"three"):
+				sock.sendto(message, sock.getsockname())
+			time.sleep(0.1)
+			received = []
+			for _ in range(2):
+				batch = multicast.recv.drainstep(sock, 1000, pool)
+				received.extend(bytes(view) for view in batch)
+				for view in batch:
+					pool.release(view)
+			self.assertEqual(received, [b"one", b"two", b"three"])
+			self.assertEqual((pool.grown, pool.available), (0, 2))
+			self.assertEqual(multicast.recv.drainstep(sock, 1000, pool), [])
+			self.assertEqual((pool.grown, pool.available), (0, 2))
+		finally:
+			multicast.endSocket(sock)
+
+	def test_buffer_pool_rejects_slab_WHEN_owned_by_another_pool(self) -> None:
+		"""Test that a pool only takes back the very slabs it handed out."""
+		pool = multicast.recv.BufferPool(1, 8)
+		other = multicast.recv.BufferPool(1, 8)
+		foreign = other.acquire()
+		with self.assertRaises(ValueError):
+			pool.release(foreign)
+		with self.assertRaises(ValueError):
+			pool.release(memoryview(bytearray(8)))
+		self.assertEqual(pool.available, 1)
+		other.release(foreign)
+		self.assertEqual(other.available, 1)
+
+	def test_iter_datagrams_yields_arrival_time_WHEN_timestamps(self) -> None:
+		"""Test that each datagram is yielded with its arrival time, taken before it was read."""
+		timer = self._send_later([b"one", b"two"])
+		received = []
+		for (payload, arrival) in multicast.recv.iter_datagrams(
+			[self.TEST_MULTICAST_GROUP], self._the_test_port, None, self.TEST_MULTICAST_GROUP,
+			max_count=2, timeout=3, timestamps=True,
+		):
+			received.append((payload, arrival, time.time_ns()))
+		timer.join()
+		self.assertEqual([payload for (payload, _, _) in received], [b"one", b"two"])
+		for (_, arrival, consumed) in received:
+			self.assertIsInstance(arrival, int)
+			self.assertLessEqual(arrival, consumed)
+		self.assertLessEqual(received[0][1], received[1][1])
+
+	def test_iter_batches_drains_burst_WHEN_queued(self) -> None:
+		"""Test that a queued burst is yielded in batches no larger than max_batch."""
+		messages = [f"burst {i}".encode() for i in range(10)]
+		batches = []
+		timer = self._send_later(messages)
+		for batch in multicast.recv.iter_batches(
+			[self.TEST_MULTICAST_GROUP], self._the_test_port,
+			bind_group=self.TEST_MULTICAST_GROUP, max_batch=4, timeout=1,
+		):
+			batches.append(batch)
+		timer.join()
+		self.assertEqual([datagram for batch in batches for datagram in batch], messages)
+		self.assertTrue(all(0 < len(batch) <= 4 for batch in batches))
+
+	def test_hearstep_returns_raw_bytes_WHEN_binary(self) -> None:
+		"""Test that binary mode RECV returns payloads that are not valid UTF-8 untouched."""
+		payload = b"\xff\x00\xfe binary"
+		timer = self._send_later([payload])
+		(result, response) = multicast.recv.McastRECV().doStep(
+			groups=[self.TEST_MULTICAST_GROUP], port=self._the_test_port,
+			group=self.TEST_MULTICAST_GROUP, binary=True, is_std=False,
+		)
+		timer.join()
+		self.assertTrue(result)
+		self.assertEqual(response, payload)
+
+	def test_tryrecv_accumulates_linearly_WHEN_many_chunks(self) -> None:
+		"""Test that tryrecv appends many chunks to an accumulator without re-copying them."""
+		chunks = [f"{i:04d}".encode() for i in range(1000)]
+		mock_sock = mock.MagicMock()
+		mock_sock.recv.side_effect = chunks
+		accumulator = multicast.recv.MessageAccumulator()
+		for _ in chunks:
+			self.assertIs(multicast.recv.tryrecv(accumulator, None, mock_sock), accumulator)
+		self.assertEqual(accumulator.getvalue(), b"".join(chunks))
+		self.assertEqual(len(accumulator), 4000)
+
+	def test_doStep_bounds_memory_WHEN_accumulator_capped(self) -> None:
+		"""Test that RECV keeps at most max_size bytes of a received message."""
+		timer = self._send_later([b"x" * 100])
+		accumulator = multicast.recv.MessageAccumulator(max_size=10)
+		(result, response) = multicast.recv.McastRECV().doStep(
+			groups=[self.TEST_MULTICAST_GROUP], port=self._the_test_port,
+			group=self.TEST_MULTICAST_GROUP, accumulator=accumulator, is_std=False,
+		)
+		timer.join()
+		self.assertTrue(result)
+		self.assertEqual(response, "x" * 10)
+		self.assertEqual(accumulator.truncated, 90)
+
+	def test_accumulator_spills_to_disk_WHEN_beyond_max_size(self) -> None:
+		"""Test that a spilling accumulator keeps data in memory until max_size is exceeded."""
+		with multicast.recv.MessageAccumulator(max_size=8, spill=True) as accumulator:
+			accumulator.append(b"12345678")
+			self.assertFalse(accumulator.spilled)
+			accumulator.append(b"9")
+			self.assertTrue(accumulator.spilled)
+			accumulator.append(b"0")
+			self.assertEqual(accumulator.getvalue(), b"1234567890")
+			self.assertEqual((len(accumulator), accumulator.truncated), (10, 0))
+		with self.assertRaises(ValueError):
+			multicast.recv.MessageAccumulator(spill=True)
+
+	def test_accumulator_streams_spilled_data_WHEN_iterated(self) -> None:
+		"""Test that spilled data is read back in bounded chunks, keeping split characters whole."""
+		data = "caf\u00e9 ".encode("utf8") * 4
+		with multicast.recv.MessageAccumulator(max_size=4, spill=True) as accumulator:
+			for i in range(0, len(data), 3):
+				accumulator.append(data[i:i + 3])
+			self.assertTrue(accumulator.spilled)
+			chunks = list(accumulator.iter_chunks(size=4))
+			self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+			self.assertEqual(b"".join(chunks), data)
+			self.assertEqual("".join(accumulator.iter_text(size=4)), "caf\u00e9 " * 4)
+			accumulator.append(b"!")
+			self.assertEqual(accumulator.getvalue(), data + b"!")
+
+	def test_doStep_returns_accumulator_WHEN_spilled(self) -> None:
+		"""Test that RECV hands back spilled data to stream instead of joining it in memory."""
+		timer = self._send_later([b"x" * 100])
+		with multicast.recv.MessageAccumulator(max_size=10, spill=True) as accumulator:
+			(result, response) = multicast.recv.McastRECV().doStep(
+				groups=[self.TEST_MULTICAST_GROUP], port=self._the_test_port,
+				group=self.TEST_MULTICAST_GROUP, accumulator=accumulator, is_std=False,
+			)
+			timer.join()
+			self.assertTrue(result)
+			self.assertIs(response, accumulator)
+			self.assertEqual(b"".join(response.iter_chunks()), b"x" * 100)
+
+	def _receive_with(self, **kwargs) -> list:
+		"""Join the test group with the given source filters, send it one datagram, and drain."""
+		sock = multicast.recv.joinstep(
+			[self.TEST_MULTICAST_GROUP], self._the_test_port, None, self.TEST_MULTICAST_GROUP,
+			None, **kwargs,
+		)
+		try:
+			with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, self._the_test_port) as tx:
+				tx.send(b"sent")
+			time.sleep(0.1)
+			return multicast.recv.drainstep(sock)
+		finally:
+			multicast.endSocket(sock)
+
+	@unittest.skipUnless(sys.platform.startswith("linux"), "Requires IP_ADD_SOURCE_MEMBERSHIP")
+	def test_joinstep_filters_senders_in_kernel_WHEN_sources(self) -> None:
+		"""Test that source-specific joins and blocked sources filter senders before userland."""
+		sock = multicast.recv.joinstep(
+			[self.TEST_MULTICAST_GROUP], self._the_test_port, None, self.TEST_MULTICAST_GROUP,
+		)
+		try:
+			with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, self._the_test_port) as tx:
+				tx.send(b"probe")
+			sock.settimeout(1)
+			(_, (sender, _)) = sock.recvfrom(64)
+		finally:
+			multicast.endSocket(sock)
+		self.assertEqual(self._receive_with(sources=[sender]), [b"sent"])
+		self.assertEqual(self._receive_with(sources=["192.0.2.1"]), [])
+		self.assertEqual(self._receive_with(sources=[], blocked=[sender]), [])
+		self.assertEqual(self._receive_with(sources=[], blocked=["192.0.2.1"]), [b"sent"])
+
+
+@context.markWithMetaTag("mat", "hear")
+class DropAccountingTestSuite(context.BasicUsageTestSuite):
+	"""Test cases for counting the datagrams dropped on receive buffer overflow."""
+
+	__module__ = "tests.test_recv"
+
+	__name__ = "tests.test_recv.DropAccountingTestSuite"
+
+	TEST_MULTICAST_GROUP: str = "224.0.0.1"
+	"""Standard multicast group address for testing."""
+
+	BURST_COUNT: int = 200
+	"""Number of datagrams sent to overflow the smallest receive buffer."""
+
+	def _overflow(self, sock: socket.socket) -> None:
+		"""Shrink the receive buffer of the socket, then overflow it with a burst."""
+		sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1)  # the kernel rounds up
+		port = sock.getsockname()[1]
+		with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, port) as tx:
+			tx.send_many([b"x" * 512] * self.BURST_COUNT)
+		time.sleep(0.1)
+
+	def _drain_then_send(self, sock: socket.socket, receive) -> None:
+		"""Read every queued datagram, then queue one more, which carries the drop counter."""
+		timeout = sock.gettimeout()
+		sock.settimeout(0.0)
+		try:
+			while True:
+				receive()
+		except BlockingIOError:
+			pass
+		finally:
+			sock.settimeout(timeout)
+		with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, sock.getsockname()[1]) as tx:
+			tx.send(b"after")
+		time.sleep(0.1)
+
+	@unittest.skipUnless(sys.platform.startswith("linux"), "Requires SO_RXQ_OVFL and /proc/net/udp")
+	def test_drop_counter_counts_overflow_WHEN_burst(self) -> None:
+		"""Test that overflowing drops are counted, both from recvmsg and /proc/net/udp."""
+		sock = multicast.recv.joinstep(
+			[self.TEST_MULTICAST_GROUP], self._the_test_port, None, self.TEST_MULTICAST_GROUP,
+		)
+		drops = multicast.skt.DropCounter()
+		try:
+			self.assertTrue(drops.enable(sock))
+			self._overflow(sock)
+			sampled = multicast.skt.udp_drops(inode=drops.inode)
+			self.assertGreater(sampled, 0, "The burst did not overflow the receive buffer.")
+			self._drain_then_send(sock, lambda: drops.recvfrom(sock, 1316))
+			self.assertEqual(drops.recvfrom(sock, 1316)[0], b"after")
+			self.assertEqual(drops.total, sampled)
+			self.assertEqual(drops.sample(), sampled)
+			self.assertEqual((drops.interval(), drops.interval()), (sampled, 0))
+		finally:
+			multicast.endSocket(sock)
+
+	@unittest.skipUnless(sys.platform.startswith("linux"), "Requires SO_RXQ_OVFL")
+	def test_server_counts_drops_WHEN_buffer_overflows(self) -> None:
+		"""Test that McastServer exposes the drops of its socket."""
+		server = multicast.hear.McastServer(
+			(self.TEST_MULTICAST_GROUP, self._the_test_port), None,
+		)
+		try:
+			self._overflow(server.socket)
+			self._drain_then_send(server.socket, server.get_request)
+			self.assertEqual(server.get_request()[0][0], b"after")
+			self.assertGreater(server.drops.total, 0)
+			self.assertEqual(server.drops.interval(), server.drops.total)
+		finally:
+			server.server_close()
+
+
 if __name__ == '__main__':
 	unittest.main()
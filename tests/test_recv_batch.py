@@ -0,0 +1,167 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module (Testing)
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test module for benchmarking the kernel-batched receives of the multicast RECV path.
+
+This module contains a loopback benchmark that drains the same queued burst of datagrams once
+with the pure-Python per-datagram loop, and once with the `recvmmsg` fast path, and compares the
+datagrams per second of each.
+"""
+
+__module__ = "tests"
+
+try:
+	try:
+		import context
+	except Exception as _cause:  # pragma: no branch
+		del _cause  # skipcq - cleanup any error vars early
+		from . import context
+	if not hasattr(context, '__name__') or not context.__name__:  # pragma: no branch
+		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
+	else:
+		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
+		from context import unittest
+		from unittest import mock
+		import gc
+		import logging
+		import socket
+		import time
+except Exception as baton:
+	raise ImportError("[CWE-758] Failed to import test context") from baton
+
+
+@context.markWithMetaTag("performance", "multi_receiver")
+class RecvBatchTestSuite(context.BasicUsageTestSuite):
+	"""
+	Loopback benchmark for the recvmmsg fast path of multicast.recv.drainstep.
+
+	Queues the same burst on a joined receiver twice, drains it with and without the fast path, and
+	records the datagrams per second of each.
+	"""
+
+	__module__ = "tests.test_recv_batch"
+
+	__name__ = "tests.test_recv_batch.RecvBatchTestSuite"
+
+	TEST_MULTICAST_GROUP: str = "224.0.0.1"
+	"""Standard multicast group address for testing."""
+
+	BURST_COUNT: int = 4000
+	"""Number of datagrams queued per burst."""
+
+	RECEIVE_BUFFER_SIZE: int = 4194304
+	"""Requested receive buffer size in bytes (capped by the kernel's net.core.rmem_max)."""
+
+	REPEAT: int = 5
+	"""Number of timed drains per path; like timeit, the best rate of each path is compared."""
+
+	TOLERANCE: float = 0.9
+	"""Fraction of the loop's rate the fast path must reach (where system calls are cheap, such as
+	in some virtual machines, both paths drain at about the same rate)."""
+
+	def _run_drain(self, fast_path: bool) -> tuple:
+		"""
+		Queue a loopback burst on a joined receiver, then drain it.
+
+		Args:
+			fast_path (bool): Allow the recvmmsg fast path.
+
+		Returns:
+			tuple: The received payloads and the drained datagrams per second.
+		"""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		receiver = multicast.recv.joinstep(
+			[self.TEST_MULTICAST_GROUP], _fixture_port_num, None, self.TEST_MULTICAST_GROUP,
+		)
+		receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RECEIVE_BUFFER_SIZE)
+		try:
+			received = []
+			with mock.patch.object(
+				multicast.skt, "has_mmsg", return_value=(fast_path and multicast.skt.has_mmsg()),
+			):
+				self.assertEqual(multicast.recv.drainstep(receiver), [])  # warm up, while idle
+				with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, _fixture_port_num) as tx:
+					tx.send_many(f"{count:06d}".encode() for count in range(self.BURST_COUNT))
+				time.sleep(0.1)
+				gc.disable()  # like timeit, keep collector pauses out of the measurement
+				try:
+					start = time.monotonic()
+					while True:
+						batch = multicast.recv.drainstep(receiver)
+						if not batch:
+							break
+						received.extend(batch)
+					elapsed = time.monotonic() - start
+				finally:
+					gc.enable()
+		finally:
+			multicast.endSocket(receiver)
+		return (received, (len(received) / elapsed) if elapsed > 0 else 0)
+
+	def test_recvmmsg_drains_at_least_as_fast_WHEN_burst(self) -> None:
+		"""Test that the recvmmsg fast path drains a queued burst at least as fast as the loop."""
+		(loop_received, loop_rate) = max(
+			(self._run_drain(fast_path=False) for _ in range(self.REPEAT)), key=lambda run: run[1],
+		)
+		(fast_received, fast_rate) = max(
+			(self._run_drain(fast_path=True) for _ in range(self.REPEAT)), key=lambda run: run[1],
+		)
+		logging.getLogger(self.__module__).info(
+			"burst of %d: loop drained %d (%.0f/s), recvmmsg drained %d (%.0f/s)",
+			self.BURST_COUNT, len(loop_received), loop_rate, len(fast_received), fast_rate,
+		)
+		self.assertGreater(len(fast_received), 0, "Nothing was drained.")
+		self.assertGreaterEqual(fast_rate, loop_rate * self.TOLERANCE, "recvmmsg drained slower.")
+
+	def test_fast_path_matches_fallback_WHEN_draining(self) -> None:
+		"""Test that both drain paths return the same payloads, in order."""
+		(loop_received, _) = self._run_drain(fast_path=False)
+		(fast_received, _) = self._run_drain(fast_path=True)
+		expected = [f"{count:06d}".encode() for count in range(self.BURST_COUNT)]
+		self.assertEqual(loop_received, expected)
+		self.assertEqual(fast_received, expected)
+
+	def test_pooled_fast_path_returns_unused_slabs_WHEN_draining(self) -> None:
+		"""Test that draining into a pool keeps only the slabs of received datagrams."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		receiver = multicast.recv.joinstep(
+			[self.TEST_MULTICAST_GROUP], _fixture_port_num, None, self.TEST_MULTICAST_GROUP,
+		)
+		pool = multicast.recv.BufferPool(8)
+		try:
+			with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, _fixture_port_num) as tx:
+				tx.send_many([b"one", b"two", b"three"])
+			time.sleep(0.1)
+			batch = multicast.recv.drainstep(receiver, 8, pool)
+			self.assertEqual([bytes(view) for view in batch], [b"one", b"two", b"three"])
+			self.assertEqual(pool.available, 5)
+			for view in batch:
+				pool.release(view)
+			self.assertEqual((pool.available, pool.grown), (8, 0))
+		finally:
+			multicast.endSocket(receiver)
+
+	def tearDown(self) -> None:
+		"""Tear down test fixtures."""
+		super(RecvBatchTestSuite, self).tearDown()
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,125 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module (Testing)
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test module for the per-socket isolation of multicast group traffic.
+
+This module contains a loopback harness that runs several receivers of different groups on one port
+of one host, and counts the datagrams (each one a wakeup) every receiver gets, with and without
+`IP_MULTICAST_ALL` cleared.
+"""
+
+__module__ = "tests"
+
+try:
+	try:
+		import context
+	except Exception as _cause:  # pragma: no branch
+		del _cause  # skipcq - cleanup any error vars early
+		from . import context
+	if not hasattr(context, '__name__') or not context.__name__:  # pragma: no branch
+		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
+	else:
+		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
+		from context import sys
+		from context import unittest
+		import logging
+		import time
+except Exception as baton:
+	raise ImportError("[CWE-758] Failed to import test context") from baton
+
+
+@context.markWithMetaTag("performance", "multi_receiver")
+class RecvIsolationTestSuite(context.BasicUsageTestSuite):
+	"""
+	Loopback harness for the cross-talk between receivers of different groups sharing a port.
+
+	Each receiver binds the wildcard address on the same port, and joins its own group. Every group
+	is then sent the same number of datagrams, and the datagrams each receiver got are counted.
+	"""
+
+	__module__ = "tests.test_recv_isolation"
+
+	__name__ = "tests.test_recv_isolation.RecvIsolationTestSuite"
+
+	TEST_MULTICAST_GROUPS: tuple = ("224.0.0.1", "224.0.0.2", "224.0.0.3")
+	"""The groups of the receivers, one receiver each."""
+
+	MESSAGE_COUNT: int = 20
+	"""Number of datagrams sent to each group."""
+
+	def _run_harness(self, isolate: bool) -> dict:
+		"""
+		Run one receiver per group on one port, send every group a burst, and count the wakeups.
+
+		Args:
+			isolate (bool): Whether the receivers clear IP_MULTICAST_ALL.
+
+		Returns:
+			dict: The number of datagrams each group's receiver got, and how many of them were sent
+				to other groups, as {group: (received, foreign)}.
+		"""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		receivers = {
+			group: multicast.recv.joinstep(
+				[group], _fixture_port_num, None, "0.0.0.0", None, isolate=isolate,
+			)
+			for group in self.TEST_MULTICAST_GROUPS
+		}
+		try:
+			for group in self.TEST_MULTICAST_GROUPS:
+				with multicast.send.McastSender(group, _fixture_port_num) as tx:
+					tx.send_many(group.encode() for _ in range(self.MESSAGE_COUNT))
+			time.sleep(0.2)
+			counts = {}
+			for (group, sock) in receivers.items():
+				received = []
+				while True:
+					batch = multicast.recv.drainstep(sock)
+					if not batch:
+						break
+					received.extend(batch)
+				counts[group] = (len(received), sum(data != group.encode() for data in received))
+		finally:
+			for sock in receivers.values():
+				multicast.endSocket(sock)
+		logging.getLogger(self.__module__).info(
+			"isolate=%s: datagrams per receiver (received, foreign) %s",
+			isolate, counts,
+		)
+		return counts
+
+	@unittest.skipUnless(sys.platform.startswith("linux"), "Requires IP_MULTICAST_ALL")
+	def test_receivers_only_wake_for_own_group_WHEN_isolated(self) -> None:
+		"""Test that isolated receivers sharing a port only get the datagrams of their group."""
+		counts = self._run_harness(isolate=True)
+		for group in self.TEST_MULTICAST_GROUPS:
+			self.assertEqual(counts[group], (self.MESSAGE_COUNT, 0), f"Cross-talk on {group}")
+
+	@unittest.skipUnless(sys.platform.startswith("linux"), "Requires IP_MULTICAST_ALL")
+	def test_receivers_cross_talk_WHEN_not_isolated(self) -> None:
+		"""Test that the harness detects cross-talk between receivers that are not isolated."""
+		counts = self._run_harness(isolate=False)
+		total = self.MESSAGE_COUNT * len(self.TEST_MULTICAST_GROUPS)
+		for group in self.TEST_MULTICAST_GROUPS:
+			self.assertEqual(counts[group], (total, total - self.MESSAGE_COUNT))
+
+
+if __name__ == '__main__':
+	unittest.main()
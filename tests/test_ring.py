@@ -0,0 +1,187 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module (Testing)
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test module for the shared-memory fan-out ring of multicast.ring.
+
+This module contains tests that receive loopback datagrams once with a `RingFanout`, and check
+that local readers (in this and in other processes) each read every datagram in order, and that
+a reader falling more than a full ring behind detects the overrun.
+"""
+
+__module__ = "tests"
+
+try:
+	try:
+		import context
+	except Exception as _cause:  # pragma: no branch
+		del _cause  # skipcq - cleanup any error vars early
+		from . import context
+	if not hasattr(context, '__name__') or not context.__name__:  # pragma: no branch
+		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
+	else:
+		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
+		from context import unittest
+		import multiprocessing
+		import socket
+		import threading
+except Exception as baton:
+	raise ImportError("[CWE-758] Failed to import test context") from baton
+
+
+def _read_in_child(name: str, count: int, results) -> None:
+	"""Read `count` datagrams from the ring in a separate process, and report them."""
+	with multicast.ring.RingReader(name, start=1) as reader:
+		received = []
+		while len(received) < count:
+			item = reader.read(timeout=5)
+			if item is None:
+				break
+			received.append(bytes(item[1]))
+			item[1].release()
+		results.put((received, reader.lost))
+
+
+@context.markWithMetaTag("mat", "hear")
+class RingFanoutTestSuite(context.BasicUsageTestSuite):
+	"""Test cases for multicast.ring fan-out to local readers."""
+
+	__module__ = "tests.test_ring"
+
+	__name__ = "tests.test_ring.RingFanoutTestSuite"
+
+	TEST_MULTICAST_GROUP: str = "224.0.0.1"
+	"""Standard multicast group address for testing."""
+
+	MESSAGES: list = [f"datagram {count}".encode() for count in range(20)]
+	"""The datagrams sent to the fan-out, in order."""
+
+	def test_every_reader_gets_every_datagram_WHEN_fanned_out(self) -> None:
+		"""Test that one received copy reaches readers in this and another process."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		with multicast.ring.RingFanout(
+			[self.TEST_MULTICAST_GROUP], _fixture_port_num,
+			bind_group=self.TEST_MULTICAST_GROUP, slots=64, slot_size=256,
+		) as fanout:
+			results = multiprocessing.get_context().Queue()
+			child = multiprocessing.get_context().Process(
+				target=_read_in_child, args=(fanout.ring.name, len(self.MESSAGES), results),
+			)
+			child.start()
+			local = multicast.ring.RingReader(fanout.ring.name, start=1)
+			server = threading.Thread(target=fanout.serve_forever, daemon=True)
+			server.start()
+			try:
+				with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, _fixture_port_num) as tx:
+					tx.send_many(self.MESSAGES)
+				received = []
+				while len(received) < len(self.MESSAGES):
+					item = local.read(timeout=5)
+					if item is None:
+						break
+					(seq, view) = item
+					self.assertTrue(local.valid(seq))
+					received.append(bytes(view))
+					view.release()
+				(child_received, child_lost) = results.get(timeout=10)
+				child.join(5)
+			finally:
+				fanout.shutdown()
+				server.join(5)
+				local.close()
+		self.assertEqual(received, self.MESSAGES)
+		self.assertEqual(child_received, self.MESSAGES)
+		self.assertEqual((local.lost, child_lost), (0, 0))
+
+	def test_slow_reader_detects_overrun_WHEN_lapped(self) -> None:
+		"""Test that a reader more than a full ring behind skips ahead, and counts the loss."""
+		with multicast.ring.McastRing(slots=8, slot_size=32) as ring:
+			with multicast.ring.RingReader(ring.name, start=1) as reader:
+				for message in self.MESSAGES:
+					ring.write(message)
+				self.assertEqual(reader.backlog, len(self.MESSAGES))
+				received = [bytes(view) for (_, view) in reader]
+				self.assertEqual(received, self.MESSAGES[-8:])
+				self.assertEqual((reader.overruns, reader.lost), (1, len(self.MESSAGES) - 8))
+
+	def test_stale_view_is_invalid_WHEN_slot_reused(self) -> None:
+		"""Test that a view kept past a lap of the writer is reported as overwritten."""
+		with multicast.ring.McastRing(slots=2, slot_size=32) as ring:
+			with multicast.ring.RingReader(ring.name) as reader:
+				ring.write(b"first")
+				(seq, view) = reader.read()
+				self.assertTrue(reader.valid(seq))
+				ring.write(b"second")
+				ring.write(b"third")
+				self.assertFalse(reader.valid(seq))
+				self.assertEqual(bytes(view), b"third")
+				view.release()
+
+	def test_oldest_datagram_survives_WHEN_receive_fails(self) -> None:
+		"""Test that an idle or failed receive into a full ring keeps its oldest datagram."""
+		with multicast.ring.McastRing(slots=4, slot_size=32) as ring:
+			with multicast.ring.RingReader(ring.name, start=1) as reader:
+				for message in self.MESSAGES[:4]:
+					ring.write(message)
+				with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+					sock.bind(("127.0.0.1", 0))
+					sock.settimeout(0.05)
+					with self.assertRaises(socket.timeout):
+						ring.recv_into(sock)
+					sock.setblocking(False)
+					with self.assertRaises(BlockingIOError):
+						ring.recv_into(sock)
+				received = [bytes(view) for (_, view) in reader]
+				self.assertEqual(received, self.MESSAGES[:4])
+				self.assertEqual((reader.overruns, reader.lost, ring.head), (0, 0, 4))
+
+	def test_readers_keep_oldest_datagram_WHEN_fanout_idle(self) -> None:
+		"""Test that readers can still read the oldest datagram while the fan-out waits."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		with multicast.ring.RingFanout(
+			[self.TEST_MULTICAST_GROUP], _fixture_port_num,
+			bind_group=self.TEST_MULTICAST_GROUP, slots=4, slot_size=32,
+		) as fanout:
+			for message in self.MESSAGES[:4]:
+				fanout.ring.write(message)
+			fanout.socket.settimeout(1)
+			server = threading.Thread(target=fanout.step, daemon=True)
+			server.start()
+			try:
+				with multicast.ring.RingReader(fanout.ring.name, start=1) as reader:
+					received = [bytes(view) for (_, view) in reader]
+					lost = reader.lost
+			finally:
+				server.join(5)
+		self.assertEqual((received, lost), (self.MESSAGES[:4], 0))
+
+	def test_rejects_foreign_memory_WHEN_attaching(self) -> None:
+		"""Test that attaching a reader to shared memory without a ring fails."""
+		from multiprocessing import shared_memory
+		foreign = shared_memory.SharedMemory(create=True, size=64)
+		try:
+			with self.assertRaises(ValueError):
+				multicast.ring.RingReader(foreign.name)
+		finally:
+			foreign.close()
+			foreign.unlink()
+
+
+if __name__ == '__main__':
+	unittest.main()
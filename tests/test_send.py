@@ -0,0 +1,136 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module (Testing)
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test module for multicast.send functionality.
+
+This module provides test cases for the send module, focusing on the reuse of the
+long-lived socket of McastSender by McastSAY.
+"""
+
+
+__module__ = "tests"
+
+
+try:
+	try:
+		import context
+	except Exception as _cause:  # pragma: no branch
+		del _cause  # skipcq - cleanup any error vars early
+		from . import context
+	if not hasattr(context, '__name__') or not context.__name__:  # pragma: no branch
+		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
+	else:
+		from context import sys
+		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
+		from context import unittest
+		from unittest import mock
+		import io
+except ImportError as baton:
+	raise ImportError("[CWE-758] Failed to import test context") from baton
+
+
+@context.markWithMetaTag("mat", "say")
+class McastSenderTestSuite(context.BasicUsageTestSuite):
+	"""Test cases for the McastSender class and its use by McastSAY."""
+
+	__module__ = "tests.test_send"
+
+	__name__ = "tests.test_send.McastSenderTestSuite"
+
+	def setUp(self) -> None:
+		"""Set up test fixtures."""
+		super(McastSenderTestSuite, self).setUp()
+		self.original_stdin = sys.stdin
+
+	def tearDown(self) -> None:
+		"""Tear down test fixtures."""
+		sys.stdin = self.original_stdin
+		super(McastSenderTestSuite, self).tearDown()
+
+	def test_sender_opens_one_socket_WHEN_sending_many(self) -> None:
+		"""Test that McastSender creates exactly one socket for many sends."""
+		with mock.patch.object(
+			multicast, "genSocket", wraps=multicast.genSocket,
+		) as mock_gen:
+			with multicast.send.McastSender(port=self._the_test_port) as sender:
+				for _ in range(5):
+					self.assertEqual(sender.send(b"data"), 4)
+			self.assertEqual(mock_gen.call_count, 1)
+		self.assertFalse(sender.is_open)
+
+	def test_say_reuses_socket_WHEN_reading_stdin(self) -> None:
+		"""Test that McastSAY sends every stdin chunk through one socket, read one at a time."""
+		chunk_size = multicast._MCAST_DEFAULT_BUFFER_SIZE  # skipcq: PYL-W0212 - test code ok
+		sys.stdin = io.StringIO("x" * (chunk_size * 3))
+		with mock.patch.object(
+			multicast, "genSocket", wraps=multicast.genSocket,
+		) as mock_gen:
+			with mock.patch.object(
+				sys.stdin, "read", wraps=sys.stdin.read,
+			) as mock_read:
+				with mock.patch.object(
+					multicast.send.McastSender, "send_many", autospec=True, return_value=1,
+				) as mock_send:
+					(result, _) = multicast.send.McastSAY().doStep(
+						group="224.0.0.1", port=self._the_test_port, data=["-"],
+					)
+		self.assertTrue(result)
+		# text reads block until full, so streaming pipes must never wait for a whole batch
+		self.assertTrue(all(call.args == (chunk_size,) for call in mock_read.call_args_list))
+		self.assertEqual(
+			[[len(chunk) for chunk in call.args[1]] for call in mock_send.call_args_list],
+			[[chunk_size]] * 3,
+		)
+		self.assertEqual(mock_gen.call_count, 1)
+
+	def test_say_closes_sender_WHEN_done(self) -> None:
+		"""Test that McastSAY closes its sender after a single message."""
+		with mock.patch.object(
+			multicast.send.McastSender, "close", autospec=True,
+			side_effect=multicast.send.McastSender.close,
+		) as mock_close:
+			(result, _) = multicast.send.McastSAY().doStep(
+				group="224.0.0.1", port=self._the_test_port, data=["hello"],
+			)
+		self.assertTrue(result)
+		mock_close.assert_called()
+
+	def test_say_sends_raw_bytes_WHEN_binary(self) -> None:
+		"""Test that binary mode reads stdin as bytes and sends them without transcoding."""
+		payload = b"\xff\x00\xfe binary"
+
+		class _BinaryStdin(io.StringIO):
+			"""Text stdin stand-in exposing the payload on its binary buffer."""
+
+			buffer = io.BytesIO(payload)
+
+		sys.stdin = _BinaryStdin("not used")
+		with mock.patch.object(
+			multicast.send.McastSender, "send_many", autospec=True, return_value=1,
+		) as mock_send:
+			(result, _) = multicast.send.McastSAY().doStep(
+				group="224.0.0.1", port=self._the_test_port, data=["-"], binary=True,
+			)
+		self.assertTrue(result)
+		mock_send.assert_called_once()
+		self.assertEqual(mock_send.call_args[0][1], [payload])
+
+
+if __name__ == '__main__':
+	unittest.main()
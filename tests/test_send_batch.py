@@ -0,0 +1,149 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module (Testing)
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test module for benchmarking the kernel-batched sends of the multicast SAY path.
+
+This module contains a loopback benchmark that sends the same burst of datagrams once with the
+legacy one-socket-per-message `McastSAY._sayStep`, and once with `McastSender.send_many`, and
+compares the datagrams per second of each.
+"""
+
+__module__ = "tests"
+
+try:
+	try:
+		import context
+	except Exception as _cause:  # pragma: no branch
+		del _cause  # skipcq - cleanup any error vars early
+		from . import context
+	if not hasattr(context, '__name__') or not context.__name__:  # pragma: no branch
+		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
+	else:
+		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
+		from context import unittest
+		import logging
+		import socket
+		import time
+except Exception as baton:
+	raise ImportError("[CWE-758] Failed to import test context") from baton
+
+
+@context.markWithMetaTag("performance", "multi_sender")
+class McastSenderBatchTestSuite(context.BasicUsageTestSuite):
+	"""
+	Loopback benchmark for McastSender.send_many.
+
+	Sends the same burst with the legacy per-message sockets, and with kernel-batched sends, to a
+	joined receiver, and records the datagrams per second of each.
+	"""
+
+	__module__ = "tests.test_send_batch"
+
+	__name__ = "tests.test_send_batch.McastSenderBatchTestSuite"
+
+	TEST_MULTICAST_GROUP: str = "224.0.0.1"
+	"""Standard multicast group address for testing."""
+
+	BURST_COUNT: int = 1000
+	"""Number of datagrams sent per burst."""
+
+	PAYLOAD_SIZE: int = 64
+	"""Size of each datagram in bytes."""
+
+	RECEIVE_BUFFER_SIZE: int = 4194304
+	"""Requested receive buffer size in bytes (capped by the kernel's net.core.rmem_max)."""
+
+	def _receive_all(self, sock) -> int:
+		"""Count the datagrams already queued on the receiving socket."""
+		received = 0
+		while True:
+			batch = multicast.recv.drainstep(sock, self.BURST_COUNT)
+			if not batch:
+				return received
+			received += len(batch)
+
+	def _run_burst(self, batched: bool) -> tuple:
+		"""
+		Send a loopback burst to a joined receiver.
+
+		Args:
+			batched (bool): Use McastSender.send_many instead of one McastSAY._sayStep per message.
+
+		Returns:
+			tuple: The count of received datagrams and the sent datagrams per second.
+		"""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		receiver = multicast.recv.joinstep(
+			[self.TEST_MULTICAST_GROUP], _fixture_port_num, None, self.TEST_MULTICAST_GROUP,
+		)
+		# room for the whole burst, so loss reflects the sender rather than the receive buffer
+		receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RECEIVE_BUFFER_SIZE)
+		try:
+			payloads = [b"x" * self.PAYLOAD_SIZE] * self.BURST_COUNT
+			start = time.monotonic()
+			if batched:
+				with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, _fixture_port_num) as tx:
+					self.assertEqual(tx.send_many(payloads), self.BURST_COUNT)
+			else:
+				for payload in payloads:
+					multicast.send.McastSAY._sayStep(  # skipcq: PYL-W0212 - test code ok
+						self.TEST_MULTICAST_GROUP, _fixture_port_num, payload,
+					)
+			elapsed = time.monotonic() - start
+			time.sleep(0.1)
+			received = self._receive_all(receiver)
+		finally:
+			multicast.endSocket(receiver)
+		return (received, (self.BURST_COUNT / elapsed) if elapsed > 0 else 0)
+
+	def test_send_many_outpaces_per_message_sockets_WHEN_burst(self) -> None:
+		"""Test that send_many sends a burst at least as fast as per-message sockets."""
+		(legacy_count, legacy_rate) = self._run_burst(batched=False)
+		(batched_count, batched_rate) = self._run_burst(batched=True)
+		logging.getLogger(self.__module__).info(
+			"burst of %d: _sayStep received %d (%.0f/s), send_many received %d (%.0f/s)",
+			self.BURST_COUNT, legacy_count, legacy_rate, batched_count, batched_rate,
+		)
+		self.assertGreater(batched_count, 0, "Nothing sent by send_many was received.")
+		self.assertGreaterEqual(batched_rate, legacy_rate, "send_many was slower.")
+
+	def test_send_many_falls_back_WHEN_fast_paths_unavailable(self) -> None:
+		"""Test that send_many still delivers every datagram through the plain loop fallback."""
+		_fixture_port_num = self._always_generate_random_port_WHEN_called()
+		receiver = multicast.recv.joinstep(
+			[self.TEST_MULTICAST_GROUP], _fixture_port_num, None, self.TEST_MULTICAST_GROUP,
+		)
+		try:
+			with multicast.send.McastSender(self.TEST_MULTICAST_GROUP, _fixture_port_num) as tx:
+				tx._use_gso = False  # skipcq: PYL-W0212 - test code ok
+				tx._use_mmsg = False  # skipcq: PYL-W0212 - test code ok
+				self.assertEqual(tx.send_many([b"a", b"bb", b"ccc"]), 3)
+			time.sleep(0.1)
+			self.assertEqual(multicast.recv.drainstep(receiver), [b"a", b"bb", b"ccc"])
+		finally:
+			multicast.endSocket(receiver)
+
+	def tearDown(self) -> None:
+		"""Tear down test fixtures."""
+		super(McastSenderBatchTestSuite, self).tearDown()
+
+
+if __name__ == '__main__':
+	unittest.main()
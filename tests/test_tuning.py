@@ -0,0 +1,156 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Multicast Python Module (Testing)
+# ..................................
+# Copyright (c) 2017-2025, Mr. Walls
+# ..................................
+# Licensed under MIT (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# ..........................................
+# https://github.com/reactive-firewall-org/multicast/tree/HEAD/LICENSE.md
+# ..........................................
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test module for the socket tuning profiles.
+
+This module provides test cases checking that each MULTICAST_PROFILE, and each per-knob
+environment override, is applied to the sockets made by genSocket, as read back from the kernel.
+"""
+
+
+__module__ = "tests"
+
+
+try:
+	try:
+		import context
+	except Exception as _cause:  # pragma: no branch
+		del _cause  # skipcq - cleanup any error vars early
+		from . import context
+	if not hasattr(context, '__name__') or not context.__name__:  # pragma: no branch
+		raise ModuleNotFoundError("[CWE-758] Failed to import context") from None
+	else:
+		from context import os
+		from context import multicast  # pylint: disable=cyclic-import - skipcq: PYL-R0401
+		from context import unittest
+		from unittest import mock
+		import socket
+except ImportError as baton:
+	raise ImportError("[CWE-758] Failed to import test context") from baton
+
+
+@context.markWithMetaTag("mat", "bootstrap")
+class SocketTuningTestSuite(context.BasicUsageTestSuite):
+	"""Test cases for applying the socket tuning from the environment to new sockets."""
+
+	__module__ = "tests.test_tuning"
+
+	__name__ = "tests.test_tuning.SocketTuningTestSuite"
+
+	OVERRIDES = {
+		"rcvbuf": 262144,
+		"sndbuf": 262144,
+		"busy_poll": 25,
+		"tos": 32,
+		"priority": 3,
+		"loop": 0,
+	}
+	"""A valid value, different from every profile's value, for each tuning knob."""
+
+	_BUFFER_CAPS = {
+		"rcvbuf": "/proc/sys/net/core/rmem_max",
+		"sndbuf": "/proc/sys/net/core/wmem_max",
+	}
+	"""The sysctl capping each socket buffer knob, where the kernel has one."""
+
+	def _environ(self, **variables) -> dict:
+		"""Get a copy of the environment without any tuning variable, plus the given ones."""
+		knobs = multicast.env._MCAST_TUNING_KNOBS  # skipcq: PYL-W0212 - test code ok
+		tuning_variables = {"MULTICAST_PROFILE"}.union(
+			variable for (variable, _, _) in knobs.values()
+		)
+		environ = {
+			key: value for (key, value) in os.environ.items() if key not in tuning_variables
+		}
+		environ.update(variables)
+		return environ
+
+	def _tuned_socket(self, **variables) -> tuple:
+		"""
+		Load the tuning from an environment with the given variables, and apply it with genSocket.
+
+		Returns:
+			tuple: The loaded tuning, and the new (tuned) socket.
+		"""
+		with mock.patch.dict(os.environ, self._environ(**variables), clear=True):
+			tuning = multicast.env.load_tuning()
+		with mock.patch.object(multicast.skt, "_MCAST_DEFAULT_TUNING", tuning):
+			sock = multicast.genSocket()
+		self.addCleanup(multicast.endSocket, sock)
+		return (tuning, sock)
+
+	@staticmethod
+	def _read_back(sock: socket.socket, knob: str) -> int:
+		"""Read the current value of a tuning knob back from the kernel."""
+		(level, option) = multicast.skt._TUNING_OPTIONS[knob]  # skipcq: PYL-W0212 - test code ok
+		return sock.getsockopt(level, option)
+
+	def _assertApplied(self, sock: socket.socket, knob: str, value: int) -> None:
+		"""Assert a tuning knob reads back as set, or skip it where this system refuses it."""
+		with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+			if not multicast.skt.tuneSocket(probe, {knob: value}):
+				self.skipTest(f"Socket option {knob}={value} is not supported here.")
+		actual = self._read_back(sock, knob)
+		if knob in self._BUFFER_CAPS:
+			# the kernel caps buffer sizes at a sysctl limit, and doubles them for bookkeeping
+			cap = value
+			try:
+				with open(self._BUFFER_CAPS[knob], encoding="utf-8") as limit:
+					cap = int(limit.read())
+			except OSError:  # pragma: no cover -- not Linux
+				pass
+			self.assertGreaterEqual(actual, min(value, cap))
+		else:
+			self.assertEqual(actual, value)
+
+	def test_genSocket_applies_profile_WHEN_profile_selected(self) -> None:
+		"""Test that every knob of every named profile reads back from a new socket."""
+		for (profile, knobs) in multicast.env._MCAST_TUNING_PROFILES.items():  # skipcq: PYL-W0212
+			(tuning, sock) = self._tuned_socket(MULTICAST_PROFILE=profile)
+			self.assertEqual(tuning, knobs)
+			for (knob, value) in knobs.items():
+				with self.subTest(profile=profile, knob=knob):
+					self._assertApplied(sock, knob, value)
+
+	def test_genSocket_keeps_kernel_defaults_WHEN_default_profile(self) -> None:
+		"""Test that the default profile leaves every knob at the kernel's default."""
+		(tuning, sock) = self._tuned_socket(MULTICAST_PROFILE="default")
+		self.assertEqual(tuning, {})
+		with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as plain:
+			for knob in self.OVERRIDES:
+				if multicast.skt._TUNING_OPTIONS[knob][1] is None:  # skipcq: PYL-W0212
+					continue
+				with self.subTest(knob=knob):
+					self.assertEqual(self._read_back(sock, knob), self._read_back(plain, knob))
+
+	def test_genSocket_applies_override_WHEN_variable_set(self) -> None:
+		"""Test that each per-knob variable overrides the profile on a new socket."""
+		for (knob, value) in self.OVERRIDES.items():
+			(variable, _, _) = multicast.env._MCAST_TUNING_KNOBS[knob]  # skipcq: PYL-W0212
+			for profile in multicast.env._MCAST_TUNING_PROFILES:  # skipcq: PYL-W0212
+				(tuning, sock) = self._tuned_socket(
+					MULTICAST_PROFILE=profile, **{variable: str(value)},
+				)
+				self.assertEqual(tuning[knob], value)
+				with self.subTest(knob=knob, profile=profile):
+					self._assertApplied(sock, knob, value)
+
+
+if __name__ == '__main__':
+	unittest.main()